@@ -0,0 +1,241 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import argparse
+import hashlib
+import json
+import platform
+import threading
+import time
+
+import numpy as np
+
+import lee_ventus_disc_pump
+from lee_ventus_disc_pump import *
+from lee_ventus_simulator import *
+
+
+def latency_statistics(latencies: list[float]) -> dict:
+    """
+    Summarises a list of latencies in seconds as milliseconds statistics.
+    """
+    if len(latencies) == 0:
+        return {"count": 0}
+    latencies_ms = np.array(latencies) * 1000
+    return {"count": len(latencies),
+            "mean_ms": float(np.mean(latencies_ms)),
+            "p50_ms": float(np.percentile(latencies_ms, 50)),
+            "p99_ms": float(np.percentile(latencies_ms, 99)),
+            "max_ms": float(np.max(latencies_ms))}
+
+
+def time_calls(function, number_calls: int) -> list[float]:
+    """
+    Calls a function a number of times and returns the duration of each call in seconds.
+    """
+    latencies = []
+    for _ in range(number_calls):
+        start_time = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+
+def benchmark_registers(disc_pump_instance: LVDiscPump, number_calls: int) -> dict:
+    """
+    Measures the register read and write latencies and the sustained register write rates.
+    """
+    results = {}
+    results["read_register"] = latency_statistics(
+        time_calls(lambda: disc_pump_instance.read_register(LVRegister.MEAS_DIGITAL_PRESSURE), number_calls))
+    results["read_registers_x2"] = latency_statistics(
+        time_calls(lambda: disc_pump_instance.read_registers([LVRegister.MEAS_DRIVE_MILLIWATTS,
+                                                              LVRegister.MEAS_DIGITAL_PRESSURE]), number_calls))
+    results["write_reg_no_sleep"] = latency_statistics(
+        time_calls(lambda: disc_pump_instance.write_reg(LVRegister.SET_VAL, 0, sleep_after=0), number_calls))
+
+    # sustained write rates in register writes per second
+    write_rates = {}
+    start_time = time.perf_counter()
+    for _ in range(number_calls):
+        disc_pump_instance.write_reg(LVRegister.SET_VAL, 0)
+    write_rates["write_reg_default_sleep"] = number_calls / (time.perf_counter() - start_time)
+
+    start_time = time.perf_counter()
+    for _ in range(number_calls):
+        disc_pump_instance.write_reg(LVRegister.SET_VAL, 0, sleep_after=0)
+    write_rates["write_reg_no_sleep"] = number_calls / (time.perf_counter() - start_time)
+
+    reg_values = {LVRegister.SET_VAL: 0,
+                  LVRegister.PID_PROPORTIONAL_COEFF: 5,
+                  LVRegister.PID_INTEGRAL_COEFF: 10,
+                  LVRegister.PID_DIFFERENTIAL_COEFF: 0}
+    start_time = time.perf_counter()
+    for _ in range(number_calls // len(reg_values)):
+        disc_pump_instance.write_regs(reg_values, sleep_after=0)
+    write_rates["write_regs"] = \
+        number_calls // len(reg_values) * len(reg_values) / (time.perf_counter() - start_time)
+    results["write_rate_per_s"] = write_rates
+    return results
+
+
+def benchmark_streaming(disc_pump_instance: LVDiscPump, duration: float, number_calls: int,
+                        expected_stream_rate=None) -> dict:
+    """
+    Measures the streaming mode output latency and the sustained stream rate.
+    """
+    results = {}
+    disc_pump_instance.streaming_mode_enable()
+    results["streaming_mode_get_output"] = latency_statistics(
+        time_calls(disc_pump_instance.streaming_mode_get_output, number_calls))
+
+    # sustained rate, reading everything that arrives in bulk
+    disc_pump_instance.streaming_mode_get_outputs(timeout=0.1)
+    number_frames = 0
+    start_time = time.perf_counter()
+    while time.perf_counter() - start_time < duration:
+        number_frames += len(disc_pump_instance.streaming_mode_get_outputs(timeout=0.1))
+    elapsed = time.perf_counter() - start_time
+    disc_pump_instance.streaming_mode_disable()
+
+    results["frames"] = number_frames
+    results["frames_per_s"] = number_frames / elapsed
+    if expected_stream_rate is not None:
+        results["dropped_frames"] = max(0, round(expected_stream_rate * elapsed) - number_frames)
+    if disc_pump_instance._is_uart:
+        results["discarded_lines"] = disc_pump_instance._uart_stream_parser.discarded_lines
+    return results
+
+
+def benchmark_shared_i2c_bus(i2c_addresses: list[int], duration: float) -> list[dict]:
+    """
+    Measures how the register read rate scales when several pumps share the same MCP2221 interface.
+    Each pump is read from its own thread, so the reads contend for the bus as they would in an application.
+    """
+    results = []
+    for number_pumps in range(1, len(i2c_addresses) + 1):
+        pumps = []
+        for i2c_address in i2c_addresses[:number_pumps]:
+            pumps.append(LVDiscPump())
+            pumps[-1].connect_pump(i2c_address=i2c_address)
+        pumps[0].i2c_bus.reset_statistics()
+
+        latencies = [[] for _ in pumps]
+        start_barrier = threading.Barrier(number_pumps + 1)
+
+        def read_pump(disc_pump_instance: LVDiscPump, pump_latencies: list[float]):
+            start_barrier.wait()
+            while time.perf_counter() - start_time < duration:
+                call_time = time.perf_counter()
+                disc_pump_instance.read_register(LVRegister.MEAS_DIGITAL_PRESSURE)
+                pump_latencies.append(time.perf_counter() - call_time)
+
+        threads = [threading.Thread(target=read_pump, args=(disc_pump_instance, pump_latencies))
+                   for disc_pump_instance, pump_latencies in zip(pumps, latencies)]
+        for thread in threads:
+            thread.start()
+        start_time = time.perf_counter()
+        start_barrier.wait()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+
+        number_reads = sum(len(pump_latencies) for pump_latencies in latencies)
+        results.append({"pumps": number_pumps,
+                        "total_reads_per_s": number_reads / elapsed,
+                        "reads_per_s_per_pump": number_reads / elapsed / number_pumps,
+                        "bus_utilization": pumps[0].i2c_bus.statistics()["utilization"],
+                        "per_pump_latency": [latency_statistics(pump_latencies) for pump_latencies in latencies]})
+        for disc_pump_instance in pumps:
+            disc_pump_instance.disconnect_pump()
+    return results
+
+
+def benchmark_pump(connect_arguments: dict, number_calls: int, duration: float, expected_stream_rate=None) -> dict:
+    """
+    Runs the register and streaming benchmarks on one pump.
+    """
+    disc_pump_instance = LVDiscPump()
+    disc_pump_instance.connect_pump(**connect_arguments)
+    disc_pump_instance.streaming_mode_disable()
+    disc_pump_instance.write_reg(LVRegister.PUMP_ENABLE, 0)
+    results = benchmark_registers(disc_pump_instance, number_calls)
+    results["streaming"] = benchmark_streaming(disc_pump_instance, duration, number_calls, expected_stream_rate)
+    disc_pump_instance.disconnect_pump()
+    return results
+
+
+if __name__ == '__main__':
+    """"
+    Measures the latency and throughput of the LVDiscPump I/O paths over UART and I2C and saves the results as JSON,
+    so they can be compared between versions of lee_ventus_disc_pump.py.
+    By default the benchmark runs against simulated pumps. To benchmark real hardware pass the COM port and/or the
+    I2C addresses, e.g. "python benchmark_driver_io.py --com-port COM6 --i2c-address 40 41".
+    The pumps are turned off during the benchmark.
+    """
+
+    parser = argparse.ArgumentParser(description="LVDiscPump I/O benchmark")
+    parser.add_argument("--com-port", default="", help="COM port of a UART pump, e.g. COM6")
+    parser.add_argument("--i2c-address", type=int, nargs="*", default=[], help="I2C addresses of SPMs, e.g. 40 41")
+    parser.add_argument("--calls", type=int, default=200, help="number of calls for each latency measurement")
+    parser.add_argument("--duration", type=float, default=2, help="duration in seconds of each rate measurement")
+    parser.add_argument("--stream-rate", type=float, default=None,
+                        help="nominal stream rate of the driver in outputs per second, used to count dropped outputs")
+    parser.add_argument("--output", default="benchmark_results.json", help="JSON file the results are saved to")
+    arguments = parser.parse_args()
+
+    simulated = arguments.com_port == "" and len(arguments.i2c_address) == 0
+    if simulated:
+        # simulated GP driver over UART and three SPMs on the I2C bus
+        uart_model = LVSimulator_add_uart_pump("SIM1")
+        for simulated_address in (37, 40, 41):
+            LVSimulator_add_i2c_pump(simulated_address)
+        LVSimulator_install()
+        arguments.com_port = "SIM1"
+        arguments.i2c_address = [37, 40, 41]
+        arguments.stream_rate = 1 / uart_model.stream_period
+
+    # identifies the version of the driver that was benchmarked
+    with open(lee_ventus_disc_pump.__file__, "rb") as driver_file:
+        driver_hash = hashlib.sha256(driver_file.read()).hexdigest()
+
+    benchmark_results = {"metadata": {"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                                      "python": platform.python_version(),
+                                      "platform": platform.platform(),
+                                      "driver_sha256": driver_hash,
+                                      "simulated": simulated}}
+
+    if arguments.com_port != "":
+        print(f"Benchmarking UART pump on {arguments.com_port}")
+        benchmark_results["uart"] = benchmark_pump({"com_port": arguments.com_port}, arguments.calls,
+                                                   arguments.duration, arguments.stream_rate)
+
+    if len(arguments.i2c_address) != 0:
+        print(f"Benchmarking I2C pump at address {arguments.i2c_address[0]}")
+        benchmark_results["i2c"] = benchmark_pump({"i2c_address": arguments.i2c_address[0]}, arguments.calls,
+                                                  arguments.duration)
+        print(f"Benchmarking shared I2C bus with up to {len(arguments.i2c_address)} pumps")
+        benchmark_results["i2c"]["shared_bus_scaling"] = benchmark_shared_i2c_bus(arguments.i2c_address,
+                                                                                   arguments.duration)
+
+    with open(arguments.output, "w") as output_file:
+        json.dump(benchmark_results, output_file, indent=2)
+    print(json.dumps(benchmark_results, indent=2))
+    print(f"Results saved to {arguments.output}")
@@ -70,8 +70,9 @@ if __name__ == '__main__':
         pump_to_be_reset.write_reg(LVRegister.SET_VAL, dummyValue)
         actualDummyValue = pump_to_be_reset.read_register(LVRegister.SET_VAL)
 
-        # Restore Default board Settings
-        pump_to_be_reset.restore_default_settings()
+        # Restore Default board Settings, only writing the registers that are not already at their default value
+        changed_registers = pump_to_be_reset.restore_default_settings(only_changed=True)
+        print(f"{len(changed_registers)} registers were changed back to their default value.")
 
         # Check settings were restored
         returnedDummyValue = pump_to_be_reset.read_register(LVRegister.SET_VAL)
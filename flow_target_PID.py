@@ -60,8 +60,10 @@ if __name__ == '__main__':
     current_time = start_time
     while current_time - start_time < 30:
         # read the drive power and flow of the pump and print them every 0.5s
-        drive_power = myPump.read_register(LVRegister.MEAS_DRIVE_MILLIWATTS)
-        flow = myPump.read_register(LVRegister.MEAS_FLOW)
+        # both registers are requested together so they cost a single round trip
+        measurements = myPump.read_registers([LVRegister.MEAS_DRIVE_MILLIWATTS, LVRegister.MEAS_FLOW])
+        drive_power = measurements[LVRegister.MEAS_DRIVE_MILLIWATTS]
+        flow = measurements[LVRegister.MEAS_FLOW]
         current_time = float(time.time())
         print(f'Time [s] {current_time - start_time:.1f}, Drive power [mW] {drive_power:.1f}, Flow [ml/min] {flow:.1f}')
         time.sleep(0.5)
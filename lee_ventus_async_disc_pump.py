@@ -0,0 +1,434 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import time
+from typing import List
+
+from lee_ventus_disc_pump import *
+
+
+# ***********************************************************************************
+# * AsyncLVDiscPump class
+# ***********************************************************************************
+
+
+class AsyncLVDiscPump:
+    """
+        asyncio client for a pump with the same functions as LVDiscPump, for driving many pumps from one event loop.
+        Over UART the receive side is owned by a LVUartReader thread which hands the register replies and streaming
+        outputs to the event loop, so reads are awaited without blocking it. Over I2C the blocking MCP2221 calls run on
+        one worker thread per MCP2221 interface, shared by all the pumps on that bus, so pumps on different interfaces
+        are driven in parallel.
+
+        Example:
+            pump = AsyncLVDiscPump()
+            await pump.connect_pump(com_port="COM6")
+            await pump.streaming_mode_enable()
+            async for output in pump.stream():
+                ...
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    async def connect_pump(self, com_port='', i2c_address=-1, i2c_adapter=0):
+        """
+            Connects a pump via I2C or UART. Either a COM port or an I2C address needs to be defined.
+
+            Args:
+                com_port (str, optional): The COM port of the pump (UART only).
+                i2c_address (int, optional): The I2C address of the pump (I2C only).
+                i2c_adapter (int or str, optional): The index or USB serial number of the MCP2221 interface the pump
+                    is connected to (I2C only).
+            Returns:
+                None
+        """
+        self._loop = asyncio.get_running_loop()
+        if com_port != '' and i2c_address == -1:
+            await self._loop.run_in_executor(None, functools.partial(self._pump.connect_pump, com_port=com_port,
+                                                                     background_reader=True))
+            self._pump._uart_reader.reply_listener = self._on_reply
+            self._pump._uart_reader.stream_listener = self._on_stream_output
+        elif com_port == '' and i2c_address != -1:
+            await self._loop.run_in_executor(None, functools.partial(self._pump.connect_pump, i2c_address=i2c_address,
+                                                                     i2c_adapter=i2c_adapter))
+            if self._pump._i2c_adapter not in AsyncLVDiscPump._i2c_executors:
+                AsyncLVDiscPump._i2c_executors[self._pump._i2c_adapter] = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="LVDiscPumpI2C")
+            self._i2c_executor = AsyncLVDiscPump._i2c_executors[self._pump._i2c_adapter]
+        else:
+            raise Exception('Invalid configuration for connecting a pump.')
+
+    async def write_reg(self, reg_id: int, value, rounding_decimal_places=3, sleep_after=0.005):
+        """
+            Writes a value to a given register, see LVDiscPump.write_reg. The write runs on a worker thread and the
+            pause after it does not block the event loop.
+
+            Args:
+                reg_id (int): The register ID to write to.
+                value (int or float): The value to write to the register.
+                rounding_decimal_places (int, optional): The number of decimal places to round to.
+                sleep_after (float, optional): The time to wait after writing the register.
+            Returns:
+                None
+        """
+        await self._run(self._pump.write_reg, reg_id, value, rounding_decimal_places, 0)
+        if sleep_after != 0:
+            await asyncio.sleep(sleep_after)
+
+    async def write_regs(self, reg_values: dict, rounding_decimal_places=3, write_rate=1000, sleep_after=0.005):
+        """
+            Writes a group of registers, see LVDiscPump.write_regs.
+
+            Args:
+                reg_values (dict): The values to write keyed by register ID, written in the order given.
+                rounding_decimal_places (int, optional): The number of decimal places to round to.
+                write_rate (float, optional): The maximum number of register writes per second.
+                sleep_after (float, optional): The time to wait after writing the last register.
+            Returns:
+                None
+        """
+        await self._run(self._pump.write_regs, reg_values, rounding_decimal_places, write_rate, 0)
+        if sleep_after != 0:
+            await asyncio.sleep(sleep_after)
+
+    async def read_register(self, reg_id: int, timeout=1) -> float:
+        """
+            Reads the value of a given register.
+
+            Args:
+                reg_id (int): The register ID to read from.
+                timeout (float, optional): The time to wait for a response from the pump.
+            Returns:
+                float: The value of the register.
+        """
+        if not self._pump._is_uart:
+            return await self._run(self._pump.read_register, reg_id, timeout)
+        return (await self._read_registers_uart([int(reg_id)], timeout))[int(reg_id)]
+
+    async def read_registers(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        """
+            Reads a group of registers. Over UART all the requests are sent in a single write.
+
+            Args:
+                reg_ids (list[int]): The register IDs to read.
+                timeout (float, optional): The time to wait for all the responses from the pump.
+            Returns:
+                dict[int, float]: The value of each register keyed by register ID, in the order given.
+        """
+        if not self._pump._is_uart:
+            return await self._run(self._pump.read_registers, reg_ids, timeout)
+        return await self._read_registers_uart(list(dict.fromkeys(int(reg_id) for reg_id in reg_ids)), timeout)
+
+    async def disconnect_pump(self):
+        """
+            Disconnects the pump. Reads still waiting for a reply fail.
+
+            Args:
+
+            Returns:
+                None
+        """
+        with self._lock:
+            reply_futures, self._reply_futures = self._reply_futures, {}
+        for futures in reply_futures.values():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(LVTimeoutError("Didn't get expected response from driver"))
+        if self._pump._is_uart:
+            await self._loop.run_in_executor(None, self._pump.disconnect_pump)
+        elif self._pump._is_uart is not None:
+            await self._run(self._pump.disconnect_pump)
+
+    async def streaming_mode_disable(self):
+        """
+            Disables streaming mode.
+
+            Args:
+
+            Returns:
+                None
+        """
+        await self.write_reg(LVRegister.STREAM_MODE, LVStreamingModes.DISABLED)
+
+    async def streaming_mode_enable(self):
+        """
+            Enables streaming mode. Streaming outputs received before this call are discarded.
+
+            Args:
+
+            Returns:
+                None
+        """
+        while not self._stream_queue.empty():
+            self._stream_queue.get_nowait()
+        if self._pump._is_uart:
+            await self.write_reg(LVRegister.STREAM_MODE, LVStreamingModes.STREAMING_UART)
+        else:
+            await self.write_reg(LVRegister.STREAM_MODE, LVStreamingModes.STREAMING_I2C)
+
+    async def streaming_mode_get_output(self, timeout=1) -> list[float]:
+        """
+            Waits for the next streaming mode output.
+
+            Args:
+                timeout (float, optional): The time to wait for an output.
+            Returns:
+                list[float]: The streaming output, see LVStreamingModeOutputIndexes, or None on timeout.
+        """
+        if not self._pump._is_uart:
+            return await self._run(self._pump.streaming_mode_get_output, timeout)
+        try:
+            return await asyncio.wait_for(self._stream_queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def stream(self, timeout=1, i2c_period=0.01):
+        """
+            Async iterator over the streaming mode outputs. Ends when no output arrives within the timeout.
+
+            Args:
+                timeout (float, optional): The time to wait for each output.
+                i2c_period (float, optional): The time between two reads of an I2C pump (UART pumps push their
+                    outputs at the driver's stream rate).
+            Returns:
+                list[float]: The streaming outputs, see LVStreamingModeOutputIndexes.
+        """
+        next_read_time = self._loop.time()
+        while True:
+            output = await self.streaming_mode_get_output(timeout=timeout)
+            if output is None:
+                return
+            yield output
+            if not self._pump._is_uart:
+                next_read_time = max(next_read_time + i2c_period, self._loop.time())
+                await asyncio.sleep(next_read_time - self._loop.time())
+
+    async def set_manual_power_control_with_set_val(self):
+        """
+            Sets the pump to manual power control, see LVDiscPump.set_manual_power_control_with_set_val.
+
+            Args:
+
+            Returns:
+                None
+        """
+        await self._run(self._pump.set_manual_power_control_with_set_val)
+
+    async def set_pid_digital_pressure_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
+        """
+            Sets the pump to PID control on the digital pressure sensor, see
+            LVDiscPump.set_pid_digital_pressure_control_with_set_val.
+
+            Args:
+                p_term (float, optional): The proportional term.
+                i_term (float, optional): The integral term.
+                d_term (float, optional): The differential term.
+            Returns:
+                None
+        """
+        await self._run(self._pump.set_pid_digital_pressure_control_with_set_val, p_term, i_term, d_term)
+
+    async def set_pid_analog_pressure_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
+        """
+            Sets the pump to PID control on the analog pressure sensor, see
+            LVDiscPump.set_pid_analog_pressure_control_with_set_val.
+
+            Args:
+                p_term (float, optional): The proportional term.
+                i_term (float, optional): The integral term.
+                d_term (float, optional): The differential term.
+            Returns:
+                None
+        """
+        await self._run(self._pump.set_pid_analog_pressure_control_with_set_val, p_term, i_term, d_term)
+
+    async def set_pid_flow_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
+        """
+            Sets the pump to PID control on the flow sensor, see LVDiscPump.set_pid_flow_control_with_set_val.
+
+            Args:
+                p_term (float, optional): The proportional term.
+                i_term (float, optional): The integral term.
+                d_term (float, optional): The differential term.
+            Returns:
+                None
+        """
+        await self._run(self._pump.set_pid_flow_control_with_set_val, p_term, i_term, d_term)
+
+    async def configure_spm_i2c_only_mode(self, i2c_address=37):
+        """
+            Configures the SPM for I2C only mode, see LVDiscPump.configure_spm_i2c_only_mode.
+
+            Args:
+                i2c_address (int, optional): The I2C address of the SPM.
+            Returns:
+                None
+        """
+        await self._run(self._pump.configure_spm_i2c_only_mode, i2c_address)
+
+    async def store_current_settings_to_board(self, verbose=True):
+        """
+            Stores the current settings to the board's non-volatile memory.
+
+            Args:
+                verbose (bool, optional): Prints a message when the settings are stored.
+            Returns:
+                None
+        """
+        await self._run(self._pump.store_current_settings_to_board, verbose)
+
+    async def restore_default_settings(self, only_changed=False) -> dict:
+        """
+            Restores the default settings, see LVDiscPump.restore_default_settings.
+
+            Args:
+                only_changed (bool, optional): Only writes the registers that differ from the defaults.
+            Returns:
+                dict: The registers written, see LVDiscPump.restore_default_settings.
+        """
+        return await self._run(self._pump.restore_default_settings, only_changed)
+
+    async def set_status_led_colour(self, red: int, green: int, blue: int):
+        """
+            Sets the colour of the status LED, see LVDiscPump.set_status_led_colour.
+
+            Args:
+                red (int): The red value (0-31).
+                green (int): The green value (0-31).
+                blue (int): The blue value (0-31).
+            Returns:
+                None
+        """
+        await self._run(self._pump.set_status_led_colour, red, green, blue)
+
+    @property
+    def dropped_stream_outputs(self) -> int:
+        """
+            The number of streaming outputs dropped because they were not read fast enough.
+        """
+        return self._dropped_stream_outputs
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, stream_queue_size=10000):
+        self._pump = LVDiscPump()
+        self._loop = None
+        self._i2c_executor = None
+        self._lock = threading.Lock()
+        self._reply_futures = {}   # futures waiting for a register reply, keyed by register ID
+        self._stream_queue = asyncio.Queue(maxsize=stream_queue_size)
+        self._dropped_stream_outputs = 0
+
+    # -----------------------------------------------------------------------------
+    # Internal variables
+    # -----------------------------------------------------------------------------
+
+    # the blocking calls of the I2C pumps run on one thread per MCP2221 interface, keyed by the interface index
+    _i2c_executors = {}
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    async def _run(self, function, *args, **kwargs):
+        # UART pumps use the default executor, the blocking calls of I2C pumps run on the thread of their bus
+        return await self._loop.run_in_executor(self._i2c_executor, functools.partial(function, *args, **kwargs))
+
+    async def _read_registers_uart(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        futures = [self._loop.create_future() for _ in reg_ids]
+        with self._lock:
+            for reg_id, future in zip(reg_ids, futures):
+                self._reply_futures.setdefault(reg_id, []).append(future)
+        start_time = time.perf_counter()
+        exception = None
+        try:
+            # the request is sent from a worker thread, the port may have to be opened and is shared with other users
+            await self._loop.run_in_executor(None, self._send_uart,
+                                             ''.join(f'#R{reg_id}\n' for reg_id in reg_ids).encode('ascii'))
+            values = await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        except asyncio.TimeoutError:
+            exception = LVTimeoutError("Didn't get expected response from driver")
+            raise exception
+        except Exception as e:
+            exception = e
+            raise
+        finally:
+            if self._pump._instrumentation is not None:
+                self._pump._instrumentation.record("read_registers" if len(reg_ids) > 1 else "read_register",
+                                                   reg_ids if len(reg_ids) > 1 else reg_ids[0],
+                                                   time.perf_counter() - start_time, exception)
+            with self._lock:
+                for reg_id, future in zip(reg_ids, futures):
+                    waiting = self._reply_futures.get(reg_id)
+                    if waiting is not None and future in waiting:
+                        waiting.remove(future)
+                        if len(waiting) == 0:
+                            del self._reply_futures[reg_id]
+        if self._pump._register_cache is not None:
+            for reg_id, value in zip(reg_ids, values):
+                self._pump._register_cache_update(reg_id, value)
+        return dict(zip(reg_ids, values))
+
+    def _send_uart(self, data: bytes):
+        with self._pump._com_port.lock:
+            self._pump._count_bytes(sent=self._pump._com_port.write(data))
+
+    def _on_reply(self, reg_id: int, value: float) -> bool:
+        # called from the reader thread, replies nobody awaits are left to the reader for LVDiscPump reads
+        with self._lock:
+            futures = self._reply_futures.pop(reg_id, None)
+        if futures is None:
+            return False
+        return self._call_soon(self._resolve_futures, futures, value)
+
+    def _on_stream_output(self, output: list[float]) -> bool:
+        # called from the reader thread
+        return self._call_soon(self._put_stream_output, output)
+
+    def _call_soon(self, callback, *args) -> bool:
+        # the event loop may be closed while the reader thread is still running, the line is then left to the reader
+        if self._loop.is_closed():
+            return False
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            return False
+        return True
+
+    @staticmethod
+    def _resolve_futures(futures: list, value: float):
+        for future in futures:
+            if not future.done():
+                future.set_result(value)
+
+    def _put_stream_output(self, output: list[float]):
+        if self._stream_queue.full():
+            # keep the latest outputs
+            self._stream_queue.get_nowait()
+            self._dropped_stream_outputs += 1
+        self._stream_queue.put_nowait(output)
@@ -0,0 +1,231 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import time
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+from lee_ventus_streaming_capture import *
+from lee_ventus_system_id import *
+
+
+# -----------------------------------------------------------------------------
+# Model fitting and tuning functions
+# -----------------------------------------------------------------------------
+
+
+def LVAutotune_fit_fopdt(times, inputs, outputs, max_dead_time=1.0) -> dict:
+    """
+        Fits a first-order-plus-dead-time model (gain, time constant, dead time) to a recorded response, e.g. the
+        pressure response to a step of drive power. See LVSystemId_fit_fopdt.
+
+        Args:
+            times (np.ndarray): The time of each sample in seconds.
+            inputs (np.ndarray): The input at each sample, e.g. the drive power in mW.
+            outputs (np.ndarray): The output at each sample, e.g. the pressure in mBar.
+            max_dead_time (float, optional): The longest dead time tried in seconds.
+        Returns:
+            dict: "gain" (output per input), "time_constant" and "dead_time" in seconds, "offset" (output with no
+                input), "rms_error" of the one step ahead prediction and "sample_time" in seconds.
+    """
+    return LVSystemId_fit_fopdt(times, inputs, outputs, max_dead_time)
+
+
+def LVAutotune_pid_gains(model: dict, closed_loop_time_constant=None) -> tuple[float, float, float]:
+    """
+        Computes PI gains for a first-order-plus-dead-time model with the SIMC tuning rules, for the PID of the
+        firmware (power = P * error + I * integral of the error + D * derivative of the error).
+
+        Args:
+            model (dict): The model, see LVAutotune_fit_fopdt.
+            closed_loop_time_constant (float, optional): The desired closed loop time constant in seconds. Smaller
+                is faster but less robust. Defaults to the dead time, or half the time constant if larger.
+        Returns:
+            tuple[float, float, float]: The proportional, integral and differential terms.
+    """
+    gain, time_constant, dead_time = model["gain"], model["time_constant"], model["dead_time"]
+    if closed_loop_time_constant is None:
+        closed_loop_time_constant = max(dead_time, time_constant / 2)
+    p_term = time_constant / (gain * (closed_loop_time_constant + dead_time))
+    integral_time = min(time_constant, 4 * (closed_loop_time_constant + dead_time))
+    return float(p_term), float(p_term / integral_time), 0.0
+
+
+def LVAutotune_step_response_metrics(times, response, setpoint: float, settling_band=0.05) -> dict:
+    """
+        Measures the overshoot and the settling time of a response to a set point step.
+
+        Args:
+            times (np.ndarray): The time of each sample in seconds, starting at the step.
+            response (np.ndarray): The measured value at each sample.
+            setpoint (float): The new set point.
+            settling_band (float, optional): The band around the set point the response has to stay in to be
+                settled, as a fraction of the step size.
+        Returns:
+            dict: "overshoot_percent" of the step size and "settling_time_s" since the first sample, or None if the
+                response did not settle.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    response = np.asarray(response, dtype=np.float64)
+    step = setpoint - response[0]
+    if step == 0:
+        return {"overshoot_percent": 0.0, "settling_time_s": 0.0}
+    overshoot = max(0.0, float(np.max((response - setpoint) / step)) * 100)
+    outside = np.nonzero(np.abs(response - setpoint) > settling_band * abs(step))[0]
+    if len(outside) == 0:
+        settling_time = 0.0
+    elif outside[-1] == len(response) - 1:
+        settling_time = None
+    else:
+        settling_time = float(times[outside[-1] + 1] - times[0])
+    return {"overshoot_percent": overshoot, "settling_time_s": settling_time}
+
+
+# -----------------------------------------------------------------------------
+# Autotune functions
+# -----------------------------------------------------------------------------
+
+
+def LVAutotune_run(disc_pump_instance: LVDiscPump, measurement_source=LVControlSource.DIGITAL_PRESSURE,
+                   low_power=0, high_power=500, experiment="step", relay_setpoint=None, settle_time=2,
+                   test_time=3, verify_setpoint=None, verify_time=3, closed_loop_time_constant=None) -> dict:
+    """
+        Tunes the PID of a pump. A step or relay experiment is run in manual power control while the streaming
+        output is captured, a first-order-plus-dead-time model from drive power to the measurement is fitted, PI
+        gains are computed and written to the PID_*_COEFF registers with the matching set_pid_*_control_with_set_val
+        function. A set point step is then run in PID control to measure the overshoot and settling time.
+        The pump is turned off at the end, with the new gains configured. For UART pumps connect with
+        background_reader=True so no streaming outputs are lost during the capture.
+
+        Args:
+            disc_pump_instance (LVDiscPump): The connected pump.
+            measurement_source (LVControlSource, optional): DIGITAL_PRESSURE, ANA_B (analog pressure) or FLOW.
+            low_power (float, optional): The drive power before the step and the relay low power in mW.
+            high_power (float, optional): The drive power after the step and the relay high power in mW.
+            experiment (str, optional): "step" for a step of power, or "relay" to switch between the low and high
+                power whenever the measurement crosses the relay set point.
+            relay_setpoint (float, optional): The measurement the relay switches at, needed for the relay experiment.
+            settle_time (float, optional): The time at low power before the experiment in seconds.
+            test_time (float, optional): The duration of the experiment in seconds.
+            verify_setpoint (float, optional): The set point of the verification step. Defaults to the measurement
+                the model predicts half way between the low and high power.
+            verify_time (float, optional): The duration of the verification step in seconds.
+            closed_loop_time_constant (float, optional): See LVAutotune_pid_gains.
+        Returns:
+            dict: The fitted "model", the "p_term", "i_term" and "d_term" read back from the board, and the
+                "overshoot_percent" and "settling_time_s" of the verification step.
+    """
+    if measurement_source not in _pid_configurations:
+        raise Exception(f'Autotune is not supported for measurement source {measurement_source}.')
+    set_pid_control, column = _pid_configurations[measurement_source]
+    if experiment == "relay" and relay_setpoint is None:
+        raise Exception('The relay experiment needs a relay set point.')
+
+    # manual power control at the low power while the streaming output is captured
+    disc_pump_instance.streaming_mode_disable()
+    disc_pump_instance.write_reg(LVRegister.PUMP_ENABLE, 0)
+    disc_pump_instance.set_manual_power_control_with_set_val()
+    disc_pump_instance.write_reg(LVRegister.SET_VAL, low_power)
+    disc_pump_instance.write_reg(LVRegister.PUMP_ENABLE, 1)
+    disc_pump_instance.streaming_mode_enable()
+    capture = LVStreamingCapture()
+    capture.start(disc_pump_instance)
+    try:
+        time.sleep(settle_time)
+        if experiment == "relay":
+            _run_relay(disc_pump_instance, capture, column, relay_setpoint, low_power, high_power, test_time)
+        else:
+            disc_pump_instance.write_reg(LVRegister.SET_VAL, high_power)
+            time.sleep(test_time)
+        capture.stop()
+        data = capture.latest()
+        # drive power [mW] = voltage [V] * current [mA]
+        model = LVAutotune_fit_fopdt(data[LVStreamingCapture.TIMESTAMP],
+                                     data[LVStreamingModeOutputIndexes.VOLTAGE]
+                                     * data[LVStreamingModeOutputIndexes.CURRENT],
+                                     data[column])
+        p_term, i_term, d_term = LVAutotune_pid_gains(model, closed_loop_time_constant)
+
+        # apply the gains and check them with a set point step from the low power steady state
+        if verify_setpoint is None:
+            verify_setpoint = model["offset"] + model["gain"] * (low_power + high_power) / 2
+        disc_pump_instance.write_reg(LVRegister.SET_VAL, low_power)
+        capture.clear()
+        capture.start(disc_pump_instance)
+        time.sleep(settle_time)
+        step_time = time.time()
+        set_pid_control(disc_pump_instance, p_term, i_term, d_term)
+        disc_pump_instance.write_reg(LVRegister.SET_VAL, verify_setpoint)
+        time.sleep(verify_time)
+        capture.stop()
+        data = capture.latest()
+        # report the gains as the board holds them, the registers keep a limited precision
+        gains = disc_pump_instance.read_registers([LVRegister.PID_PROPORTIONAL_COEFF, LVRegister.PID_INTEGRAL_COEFF,
+                                                   LVRegister.PID_DIFFERENTIAL_COEFF])
+        p_term = gains[LVRegister.PID_PROPORTIONAL_COEFF]
+        i_term = gains[LVRegister.PID_INTEGRAL_COEFF]
+        d_term = gains[LVRegister.PID_DIFFERENTIAL_COEFF]
+        times = data[LVStreamingCapture.TIMESTAMP]
+        first_sample = max(0, int(np.searchsorted(times, step_time)) - 1)
+        metrics = LVAutotune_step_response_metrics(times[first_sample:], data[column, first_sample:],
+                                                   verify_setpoint)
+    finally:
+        # the pump is turned off first, stopping the capture raises any error of the capture thread
+        try:
+            disc_pump_instance.write_reg(LVRegister.PUMP_ENABLE, 0)
+            disc_pump_instance.streaming_mode_disable()
+        finally:
+            capture.stop()
+
+    return {"model": model, "p_term": p_term, "i_term": i_term, "d_term": d_term, **metrics}
+
+
+# -----------------------------------------------------------------------------
+# Internal functions
+# -----------------------------------------------------------------------------
+
+
+def _run_relay(disc_pump_instance: LVDiscPump, capture: LVStreamingCapture, column: int, relay_setpoint: float,
+               low_power: float, high_power: float, test_time: float):
+    end_time = time.perf_counter() + test_time
+    power = None
+    while time.perf_counter() < end_time:
+        measurement = capture.column(column, 1)
+        new_power = high_power if len(measurement) == 0 or measurement[0] < relay_setpoint else low_power
+        if new_power != power:
+            power = new_power
+            disc_pump_instance.write_reg(LVRegister.SET_VAL, power, sleep_after=0)
+        time.sleep(0.001)
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+# for each measurement source, the function setting up PID control on it and its streaming output field
+_pid_configurations = {
+    LVControlSource.DIGITAL_PRESSURE: (LVDiscPump.set_pid_digital_pressure_control_with_set_val,
+                                       LVStreamingModeOutputIndexes.PRESSURE),
+    LVControlSource.ANA_B: (LVDiscPump.set_pid_analog_pressure_control_with_set_val,
+                            LVStreamingModeOutputIndexes.ANA_B),
+    LVControlSource.FLOW: (LVDiscPump.set_pid_flow_control_with_set_val, LVStreamingModeOutputIndexes.FLOW),
+}
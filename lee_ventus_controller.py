@@ -0,0 +1,334 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+
+
+# ***********************************************************************************
+# * LVPidController class
+# ***********************************************************************************
+
+
+class LVPidController:
+    """
+        PID control law for running on the host. The output is limited to a range and the integral stops growing
+        while the output is saturated (anti-windup). The derivative is taken on the measurement, so set point steps
+        don't kick the output. An optional feed-forward term is added to the PID output, and the gains can be
+        scheduled on the set point by giving gains at a few set points, which are interpolated in between.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def update(self, setpoint: float, measurement: float, dt: float) -> float:
+        """
+            Computes the next output.
+
+            Args:
+                setpoint (float): The target value.
+                measurement (float): The measured value.
+                dt (float): The time since the previous update in seconds.
+            Returns:
+                float: The output, within the output limits.
+        """
+        p_term, i_term, d_term = self.gains(setpoint)
+        error = setpoint - measurement
+        derivative = 0.0
+        if self._previous_measurement is not None and dt > 0:
+            derivative = -(measurement - self._previous_measurement) / dt
+        self._previous_measurement = measurement
+
+        feed_forward = self.feed_forward(setpoint) if callable(self.feed_forward) else self.feed_forward
+        integral = self._integral + error * dt
+        output = feed_forward + p_term * error + i_term * integral + d_term * derivative
+        limited_output = min(max(output, self.output_min), self.output_max)
+        # anti-windup: only keep integrating when the output is not saturated, or when the error brings it back
+        if limited_output == output or (output > limited_output) != (error > 0):
+            self._integral = integral
+        return limited_output
+
+    def gains(self, setpoint: float) -> tuple[float, float, float]:
+        """
+            Returns the gains used at a set point.
+
+            Args:
+                setpoint (float): The target value.
+            Returns:
+                tuple[float, float, float]: The proportional, integral and differential terms.
+        """
+        if self._schedule_setpoints is None:
+            return self.p_term, self.i_term, self.d_term
+        return (float(np.interp(setpoint, self._schedule_setpoints, self._schedule_gains[:, 0])),
+                float(np.interp(setpoint, self._schedule_setpoints, self._schedule_gains[:, 1])),
+                float(np.interp(setpoint, self._schedule_setpoints, self._schedule_gains[:, 2])))
+
+    def set_gain_schedule(self, schedule: dict):
+        """
+            Schedules the gains on the set point. Between the given set points the gains are interpolated, outside
+            them the gains of the nearest set point are used.
+
+            Args:
+                schedule (dict): (p_term, i_term, d_term) keyed by set point, or None to use the fixed gains.
+            Returns:
+                None
+        """
+        if schedule is None:
+            self._schedule_setpoints = None
+            return
+        setpoints = sorted(schedule)
+        self._schedule_gains = np.array([schedule[setpoint] for setpoint in setpoints], dtype=np.float64)
+        self._schedule_setpoints = np.array(setpoints, dtype=np.float64)
+
+    def reset(self):
+        """
+            Clears the integral and the previous measurement.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._integral = 0.0
+        self._previous_measurement = None
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, p_term=5, i_term=10, d_term=0, output_min=0, output_max=1000, feed_forward=0):
+        """
+            Args:
+                p_term (float, optional): The proportional term.
+                i_term (float, optional): The integral term.
+                d_term (float, optional): The differential term.
+                output_min (float, optional): The lowest output, e.g. drive power in mW.
+                output_max (float, optional): The highest output. Keep it within POWER_LIMIT_MILLIWATTS.
+                feed_forward (float or function, optional): A value or a function of the set point added to the
+                    output, e.g. the drive power that holds the set point in steady state.
+        """
+        self.p_term = p_term
+        self.i_term = i_term
+        self.d_term = d_term
+        self.output_min = output_min
+        self.output_max = output_max
+        self.feed_forward = feed_forward
+        self._schedule_setpoints = None
+        self._schedule_gains = None
+        self.reset()
+
+
+# ***********************************************************************************
+# * LVHostControlLoop class
+# ***********************************************************************************
+
+
+class LVHostControlLoop:
+    """
+        Runs a closed loop on the host: reads the streamed pressure or flow of a pump, computes the drive power with a
+        LVPidController and writes it to SET_VAL in manual power control. The loop runs as fast as the streaming
+        outputs arrive, always using the latest one. The time from receiving an output to completing the power write
+        is measured; with latency compensation the measurement is extrapolated by that time (plus any known delay of
+        the pump itself) using its current rate of change, which lets higher gains be used on slow links.
+
+        Example:
+            loop = LVHostControlLoop(pump, LVPidController(p_term=2, i_term=20), setpoint=100)
+            loop.start()
+            ...
+            loop.stop()
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def run(self, duration=None):
+        """
+            Configures the pump for manual power control with streaming and runs the loop until the duration has
+            passed or stop() is called. The pump is left running at the last power written.
+
+            Args:
+                duration (float, optional): The time to run for in seconds, None to run until stopped.
+            Returns:
+                None
+        """
+        self._running = True
+        try:
+            self.disc_pump_instance.streaming_mode_disable()
+            self.disc_pump_instance.set_manual_power_control_with_set_val()
+            self.disc_pump_instance.streaming_mode_enable()
+            self.controller.reset()
+
+            start_time = time.perf_counter()
+            previous_time = None
+            previous_measurement = None
+            while self._running and (duration is None or time.perf_counter() - start_time < duration):
+                outputs = self.disc_pump_instance.streaming_mode_get_outputs(timeout=0.1)
+                if len(outputs) == 0:
+                    continue
+                receive_time = time.perf_counter()
+                self._skipped_outputs += len(outputs) - 1
+                measurement = float(outputs[-1, self.measurement_index])
+
+                dt = receive_time - previous_time if previous_time is not None else 0.0
+                control_measurement = measurement
+                if self.latency_compensation and previous_measurement is not None and dt > 0:
+                    rate_of_change = (measurement - previous_measurement) / dt
+                    control_measurement += rate_of_change * (self._latency + self.transport_delay)
+                previous_time = receive_time
+                previous_measurement = measurement
+
+                setpoint = self.setpoint(receive_time - start_time) if callable(self.setpoint) else self.setpoint
+                power = self.controller.update(setpoint, control_measurement, dt)
+                self.disc_pump_instance.write_reg(LVRegister.SET_VAL, power, sleep_after=0)
+
+                latency = time.perf_counter() - receive_time
+                # smoothed latency used for the compensation
+                self._latency = latency if self._iterations == 0 else 0.9 * self._latency + 0.1 * latency
+                self._record(dt, latency, setpoint, measurement, power)
+        finally:
+            self._running = False
+
+    def start(self, duration=None):
+        """
+            Runs the loop on a background thread, see run(). If the loop fails the exception is raised again by
+            stop().
+
+            Args:
+                duration (float, optional): The time to run for in seconds, None to run until stopped.
+            Returns:
+                None
+        """
+        self._running = True
+        self._exception = None
+        self._thread = threading.Thread(target=self._run_thread, args=(duration,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops the loop and waits for the background thread if there is one. Raises the exception that stopped
+            the background thread, if any.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    def statistics(self) -> dict:
+        """
+            Returns the loop timing statistics.
+
+            Args:
+
+            Returns:
+                dict: The number of iterations, the streaming outputs skipped because newer ones had arrived, the
+                    mean loop rate and the mean and maximum latency from receiving an output to writing the power.
+        """
+        number_samples = min(self._iterations, len(self._log))
+        periods = self._log[:number_samples, 0]
+        latencies = self._log[:number_samples, 1]
+        periods = periods[periods > 0]
+        return {"iterations": self._iterations,
+                "skipped_outputs": self._skipped_outputs,
+                "rate_hz": float(1 / np.mean(periods)) if len(periods) != 0 else 0.0,
+                "mean_latency_s": float(np.mean(latencies)) if number_samples != 0 else 0.0,
+                "max_latency_s": float(np.max(latencies)) if number_samples != 0 else 0.0}
+
+    def history(self) -> np.ndarray:
+        """
+            Returns the most recent iterations of the loop.
+
+            Args:
+
+            Returns:
+                np.ndarray: One row per iteration, oldest first: set point, measurement, power written.
+        """
+        if self._iterations <= len(self._log):
+            return self._log[:self._iterations, 2:].copy()
+        return np.roll(self._log, -(self._iterations % len(self._log)), axis=0)[:, 2:]
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, disc_pump_instance: LVDiscPump, controller: LVPidController, setpoint=0,
+                 measurement_index=LVStreamingModeOutputIndexes.PRESSURE, latency_compensation=True,
+                 transport_delay=0.0, history_size=100000):
+        """
+            Args:
+                disc_pump_instance (LVDiscPump): The connected pump.
+                controller (LVPidController): The control law.
+                setpoint (float or function, optional): The target, or a function of the time since the start in
+                    seconds returning the target. Can be changed while the loop runs.
+                measurement_index (int, optional): The streaming output field controlled, see
+                    LVStreamingModeOutputIndexes, e.g. PRESSURE or FLOW.
+                latency_compensation (bool, optional): Optional setting to extrapolate the measurement by the
+                    measured loop latency.
+                transport_delay (float, optional): A known delay in seconds between the pump measuring and the host
+                    receiving the output, added to the measured latency for the compensation.
+                history_size (int, optional): The number of most recent iterations kept.
+        """
+        self.disc_pump_instance = disc_pump_instance
+        self.controller = controller
+        self.setpoint = setpoint
+        self.measurement_index = measurement_index
+        self.latency_compensation = latency_compensation
+        self.transport_delay = transport_delay
+        self._running = False
+        self._thread = None
+        self._exception = None   # exception raised on the background thread, raised again by stop()
+        self._latency = 0.0
+
+        # statistics, the iterations are logged in a preallocated ring buffer:
+        # period, latency, set point, measurement, power
+        self._iterations = 0
+        self._skipped_outputs = 0
+        self._log = np.zeros((history_size, 5))
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _run_thread(self, duration):
+        try:
+            self.run(duration)
+        except Exception as e:
+            self._exception = e
+
+    def _record(self, dt: float, latency: float, setpoint: float, measurement: float, power: float):
+        self._log[self._iterations % len(self._log)] = (dt, latency, setpoint, measurement, power)
+        self._iterations += 1
@@ -22,11 +22,18 @@ Technical Note TN003: Communications Guide
 from typing import List
 
 import serial
+import threading
 import time
 import struct
 import EasyMCP2221
+import numpy as np
 
+from lee_ventus_i2c_bus import LVI2CBus
+from lee_ventus_instrumentation import LVInstrumentation
 from lee_ventus_register import *
+from lee_ventus_serial_registry import LVSerialRegistry_acquire
+from lee_ventus_stream_decoding import *
+from lee_ventus_uart_reader import LVUartReader
 
 
 # ***********************************************************************************
@@ -39,7 +46,7 @@ class LVDiscPump:
     # Public functions
     # -----------------------------------------------------------------------------
 
-    def connect_pump(self, com_port='', i2c_address=-1):
+    def connect_pump(self, com_port='', i2c_address=-1, background_reader=False, i2c_adapter=0):
         """
             Connects a pump via I2C or UART.
             Either a COM port or an I2C address needs to be defined (but not both).
@@ -47,16 +54,25 @@ class LVDiscPump:
             Args:
                 com_port (str, optional): The COM port the pump should be connected to e.g. "COM6"
                 i2c_address (int, optional): The I2C address the pump should be connected to e.g. 37
+                background_reader (bool, optional): Optional setting for UART pumps. If True a background thread
+                    owns the receive side of the port and sorts register replies and streaming lines as they arrive,
+                    so register reads and streaming can be used together without losing data.
+                    The serial ports come from a process wide registry, by default they are opened here and a port
+                    can only be used by one pump at a time, see LVSerialRegistry_configure.
+                i2c_adapter (int or str, optional): Optional setting for I2C pumps selecting the MCP2221 usb to I2C
+                    interface the pump is connected to, either its index (0 for the first one) or its USB serial
+                    number. Each interface is a separate I2C bus, pumps on different interfaces can be driven in
+                    parallel from different threads.
             Returns:
                 None
         """
         if com_port != '' and i2c_address == -1:
             self._is_uart = True
-            self._connect_pump_uart(com_port)
+            self._connect_pump_uart(com_port, background_reader=background_reader)
             return
         if com_port == '' and i2c_address != -1:
             self._is_uart = False
-            self._connect_pump_i2c(i2c_address)
+            self._connect_pump_i2c(i2c_address, i2c_adapter=i2c_adapter)
             return
         raise Exception(f'Invalid configuration for connecting a pump.')
 
@@ -75,10 +91,64 @@ class LVDiscPump:
             Returns:
                 None
         """
-        if self._is_uart:
-            self._write_reg_uart(reg_id, value, rounding_decimal_places=rounding_decimal_places, sleep_after=sleep_after)
-        else:
-            self._write_reg_i2c(reg_id, value, sleep_after=sleep_after)
+        if self._register_cache is not None and self._register_cache_is_current(reg_id, value,
+                                                                                  rounding_decimal_places):
+            return
+        try:
+            if self._instrumentation is not None:
+                self._instrumentation.call("write_reg", reg_id,
+                                           lambda: self._write_reg(reg_id, value, rounding_decimal_places,
+                                                                   sleep_after))
+            else:
+                self._write_reg(reg_id, value, rounding_decimal_places, sleep_after)
+        except Exception:
+            # the board may or may not have the new value, the next write has to be sent
+            self.register_cache_invalidate(reg_id)
+            raise
+        if self._register_cache is not None:
+            self._register_cache_update(reg_id, value, rounding_decimal_places)
+
+    def write_regs(self, reg_values: dict, rounding_decimal_places=3, write_rate=1000, sleep_after=0.005):
+        """
+            Writes values to several registers in one go, in the order given.
+            For UART connected pumps the write commands are packed into as few serial writes as the write rate allows.
+            For I2C connected pumps the writes are sent as back to back I2C frames.
+            Instead of sleeping after every write, the writes are paced at a given rate and the function only sleeps
+            once after the last write.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                reg_values (dict): The values to be written, keyed by register ID (number).
+                    E.g. {LVRegister.CONTROL_MODE: LVControlMode.MANUAL, LVRegister.SET_VAL: 500}.
+                rounding_decimal_places (int, optional): Optional setting for setting rounding in the
+                    decimal places for value.
+                write_rate (float, optional): Optional setting for the maximum number of register writes per second
+                    sent to the driver. Use 0 or None to send all the writes without pacing.
+                sleep_after (float, optional): Optional setting for the delay in seconds that the function will wait
+                    after the last register has been written.
+            Returns:
+                None
+        """
+        if self._register_cache is not None:
+            reg_values = {reg_id: value for reg_id, value in reg_values.items()
+                          if not self._register_cache_is_current(reg_id, value, rounding_decimal_places)}
+            if len(reg_values) == 0:
+                return
+        try:
+            if self._instrumentation is not None:
+                self._instrumentation.call("write_regs", list(reg_values),
+                                           lambda: self._write_regs(reg_values, rounding_decimal_places, write_rate,
+                                                                    sleep_after))
+            else:
+                self._write_regs(reg_values, rounding_decimal_places, write_rate, sleep_after)
+        except Exception:
+            # some of the writes may not have reached the board, the next writes have to be sent
+            for reg_id in reg_values:
+                self.register_cache_invalidate(reg_id)
+            raise
+        if self._register_cache is not None:
+            for reg_id, value in reg_values.items():
+                self._register_cache_update(reg_id, value, rounding_decimal_places)
 
     def read_register(self, reg_id: int, timeout=1) -> float:
         """
@@ -92,10 +162,152 @@ class LVDiscPump:
             Returns:
                 float: The value of the given register.
         """
-        if self._is_uart:
-            return self._read_register_uart(reg_id, timeout=timeout)
+        if self._instrumentation is not None:
+            value = self._instrumentation.call("read_register", reg_id, lambda: self._read_register(reg_id, timeout))
         else:
-            return self._read_register_i2c(reg_id, timeout=timeout)
+            value = self._read_register(reg_id, timeout)
+        if self._register_cache is not None:
+            self._register_cache_update(reg_id, value)
+        return value
+
+    def read_registers(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        """
+            Reads the values of several registers in one go.
+            For UART connected pumps all the read commands are sent in a single write and the replies are matched
+            by register ID, so a group of registers costs about one round trip. For I2C connected pumps the reads
+            are issued back to back.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                reg_ids (list[int]): The register IDs (numbers) to be read. E.g. [5, 39] for drive power and
+                    digital pressure.
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for all the responses. Useful in preventing the program from stopping if the board is not
+                    responding.
+            Returns:
+                dict[int, float]: The value of each given register, keyed by register ID.
+        """
+        if self._instrumentation is not None:
+            values = self._instrumentation.call("read_registers", list(reg_ids),
+                                                lambda: self._read_registers(reg_ids, timeout))
+        else:
+            values = self._read_registers(reg_ids, timeout)
+        if self._register_cache is not None:
+            for reg_id, value in values.items():
+                self._register_cache_update(reg_id, value)
+        return values
+
+    def register_cache_enable(self, enable=True):
+        """
+            Enables or disables the write-through register cache. While enabled the last value written to (or read
+            from) each register is remembered, and writes of the same value are skipped. Measurement registers,
+            ERROR_CODE, STORE_CURRENT_SETTINGS and the GPIO states are never cached.
+            The cache assumes this instance is the only one changing the board settings. Call
+            register_cache_invalidate or register_cache_resync if the board is changed any other way (e.g. it was
+            power cycled).
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                enable (bool, optional): Optional setting to enable (True) or disable (False) the cache.
+            Returns:
+                None
+        """
+        if not enable:
+            self._register_cache = None
+        elif self._register_cache is None:
+            self._register_cache = {}
+
+    def register_cache_invalidate(self, reg_id=None):
+        """
+            Forgets the cached value of one register or of all registers, so that the next write is always sent.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                reg_id (int, optional): The register ID (number) to be forgotten. If not given the whole cache
+                    is cleared.
+            Returns:
+                None
+        """
+        if self._register_cache is None:
+            return
+        if reg_id is None:
+            self._register_cache.clear()
+        else:
+            self._register_cache.pop(reg_id, None)
+
+    def register_cache_resync(self, timeout=1):
+        """
+            Clears the register cache and fills it again with the values read back from the board.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for the responses.
+            Returns:
+                None
+        """
+        self.register_cache_enable()
+        self._register_cache.clear()
+        self.read_registers([reg_id for reg_id in LVRegister if not LVRegister_is_volatile(reg_id)],
+                            timeout=timeout)
+
+    def instrumentation_enable(self, enable=True):
+        """
+            Enables or disables the I/O instrumentation of the pump. While enabled, the calls to write_reg(s),
+            read_register(s) and streaming_mode_get_output(s) are counted and timed per register ID, together with
+            the bytes sent and received, timeouts and discarded lines. When disabled it costs next to nothing.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                enable (bool, optional): Optional setting to enable (True) or disable (False) the instrumentation.
+                    Disabling it discards the statistics.
+            Returns:
+                None
+        """
+        if not enable:
+            self._instrumentation = None
+        elif self._instrumentation is None:
+            self._instrumentation = LVInstrumentation()
+
+    def instrumentation_snapshot(self) -> dict:
+        """
+            Returns a copy of the I/O statistics of the pump (see LVInstrumentation.snapshot).
+            Works for both I2C and UART connected pumps.
+
+            Args:
+
+            Returns:
+                dict: The statistics, or None if the instrumentation is not enabled.
+        """
+        if self._instrumentation is None:
+            return None
+        snapshot = self._instrumentation.snapshot()
+        snapshot["discarded_lines"] += self._uart_stream_parser.discarded_lines
+        if self._uart_reader is not None:
+            # bytes received by the background reader are not part of any call
+            snapshot["bytes_received"] += self._uart_reader.bytes_received
+            snapshot["discarded_lines"] += self._uart_reader.discarded_lines
+            snapshot["dropped_stream_outputs"] = self._uart_reader.dropped_stream_outputs
+        return snapshot
+
+    def instrumentation_reset(self):
+        """
+            Clears the I/O statistics of the pump.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+
+            Returns:
+                None
+        """
+        if self._instrumentation is not None:
+            self._instrumentation.reset()
+            # the parser and reader counters are added to the snapshot, they are cleared with the rest
+            self._uart_stream_parser.discarded_lines = 0
+            if self._uart_reader is not None:
+                self._uart_reader.bytes_received = 0
+                self._uart_reader.discarded_lines = 0
+                self._uart_reader.dropped_stream_outputs = 0
 
     def disconnect_pump(self):
         """
@@ -107,6 +319,8 @@ class LVDiscPump:
             Returns:
                 None
         """
+        # the board may be changed by someone else while disconnected
+        self.register_cache_invalidate()
         if self._is_uart:
             self._disconnect_pump_uart()
         else:
@@ -145,6 +359,8 @@ class LVDiscPump:
              - GP - [PUMP_ENABLED,VOLTAGE,CURRENT,FREQUENCY,ANA_A,ANA_B (analog pressure) / digital pressure,ANA_C,FLOW]
              - SPM - [PUMP_ENABLED,VOLTAGE,CURRENT,FREQUENCY,0,digital pressure,ANA_C,0]
             Works for both I2C and UART connected pumps.
+            With the UART background reader every received output is queued, and the oldest one not yet returned
+            is given back (instead of flushing the buffer and waiting for the next line).
 
             Args:
                 timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
@@ -152,10 +368,31 @@ class LVDiscPump:
             Returns:
                 list[float]: The streaming mode output.
         """
-        if self._is_uart:
-            return self._streaming_mode_get_output_uart(timeout=timeout)
-        else:
-            return self._streaming_mode_get_output_i2c(timeout=timeout)
+        if self._instrumentation is not None:
+            return self._instrumentation.call("streaming_mode_get_output", None,
+                                              lambda: self._streaming_mode_get_output(timeout), empty_is_timeout=True)
+        return self._streaming_mode_get_output(timeout)
+
+    def streaming_mode_get_outputs(self, timeout=1) -> np.ndarray:
+        """
+            Returns all the streaming mode outputs received since the previous call, oldest first, as an array with
+            one row per output and the columns listed in LVStreamingModeOutputIndexes.
+            For UART connected pumps everything waiting in the serial buffer is read at once and converted in bulk,
+            incomplete lines are kept for the next call. The function only waits (up to the timeout) if no complete
+            output is waiting. For I2C connected pumps a single output is read.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for at least one output.
+            Returns:
+                np.ndarray: Array of shape (number of outputs, 8). It has no rows if nothing arrived before the
+                    timeout.
+        """
+        if self._instrumentation is not None:
+            return self._instrumentation.call("streaming_mode_get_outputs", None,
+                                              lambda: self._streaming_mode_get_outputs(timeout), empty_is_timeout=True)
+        return self._streaming_mode_get_outputs(timeout)
 
     def set_manual_power_control_with_set_val(self):
         """
@@ -168,10 +405,12 @@ class LVDiscPump:
             Returns:
                 None
         """
-        # set the pump to manual control mode
-        self.write_reg(LVRegister.CONTROL_MODE, LVControlMode.MANUAL)
-        # set the drive power input to register 23
-        self.write_reg(LVRegister.MANUAL_MODE_SETPOINT_SOURCE, LVControlSource.SETVAL)
+        self.write_regs({
+            # set the pump to manual control mode
+            LVRegister.CONTROL_MODE: LVControlMode.MANUAL,
+            # set the drive power input to register 23
+            LVRegister.MANUAL_MODE_SETPOINT_SOURCE: LVControlSource.SETVAL,
+        })
 
     def set_pid_digital_pressure_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
         """
@@ -186,17 +425,18 @@ class LVDiscPump:
             Returns:
                 None
         """
-        # set the pump to pid control mode
-        self.write_reg(LVRegister.CONTROL_MODE, LVControlMode.PID)
-        # set the pid tracking value to digital pressure. Note that this only works on the SPM and Dev kit
-        self.write_reg(LVRegister.PID_MODE_MEAS_SOURCE, LVControlSource.DIGITAL_PRESSURE)
-        # set the pressure target input to register 23
-        self.write_reg(LVRegister.PID_MODE_SETPOINT_SOURCE, LVControlSource.SETVAL)
-
-        # set PID values
-        self.write_reg(LVRegister.PID_PROPORTIONAL_COEFF, p_term)
-        self.write_reg(LVRegister.PID_INTEGRAL_COEFF, i_term)
-        self.write_reg(LVRegister.PID_DIFFERENTIAL_COEFF, d_term)
+        self.write_regs({
+            # set the pump to pid control mode
+            LVRegister.CONTROL_MODE: LVControlMode.PID,
+            # set the pid tracking value to digital pressure. Note that this only works on the SPM and Dev kit
+            LVRegister.PID_MODE_MEAS_SOURCE: LVControlSource.DIGITAL_PRESSURE,
+            # set the pressure target input to register 23
+            LVRegister.PID_MODE_SETPOINT_SOURCE: LVControlSource.SETVAL,
+            # set PID values
+            LVRegister.PID_PROPORTIONAL_COEFF: p_term,
+            LVRegister.PID_INTEGRAL_COEFF: i_term,
+            LVRegister.PID_DIFFERENTIAL_COEFF: d_term,
+        })
 
     def set_pid_analog_pressure_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
         """
@@ -211,17 +451,18 @@ class LVDiscPump:
             Returns:
                 None
         """
-        # set the pump to pid control mode
-        self.write_reg(LVRegister.CONTROL_MODE, LVControlMode.PID)
-        # set the pid tracking value to the analog pressure sensor on the Eval kit
-        self.write_reg(LVRegister.PID_MODE_MEAS_SOURCE, LVControlSource.ANA_B)
-        # set the pressure target input to register 23
-        self.write_reg(LVRegister.PID_MODE_SETPOINT_SOURCE, LVControlSource.SETVAL)
-
-        # set PID values
-        self.write_reg(LVRegister.PID_PROPORTIONAL_COEFF, p_term)
-        self.write_reg(LVRegister.PID_INTEGRAL_COEFF, i_term)
-        self.write_reg(LVRegister.PID_DIFFERENTIAL_COEFF, d_term)
+        self.write_regs({
+            # set the pump to pid control mode
+            LVRegister.CONTROL_MODE: LVControlMode.PID,
+            # set the pid tracking value to the analog pressure sensor on the Eval kit
+            LVRegister.PID_MODE_MEAS_SOURCE: LVControlSource.ANA_B,
+            # set the pressure target input to register 23
+            LVRegister.PID_MODE_SETPOINT_SOURCE: LVControlSource.SETVAL,
+            # set PID values
+            LVRegister.PID_PROPORTIONAL_COEFF: p_term,
+            LVRegister.PID_INTEGRAL_COEFF: i_term,
+            LVRegister.PID_DIFFERENTIAL_COEFF: d_term,
+        })
 
     def set_pid_flow_control_with_set_val(self, p_term=5, i_term=10, d_term=0):
         """
@@ -235,17 +476,18 @@ class LVDiscPump:
             Returns:
                 None
         """
-        # set the pump to pid control mode
-        self.write_reg(LVRegister.CONTROL_MODE, LVControlMode.PID)
-        # set the pid tracking value to the external flow sensor for the Dev kit / Eval kit
-        self.write_reg(LVRegister.PID_MODE_MEAS_SOURCE, LVControlSource.FLOW)
-        # set the pressure target input to register 23
-        self.write_reg(LVRegister.PID_MODE_SETPOINT_SOURCE, LVControlSource.SETVAL)
-
-        # set PID values
-        self.write_reg(LVRegister.PID_PROPORTIONAL_COEFF, p_term)
-        self.write_reg(LVRegister.PID_INTEGRAL_COEFF, i_term)
-        self.write_reg(LVRegister.PID_DIFFERENTIAL_COEFF, d_term)
+        self.write_regs({
+            # set the pump to pid control mode
+            LVRegister.CONTROL_MODE: LVControlMode.PID,
+            # set the pid tracking value to the external flow sensor for the Dev kit / Eval kit
+            LVRegister.PID_MODE_MEAS_SOURCE: LVControlSource.FLOW,
+            # set the pressure target input to register 23
+            LVRegister.PID_MODE_SETPOINT_SOURCE: LVControlSource.SETVAL,
+            # set PID values
+            LVRegister.PID_PROPORTIONAL_COEFF: p_term,
+            LVRegister.PID_INTEGRAL_COEFF: i_term,
+            LVRegister.PID_DIFFERENTIAL_COEFF: d_term,
+        })
 
     def configure_spm_i2c_only_mode(self, i2c_address=37):
         """
@@ -284,31 +526,68 @@ class LVDiscPump:
             print("Settings have been stored to board.")
             print("If any of the settings require rebooting please power cycle the board.")
 
-    def restore_default_settings(self):
+    def restore_default_settings(self, only_changed=False) -> dict:
         """
             Restores the default settings to the board.
             Works for both I2C and UART connected pumps.
 
             Args:
-
+                only_changed (bool, optional): Optional setting to read the current settings first and only write the
+                    registers that differ from the defaults (see apply_register_profile).
             Returns:
-                None
+                dict: The registers that were written, keyed by register ID, with (previous value, new value) tuples.
+                    The previous value is None if the current settings were not read.
         """
         # read the board type
         device_type = self.read_register(LVRegister.DEVICE_TYPE)
 
         # depending on the device type write the relevant default values
+        default_values = {}
         if device_type == LVDeviceType.GP:
             for index in range(LVRegister_get_number_settings()):
                 default_value = LVRegister_get_default_reg_value_gp(index)
                 if default_value is not None:
-                    self.write_reg(index, default_value)
+                    default_values[index] = default_value
 
         if device_type == LVDeviceType.SPM:
             for index in range(LVRegister_get_number_settings()):
                 default_value = LVRegister_get_default_reg_value_spm(index)
                 if default_value is not None:
-                    self.write_reg(index, default_value)
+                    default_values[index] = default_value
+
+        if only_changed:
+            return self.apply_register_profile(default_values)
+        self.write_regs(default_values)
+        return {reg_id: (None, value) for reg_id, value in default_values.items()}
+
+    def apply_register_profile(self, reg_values: dict, rounding_decimal_places=3, timeout=1) -> dict:
+        """
+            Brings the board to a given set of register values, writing only the registers that differ.
+            The current values are read in bulk and compared with the target values, then only the differences
+            are written in one batch. Applying a profile to a board that already holds it is almost free.
+            Works for both I2C and UART connected pumps.
+
+            Args:
+                reg_values (dict): The target values, keyed by register ID (number).
+                rounding_decimal_places (int, optional): Optional setting for the number of decimal places
+                    float registers are compared and written with.
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for the current values to be read.
+            Returns:
+                dict: The registers that were written, keyed by register ID, with (previous value, new value) tuples.
+        """
+        current_values = self.read_registers(list(reg_values.keys()), timeout=timeout)
+        changes = {}
+        for reg_id, value in reg_values.items():
+            if LVRegister_is_volatile(reg_id) or \
+                    LVRegister_normalise_value(reg_id, current_values[reg_id], rounding_decimal_places) != \
+                    LVRegister_normalise_value(reg_id, value, rounding_decimal_places):
+                changes[reg_id] = (current_values[reg_id], value)
+
+        if len(changes) != 0:
+            self.write_regs({reg_id: change[1] for reg_id, change in changes.items()},
+                            rounding_decimal_places=rounding_decimal_places)
+        return changes
 
     def set_status_led_colour(self, red: int, green: int, blue: int):
         """
@@ -341,6 +620,14 @@ class LVDiscPump:
         led_register_val = red * 32 * 32 + green * 32 + blue
         self.write_reg(LVRegister.STATUS_LED_COLOUR, led_register_val)
 
+    @property
+    def i2c_bus(self) -> LVI2CBus:
+        """
+            The I2C bus the pump is connected to, e.g. to read the bus utilization or set the pump's priority.
+            None for UART connected pumps.
+        """
+        return self._i2c_bus
+
     # -----------------------------------------------------------------------------
     # Initialisation / de-initialisation functions
     # -----------------------------------------------------------------------------
@@ -348,7 +635,13 @@ class LVDiscPump:
     def __init__(self):
         self._is_uart = None
         self._com_port = None
+        self._uart_reader = None
+        self._uart_stream_parser = LVUartStreamParser()
         self._i2c_address = None
+        self._i2c_adapter = None
+        self._i2c_bus = None
+        self._register_cache = None
+        self._instrumentation = None
 
     def __del__(self):
         self.disconnect_pump()
@@ -357,45 +650,208 @@ class LVDiscPump:
     # Private variables
     # -----------------------------------------------------------------------------
 
-    # static variable for the MCP2221 usb to I2C interface as this is shared for all I2C pumps
-    _i2c_port = None
-    # static variable for all I2C device addresses connected so we can monitor how many devices are left
-    _i2c_target_addresses = []
+    # static variables for the buses owning the MCP2221 usb to I2C interfaces, as each interface is shared by all
+    # the I2C pumps connected to it, and for the number of pumps connected to each interface so we can disconnect
+    # from it when no pumps are left. Both are keyed by the index of the interface
+    _i2c_buses = {}
+    _i2c_bus_pump_counts = {}
+    # protects the two variables above when pumps are connected from several threads
+    _i2c_lock = threading.Lock()
+
+    # static variables for the classes used to open the serial port and the MCP2221 usb to I2C interface.
+    # These can be replaced with compatible classes, e.g. the simulated devices in lee_ventus_simulator.py
+    _serial_port_factory = serial.Serial
+    _i2c_device_factory = EasyMCP2221.Device
+
+    @staticmethod
+    def _serial_port_names() -> list[str]:
+        # names of the serial ports available on this computer
+        import serial.tools.list_ports
+        return [port.device for port in serial.tools.list_ports.comports()]
+
+    @staticmethod
+    def _i2c_adapter_serial_numbers() -> list[str]:
+        # USB serial numbers of the MCP2221 interfaces in the order of their index
+        import hid   # installed with EasyMCP2221
+        return [device['serial_number'] for device in hid.enumerate(EasyMCP2221.Device.VID, EasyMCP2221.Device.PID)]
 
     # -----------------------------------------------------------------------------
     # Private functions
     # -----------------------------------------------------------------------------
 
-    def _write_reg_uart(self, reg_id: int, value, rounding_decimal_places=3, sleep_after=0.005):
+    def _count_bytes(self, sent=0, received=0, discarded_lines=0):
+        if self._instrumentation is not None:
+            self._instrumentation.count_bytes(sent, received, discarded_lines)
+
+    def _write_reg(self, reg_id: int, value, rounding_decimal_places=3, sleep_after=0.005):
+        if self._is_uart:
+            # the port lock keeps the transactions of pumps sharing the port apart
+            with self._com_port.lock:
+                self._write_reg_uart(reg_id, value, rounding_decimal_places=rounding_decimal_places,
+                                     sleep_after=sleep_after)
+        else:
+            self._write_reg_i2c(reg_id, value, sleep_after=sleep_after)
+
+    def _write_regs(self, reg_values: dict, rounding_decimal_places=3, write_rate=1000, sleep_after=0.005):
+        if self._is_uart:
+            commands = [self._encode_write_uart(reg_id, value, rounding_decimal_places=rounding_decimal_places)
+                        for reg_id, value in reg_values.items()]
+            # a short burst of commands is sent in one serial write, bursts are then spaced to meet the write rate
+            with self._com_port.lock:
+                self._send_paced(commands, self._com_port.write, write_rate=write_rate, burst_size=8)
+        else:
+            commands = [self._encode_write_i2c(reg_id, value) for reg_id, value in reg_values.items()]
+            self._send_paced(commands,
+                             lambda data: self._i2c_bus.write(self._i2c_address, data),
+                             write_rate=write_rate, burst_size=1)
+        self._count_bytes(sent=sum(len(command) for command in commands))
+        if sleep_after != 0:
+            time.sleep(sleep_after)
+
+    def _read_register(self, reg_id: int, timeout=1) -> float:
+        if self._is_uart:
+            with self._com_port.lock:
+                return self._read_register_uart(reg_id, timeout=timeout)
+        else:
+            return self._read_register_i2c(reg_id, timeout=timeout)
+
+    def _read_registers(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        if self._is_uart:
+            with self._com_port.lock:
+                return self._read_registers_uart(reg_ids, timeout=timeout)
+        else:
+            return self._read_registers_i2c(reg_ids, timeout=timeout)
+
+    def _streaming_mode_get_output(self, timeout=1) -> list[float]:
+        if self._is_uart:
+            return self._streaming_mode_get_output_uart(timeout=timeout)
+        else:
+            return self._streaming_mode_get_output_i2c(timeout=timeout)
+
+    def _streaming_mode_get_outputs(self, timeout=1) -> np.ndarray:
+        if self._is_uart:
+            return self._streaming_mode_get_outputs_uart(timeout=timeout)
+        else:
+            return np.array([self._streaming_mode_get_output_i2c(timeout=timeout)], dtype=np.float64)
+
+    def _register_cache_is_current(self, reg_id: int, value, rounding_decimal_places=3) -> bool:
+        # whether the board is known to hold the value already
+        if LVRegister_is_volatile(reg_id):
+            return False
+        return self._register_cache.get(reg_id) == LVRegister_normalise_value(reg_id, value, rounding_decimal_places)
+
+    def _register_cache_update(self, reg_id: int, value, rounding_decimal_places=3) -> bool:
+        # stores the value in the cache and returns whether it differs from what was cached before
+        if LVRegister_is_volatile(reg_id):
+            return True
+        value = LVRegister_normalise_value(reg_id, value, rounding_decimal_places)
+        if self._register_cache.get(reg_id) == value:
+            return False
+        self._register_cache[reg_id] = value
+        return True
+
+    @staticmethod
+    def _send_paced(commands: list, send, write_rate=1000, burst_size=1):
+        # sends the commands in bursts, keeping the average rate at or below write_rate commands per second
+        start_time = time.perf_counter()
+        for index in range(0, len(commands), burst_size):
+            if write_rate:
+                delay = start_time + index / write_rate - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            send(b''.join(commands[index:index + burst_size]))
+
+    @staticmethod
+    def _encode_write_uart(reg_id: int, value, rounding_decimal_places=3) -> bytes:
         if LVRegister_is_int(reg_id):
-            self._com_port.write(f'#W{reg_id},{round(value, rounding_decimal_places)}\n'.encode('ascii'))
+            return f'#W{reg_id},{int(value)}\n'.encode('ascii')
         else:
-            self._com_port.write(f'#W{reg_id},{int(value)}\n'.encode('ascii'))
+            return f'#W{reg_id},{round(float(value), rounding_decimal_places)}\n'.encode('ascii')
+
+    def _write_reg_uart(self, reg_id: int, value, rounding_decimal_places=3, sleep_after=0.005):
+        self._count_bytes(sent=self._com_port.write(
+            self._encode_write_uart(reg_id, value, rounding_decimal_places=rounding_decimal_places)))
         if sleep_after != 0:
             time.sleep(sleep_after)
 
+    def _flush_uart_input(self):
+        # the partial streaming line kept by the parser must not be joined to what arrives after the flush
+        self._count_bytes(received=len(self._com_port.read_all()))
+        self._uart_stream_parser.reset()
+
     def _read_register_uart(self, reg_id: int, timeout=1) -> float:
-        self._com_port.read_all()   # flushes the buffer
-        self._com_port.write(f'#R{reg_id}\n'.encode('ascii'))
+        if self._uart_reader is not None:
+            self._uart_reader.clear_reply(reg_id)
+            self._count_bytes(sent=self._com_port.write(f'#R{reg_id}\n'.encode('ascii')))
+            return self._uart_reader.wait_for_reply(reg_id, timeout=timeout)
+
+        self._flush_uart_input()
+        self._count_bytes(sent=self._com_port.write(f'#R{reg_id}\n'.encode('ascii')))
         start_time = float(time.time())
         while float(time.time()) - start_time < timeout:
             line_chars = self._com_port.readline()
-            if any(char >= 128 for char in line_chars):
+            self._count_bytes(received=len(line_chars))
+            if not line_chars.isascii():
                 # Ignore this line, as we've read a
                 # byte that can't be decoded
+                self._count_bytes(discarded_lines=1)
                 continue
             line = line_chars.decode('ascii')
             if f'#R{reg_id},' in line:
                 return float(line.split(',')[1])
 
-        raise Exception("Didn't get expected response from driver")
+        raise LVTimeoutError("Didn't get expected response from driver")
+
+    def _read_registers_uart(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        reg_ids = list(dict.fromkeys(int(reg_id) for reg_id in reg_ids))   # remove duplicates, keep the order
+        request = ''.join(f'#R{reg_id}\n' for reg_id in reg_ids).encode('ascii')
+
+        if self._uart_reader is not None:
+            for reg_id in reg_ids:
+                self._uart_reader.clear_reply(reg_id)
+            self._count_bytes(sent=self._com_port.write(request))
+            deadline = time.monotonic() + timeout
+            return {reg_id: self._uart_reader.wait_for_reply(reg_id, timeout=max(0.0, deadline - time.monotonic()))
+                    for reg_id in reg_ids}
 
-    def _connect_pump_uart(self, com_port: str):
-        self._com_port = serial.Serial(port=com_port,
-                                       baudrate=115200,
-                                       bytesize=8,
-                                       timeout=2,
-                                       stopbits=serial.STOPBITS_ONE)
+        self._flush_uart_input()
+        self._count_bytes(sent=self._com_port.write(request))
+        values = {}
+        start_time = float(time.time())
+        while float(time.time()) - start_time < timeout:
+            line_chars = self._com_port.readline()
+            self._count_bytes(received=len(line_chars))
+            if not line_chars.isascii():
+                # Ignore this line, as we've read a
+                # byte that can't be decoded
+                self._count_bytes(discarded_lines=1)
+                continue
+            line = line_chars.decode('ascii').strip()
+            if not line.startswith('#R') or ',' not in line:
+                continue
+            reg_id, value = line[2:].split(',', 1)
+            if reg_id.isdigit() and int(reg_id) in reg_ids:
+                values[int(reg_id)] = float(value)
+                if len(values) == len(reg_ids):
+                    return {reg_id: values[reg_id] for reg_id in reg_ids}
+
+        raise LVTimeoutError("Didn't get expected response from driver")
+
+    def _connect_pump_uart(self, com_port: str, background_reader=False):
+        def open_port():
+            return LVDiscPump._serial_port_factory(port=com_port,
+                                                   baudrate=115200,
+                                                   bytesize=8,
+                                                   timeout=2,
+                                                   stopbits=serial.STOPBITS_ONE)
+
+        # the port is opened by the registry, on first use if connecting lazily, or reused if it is already open
+        self._com_port = LVSerialRegistry_acquire(com_port, open_port, timeout=2)
+        if background_reader:
+            # a single poll of the port per read lets the reader thread stop promptly on disconnect
+            self._com_port.timeout = None
+            self._uart_reader = LVUartReader(self._com_port)
+            self._uart_reader.start()
 
     def _disconnect_pump_uart(self):
         self._is_uart = None
@@ -403,18 +859,30 @@ class LVDiscPump:
         if self._com_port is None:
             return
 
+        if self._uart_reader is not None:
+            self._uart_reader.stop()
+            self._uart_reader = None
+        # releases the port, it is closed once no pump uses it (unless ports are kept warm)
         self._com_port.close()
         del self._com_port
         self._com_port = None
 
     def _streaming_mode_get_output_uart(self, timeout=1) -> list[float]:
-        self._com_port.read_all()   # flushes the buffer
+        if self._uart_reader is not None:
+            return self._uart_reader.get_stream_output(timeout=timeout)
+        with self._com_port.lock:
+            return self._read_stream_output_uart(timeout)
+
+    def _read_stream_output_uart(self, timeout=1) -> list[float]:
+        self._flush_uart_input()
         start_time = float(time.time())
         while float(time.time()) - start_time < timeout:
             line_chars = self._com_port.readline()
-            if any(char >= 128 for char in line_chars):
+            self._count_bytes(received=len(line_chars))
+            if not line_chars.isascii():
                 # Ignore this line, as we've read a
                 # byte that can't be decoded
+                self._count_bytes(discarded_lines=1)
                 continue
             line = line_chars.decode('ascii')
             if "#S" in line:
@@ -428,31 +896,77 @@ class LVDiscPump:
                         float(all_values[6]),  # ana c
                         float(all_values[7])]  # flow (GP) / 0 (SPM)
 
-    def _write_reg_i2c(self, reg_id: int, value, sleep_after=0.005):
+    def _streaming_mode_get_outputs_uart(self, timeout=1) -> np.ndarray:
+        if self._uart_reader is not None:
+            stream_outputs = []
+            stream_output = self._uart_reader.get_stream_output(timeout=timeout)
+            while stream_output is not None:
+                stream_outputs.append(stream_output)
+                stream_output = self._uart_reader.get_stream_output(timeout=0)
+            return np.array(stream_outputs, dtype=np.float64).reshape(-1, len(LVStreamingModeOutputIndexes))
+
+        start_time = float(time.time())
+        while True:
+            # read everything that is waiting in one go, the lock is not held while sleeping
+            with self._com_port.lock:
+                bytes_waiting = self._com_port.in_waiting
+                if bytes_waiting != 0:
+                    self._count_bytes(received=bytes_waiting)
+                    outputs = self._uart_stream_parser.feed(self._com_port.read(bytes_waiting))
+                    if len(outputs) != 0:
+                        return outputs
+            if float(time.time()) - start_time >= timeout:
+                return np.empty((0, len(LVStreamingModeOutputIndexes)), dtype=np.float64)
+            time.sleep(0.001)
+
+    @staticmethod
+    def _encode_write_i2c(reg_id: int, value) -> bytes:
         data_to_send = struct.pack("B", reg_id)
         if LVRegister_is_int(reg_id):
             data_to_send = data_to_send + struct.pack("h", int(value))
         else:
             data_to_send = data_to_send + struct.pack("f", float(value))
-        LVDiscPump._i2c_port.I2C_write(addr=self._i2c_address, data=data_to_send)
+        return data_to_send
+
+    def _write_reg_i2c(self, reg_id: int, value, sleep_after=0.005):
+        data_to_send = self._encode_write_i2c(reg_id, value)
+        self._i2c_bus.write(self._i2c_address, data_to_send)
+        self._count_bytes(sent=len(data_to_send))
         if sleep_after != 0:
             time.sleep(sleep_after)
 
     def _read_register_i2c(self, reg_id: int, timeout=1) -> float:
+        # the register select write and the read are done as one transaction so other pumps can't get in between
         data_to_send = struct.pack("B", reg_id + 128)
-        LVDiscPump._i2c_port.I2C_write(addr=self._i2c_address, data=data_to_send)
         if LVRegister_is_int(reg_id):
-            data_received = LVDiscPump._i2c_port.I2C_read(addr=self._i2c_address, size=2, timeout_ms=1000*timeout)
+            data_received = self._i2c_bus.write_then_read(self._i2c_address, data_to_send, size=2,
+                                                          timeout_ms=1000*timeout)
+            self._count_bytes(sent=len(data_to_send), received=len(data_received))
             return float(struct.unpack("h", bytes(data_received[0:2]))[0])
         else:
-            data_received = LVDiscPump._i2c_port.I2C_read(addr=self._i2c_address, size=4, timeout_ms=1000*timeout)
+            data_received = self._i2c_bus.write_then_read(self._i2c_address, data_to_send, size=4,
+                                                          timeout_ms=1000*timeout)
+            self._count_bytes(sent=len(data_to_send), received=len(data_received))
             return float(struct.unpack("f", bytes(data_received[0:4]))[0])
 
-    def _connect_pump_i2c(self, i2c_address: int):
+    def _read_registers_i2c(self, reg_ids: List[int], timeout=1) -> dict[int, float]:
+        return {int(reg_id): self._read_register_i2c(int(reg_id), timeout=timeout) for reg_id in reg_ids}
+
+    def _connect_pump_i2c(self, i2c_address: int, i2c_adapter=0):
+        if isinstance(i2c_adapter, str):
+            serial_numbers = LVDiscPump._i2c_adapter_serial_numbers()
+            if i2c_adapter not in serial_numbers:
+                raise Exception(f'No MCP2221 usb to I2C interface with serial number {i2c_adapter}.')
+            i2c_adapter = serial_numbers.index(i2c_adapter)
+
+        with LVDiscPump._i2c_lock:
+            if i2c_adapter not in LVDiscPump._i2c_buses:
+                LVDiscPump._i2c_buses[i2c_adapter] = LVI2CBus(LVDiscPump._i2c_device_factory(devnum=i2c_adapter))
+                LVDiscPump._i2c_bus_pump_counts[i2c_adapter] = 0
+            LVDiscPump._i2c_bus_pump_counts[i2c_adapter] += 1
+            self._i2c_bus = LVDiscPump._i2c_buses[i2c_adapter]
+        self._i2c_adapter = i2c_adapter
         self._i2c_address = i2c_address
-        LVDiscPump._i2c_target_addresses.append(self._i2c_address)
-        if LVDiscPump._i2c_port is None:
-            LVDiscPump._i2c_port = EasyMCP2221.Device()
 
     def _disconnect_pump_i2c(self):
         self._is_uart = None
@@ -460,23 +974,22 @@ class LVDiscPump:
         if self._i2c_address is None:
             return
 
-        LVDiscPump._i2c_target_addresses.remove(self._i2c_address)
+        with LVDiscPump._i2c_lock:
+            LVDiscPump._i2c_bus_pump_counts[self._i2c_adapter] -= 1
+            # if there are no more I2C devices connected to the I2C chip, disconnect from it
+            if LVDiscPump._i2c_bus_pump_counts[self._i2c_adapter] == 0:
+                del LVDiscPump._i2c_buses[self._i2c_adapter]
+                del LVDiscPump._i2c_bus_pump_counts[self._i2c_adapter]
         self._i2c_address = None
-        # if there are no mode I2C devices connected to the I2C chip, disconnect from it
-        if LVDiscPump._i2c_port is not None and len(LVDiscPump._i2c_target_addresses) == 0:
-            del LVDiscPump._i2c_port
-            LVDiscPump._i2c_port = None
+        self._i2c_adapter = None
+        self._i2c_bus = None
 
     def _streaming_mode_get_output_i2c(self, timeout=1) -> list[float]:
-        data_received = LVDiscPump._i2c_port.I2C_read(addr=self._i2c_address, size=29, timeout_ms=1000*timeout)
-        return [float(struct.unpack("h", bytes(data_received[0:2]))[0]),  # pump enabled
-                float(struct.unpack("f", bytes(data_received[2:6]))[0]),  # voltage
-                float(struct.unpack("f", bytes(data_received[6:10]))[0]),  # current
-                float(struct.unpack("h", bytes(data_received[10:12]))[0]),  # freq
-                float(struct.unpack("f", bytes(data_received[12:16]))[0]),  # 0
-                float(struct.unpack("f", bytes(data_received[16:20]))[0]),  # digital pressure
-                float(struct.unpack("f", bytes(data_received[20:24]))[0]),  # ana_c
-                float(struct.unpack("f", bytes(data_received[24:28]))[0])]  # 0
+        data_received = self._i2c_bus.read(self._i2c_address, size=LV_I2C_STREAM_FRAME_SIZE,
+                                           timeout_ms=1000*timeout)
+        self._count_bytes(received=len(data_received))
+        # pump enabled, voltage, current, freq, 0, digital pressure, ana_c, 0
+        return [float(value) for value in LV_I2C_STREAM_FRAME.unpack_from(data_received)]
 
 
 
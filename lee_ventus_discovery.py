@@ -0,0 +1,208 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import concurrent.futures
+import json
+import os
+
+from lee_ventus_disc_pump import *
+from lee_ventus_serial_registry import LVSerialRegistry_statistics
+
+
+# default file the discovered pumps are cached in
+LV_DISCOVERY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".lee_ventus_discovery.json")
+
+
+# -----------------------------------------------------------------------------
+# Discovery functions
+# -----------------------------------------------------------------------------
+
+
+def LVDiscovery_scan(com_ports=None, i2c_adapters=None, i2c_addresses=range(0x08, 0x78), timeout=0.1) -> list[dict]:
+    """
+        Looks for pumps on serial ports and MCP2221 usb to I2C interfaces. Every serial port and every interface is
+        probed in parallel, the I2C addresses of one interface are probed one after the other as they share the bus.
+        A pump is found when it answers DEVICE_TYPE, FIRMWARE_VERSION and FIRMWARE_MINOR_VERSION within the timeout.
+
+        Args:
+            com_ports (list[str], optional): The serial ports to probe. Defaults to all the serial ports available.
+            i2c_adapters (list[int], optional): The indexes of the MCP2221 interfaces to probe. Defaults to all the
+                interfaces connected.
+            i2c_addresses (list[int], optional): The I2C addresses to probe on each interface. Defaults to 0x08-0x77,
+                the reserved addresses (including the general call address 0) are not probed.
+            timeout (float, optional): The time to wait for a pump to answer.
+        Returns:
+            list[dict]: One dictionary per pump found, see LVDiscovery_probe. Serial ports in use by this process
+                are included as busy.
+    """
+    if com_ports is None:
+        com_ports = LVDiscPump._serial_port_names()
+    if i2c_adapters is None:
+        try:
+            i2c_adapters = range(len(LVDiscPump._i2c_adapter_serial_numbers()))
+        except Exception:
+            # no usb to I2C interface support available
+            i2c_adapters = []
+
+    tasks = [({"com_port": com_port},) for com_port in com_ports] + \
+            [({"i2c_adapter": i2c_adapter}, list(i2c_addresses)) for i2c_adapter in i2c_adapters]
+    if len(tasks) == 0:
+        return []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="LVDiscovery") as executor:
+        futures = [executor.submit(_scan_com_port, task[0]["com_port"], timeout) if len(task) == 1 else
+                   executor.submit(_scan_i2c_adapter, task[0]["i2c_adapter"], task[1], timeout) for task in tasks]
+        return [pump for future in futures for pump in future.result()]
+
+
+def LVDiscovery_probe(com_port='', i2c_address=-1, i2c_adapter=0, timeout=0.1) -> dict:
+    """
+        Checks whether a pump answers on a serial port or at an I2C address. A serial port already in use by a pump
+        of this process is not probed, it is reported as busy.
+
+        Args:
+            com_port (str, optional): The COM port to probe e.g. "COM6".
+            i2c_address (int, optional): The I2C address to probe e.g. 37.
+            i2c_adapter (int, optional): The index of the MCP2221 interface of the I2C address.
+            timeout (float, optional): The time to wait for the pump to answer.
+        Returns:
+            dict: The connection settings ("com_port" or "i2c_address" and "i2c_adapter"), "device_type",
+                "firmware_version" and "firmware_minor_version" of the pump, {"com_port": com_port, "busy": True}
+                for a serial port in use, or None if no pump answered.
+    """
+    if com_port != '' and LVSerialRegistry_statistics().get(com_port, {}).get("users", 0) != 0:
+        return {"com_port": com_port, "busy": True}
+    disc_pump_instance = LVDiscPump()
+    try:
+        if com_port != '':
+            disc_pump_instance.connect_pump(com_port=com_port)
+            # the port is opened with a long read timeout, a probe must give up quickly
+            disc_pump_instance._com_port.timeout = timeout
+            pump = {"com_port": com_port}
+        else:
+            disc_pump_instance.connect_pump(i2c_address=i2c_address, i2c_adapter=i2c_adapter)
+            pump = {"i2c_address": i2c_address, "i2c_adapter": i2c_adapter}
+        values = disc_pump_instance.read_registers(_identification_registers, timeout=timeout)
+    except Exception:
+        return None
+    finally:
+        disc_pump_instance.disconnect_pump()
+
+    pump["device_type"] = int(values[LVRegister.DEVICE_TYPE])
+    pump["firmware_version"] = int(values[LVRegister.FIRMWARE_VERSION])
+    pump["firmware_minor_version"] = int(values[LVRegister.FIRMWARE_MINOR_VERSION])
+    return pump
+
+
+def LVDiscovery_find_pumps(cache_path=LV_DISCOVERY_CACHE_PATH, rescan=False, timeout=0.1) -> list[dict]:
+    """
+        Returns the pumps connected to this computer, using the pumps found last time when they are all still there.
+        The cached pumps are checked by probing just their own serial port or I2C address; if any of them no longer
+        answers with the same device type and firmware version a full scan is done and the cache is updated.
+        Cached pumps on serial ports in use by this process can't be probed, they are kept as they are.
+
+        Args:
+            cache_path (str, optional): The file the discovered pumps are cached in, None to not use a cache.
+            rescan (bool, optional): Optional setting to always do a full scan.
+            timeout (float, optional): The time to wait for each pump to answer.
+        Returns:
+            list[dict]: One dictionary per pump found, see LVDiscovery_probe.
+    """
+    cached_pumps = None
+    if cache_path is not None and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "r") as cache_file:
+                cached_pumps = json.load(cache_file)
+        except (OSError, ValueError):
+            cached_pumps = None
+        if not rescan and cached_pumps and _revalidate(cached_pumps, timeout):
+            return cached_pumps
+
+    pumps = LVDiscovery_scan(timeout=timeout)
+    # a busy port keeps the pump cached on it
+    cached_com_ports = {pump["com_port"]: pump for pump in cached_pumps or [] if "com_port" in pump}
+    pumps = [cached_com_ports.get(pump["com_port"], pump) if pump.get("busy") else pump for pump in pumps]
+    if cache_path is not None:
+        with open(cache_path, "w") as cache_file:
+            json.dump(pumps, cache_file, indent=2)
+    return pumps
+
+
+def LVDiscovery_connect_pump(pump: dict, background_reader=False) -> LVDiscPump:
+    """
+        Connects a discovered pump.
+
+        Args:
+            pump (dict): A pump returned by LVDiscovery_scan or LVDiscovery_find_pumps.
+            background_reader (bool, optional): Optional setting for UART pumps, see LVDiscPump.connect_pump.
+        Returns:
+            LVDiscPump: The connected pump.
+    """
+    disc_pump_instance = LVDiscPump()
+    if "com_port" in pump:
+        disc_pump_instance.connect_pump(com_port=pump["com_port"], background_reader=background_reader)
+    else:
+        disc_pump_instance.connect_pump(i2c_address=pump["i2c_address"], i2c_adapter=pump["i2c_adapter"])
+    return disc_pump_instance
+
+
+# -----------------------------------------------------------------------------
+# Internal functions
+# -----------------------------------------------------------------------------
+
+
+def _scan_com_port(com_port: str, timeout: float) -> list[dict]:
+    pump = LVDiscovery_probe(com_port=com_port, timeout=timeout)
+    return [] if pump is None else [pump]
+
+
+def _scan_i2c_adapter(i2c_adapter: int, i2c_addresses: list[int], timeout: float) -> list[dict]:
+    if len(i2c_addresses) == 0:
+        return []
+    # keeps the interface open between the probes of the different addresses
+    keep_open = LVDiscPump()
+    try:
+        keep_open.connect_pump(i2c_address=i2c_addresses[0], i2c_adapter=i2c_adapter)
+    except Exception:
+        return []
+    try:
+        pumps = [LVDiscovery_probe(i2c_address=i2c_address, i2c_adapter=i2c_adapter, timeout=timeout)
+                 for i2c_address in i2c_addresses]
+    finally:
+        keep_open.disconnect_pump()
+    return [pump for pump in pumps if pump is not None]
+
+
+def _revalidate(cached_pumps: list[dict], timeout: float) -> bool:
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(cached_pumps),
+                                               thread_name_prefix="LVDiscovery") as executor:
+        futures = [executor.submit(LVDiscovery_probe, timeout=timeout,
+                                   **{key: value for key, value in pump.items() if key in _connection_keys})
+                   for pump in cached_pumps]
+        return all(future.result() == pump or (future.result() or {}).get("busy", False)
+                   for future, pump in zip(futures, cached_pumps))
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+_identification_registers = [LVRegister.DEVICE_TYPE, LVRegister.FIRMWARE_VERSION, LVRegister.FIRMWARE_MINOR_VERSION]
+_connection_keys = ("com_port", "i2c_address", "i2c_adapter")
@@ -0,0 +1,349 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import math
+import threading
+import time
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+from lee_ventus_valve_sequencer import *
+
+
+# ***********************************************************************************
+# * LVDoseController class
+# ***********************************************************************************
+
+
+class LVDoseController:
+    """
+        Doses a target volume through a valve on a GPIO output. Each dose opens the valve with one pulse (a board
+        pulse when the pin mode allows, see LVValveSequencer) and the streamed FLOW is integrated from the valve
+        opening until the pulse duration plus a tail time have passed. The pulse duration of the next dose is then
+        corrected from the volume error, using the volume per second of valve opening measured on the dose.
+        Each streaming output costs a constant amount of work, so one host can run several dosing heads.
+
+        Example:
+            dosing = LVDoseController(pump, target_volume=5, initial_duration=0.05)   # e.g. 5 uL
+            dosing.start()
+            for _ in range(10):
+                print(dosing.dose())
+            dosing.stop()
+            print(dosing.statistics())
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def dose(self, wait=True, timeout=None):
+        """
+            Opens the valve for the current pulse duration to dose the target volume. The flow has to be streamed
+            while the dose is measured, by start() / run() or by passing the samples to add_sample().
+            Without wait the dose is only completed by the streamed samples. If none arrive it stays in progress
+            until one second after its window, the next dose() then abandons it.
+
+            Args:
+                wait (bool, optional): Optional setting to wait for the dose to be measured.
+                timeout (float, optional): Optional setting for the longest wait in seconds. Defaults to the pulse
+                    duration plus the tail time plus one second.
+            Returns:
+                dict: The dose (see results()) if wait is True and it was measured in time, None otherwise. A dose
+                that wasn't measured in time is abandoned and not included in the results.
+        """
+        with self._lock:
+            if self._open_time is not None:
+                if time.perf_counter() < self._close_time + 1:
+                    raise Exception('A dose is already in progress.')
+                # no samples completed the previous dose, e.g. the flow isn't streamed
+                self._open_time = None
+                self._close_time = None
+            duration = self._pulse_duration
+            self._dose_measured.clear()
+            # the window opens now as host timed pulses only return once the valve has closed again, the flow
+            # integrated before the valve actually opens is next to nothing
+            self._dose_duration = duration
+            self._volume = 0.0
+            self._open_time = time.perf_counter()
+            self._close_time = self._open_time + self._sequencer.configure_lead_time + duration + self.tail_time
+        try:
+            self._sequencer.clear()
+            self._sequencer.add_pulses(self.gpio, 0, duration)
+            self._sequencer.run()
+        except Exception:
+            # the valve may not have opened, the dose is abandoned so the next one can start
+            with self._lock:
+                self._open_time = None
+                self._close_time = None
+            raise
+        # the valve opened with the first state write
+        results = self._sequencer.results()
+        first_write = next(index for index, kind in enumerate(results["kind"]) if kind != "configure")
+        with self._lock:
+            if self._open_time is not None:
+                self._close_time = self._sequencer.start_time + float(results["delivered_time_s"][first_write]) \
+                    + duration + self.tail_time
+
+        if not wait:
+            return None
+        if timeout is None:
+            timeout = duration + self.tail_time + 1
+        if not self._dose_measured.wait(timeout):
+            with self._lock:
+                if not self._dose_measured.is_set():
+                    # e.g. the flow isn't streamed, abandon the dose so the next one can start
+                    self._open_time = None
+                    self._close_time = None
+                    return None
+        return self._last_dose
+
+    def add_sample(self, flow: float, sample_time: float):
+        """
+            Adds one flow measurement. The flow is integrated (trapezoidal rule) over the part of the time since the
+            previous sample that falls within the open window of the dose, and the dose is completed once the window
+            has passed.
+
+            Args:
+                flow (float): The flow in the FLOW_MEAS_UNIT unit of the pump (per minute).
+                sample_time (float): The time.perf_counter() value the flow was measured at.
+            Returns:
+                None
+        """
+        with self._lock:
+            previous_flow, previous_time = self._previous_flow, self._previous_time
+            self._previous_flow, self._previous_time = flow, sample_time
+            if self._open_time is None or previous_time is None:
+                return
+            overlap = min(sample_time, self._close_time) - max(previous_time, self._open_time)
+            if overlap > 0:
+                self._volume += overlap * (previous_flow + flow) / 2 / 60
+            if sample_time >= self._close_time:
+                self._complete_dose()
+
+    def run(self, duration=None):
+        """
+            Enables streaming and integrates the streamed flow until the duration has passed or stop() is called.
+            The outputs received together are spread evenly over the time since the previous ones.
+
+            Args:
+                duration (float, optional): The time to run for in seconds, None to run until stopped.
+            Returns:
+                None
+        """
+        self._running = True
+        try:
+            self.disc_pump_instance.streaming_mode_enable()
+            start_time = time.perf_counter()
+            previous_receive_time = None
+            while self._running and (duration is None or time.perf_counter() - start_time < duration):
+                outputs = self.disc_pump_instance.streaming_mode_get_outputs(timeout=0.1)
+                if len(outputs) == 0:
+                    continue
+                receive_time = time.perf_counter()
+                if previous_receive_time is None:
+                    previous_receive_time = receive_time - len(outputs) * self.sample_period
+                spacing = (receive_time - previous_receive_time) / len(outputs)
+                for index, flow in enumerate(outputs[:, LVStreamingModeOutputIndexes.FLOW]):
+                    self.add_sample(float(flow), previous_receive_time + (index + 1) * spacing)
+                previous_receive_time = receive_time
+        finally:
+            self._running = False
+
+    def start(self, duration=None):
+        """
+            Runs the flow integration on a background thread, see run(). If it fails the exception is raised again
+            by stop().
+
+            Args:
+                duration (float, optional): The time to run for in seconds, None to run until stopped.
+            Returns:
+                None
+        """
+        self._running = True
+        self._exception = None
+        self._thread = threading.Thread(target=self._run_thread, args=(duration,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops the flow integration and waits for the background thread if there is one. Raises the exception
+            that stopped the background thread, if any.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    def results(self) -> dict:
+        """
+            Returns the doses measured so far.
+
+            Args:
+
+            Returns:
+                dict: NumPy arrays with the pulse "duration_s" of each dose, the "volume" measured and its "error"
+                    from the target volume, in the volume unit of the pump (see volume_unit).
+        """
+        with self._lock:
+            doses = np.array(self._doses, dtype=np.float64).reshape(-1, 3)
+        return {"duration_s": doses[:, 0], "volume": doses[:, 1], "error": doses[:, 2]}
+
+    def statistics(self) -> dict:
+        """
+            Returns the dose volume statistics, kept as running sums.
+
+            Args:
+
+            Returns:
+                dict: The number of doses, the mean and standard deviation of the volume, its coefficient of variation
+                    in percent and the mean and maximum absolute error from the target volume.
+        """
+        with self._lock:
+            number_doses, mean, sum_squares = self._number_doses, self._mean_volume, self._sum_squares
+            total_abs_error, max_abs_error = self._total_abs_error, self._max_abs_error
+        std = math.sqrt(sum_squares / (number_doses - 1)) if number_doses > 1 else 0.0
+        return {"doses": number_doses,
+                "mean_volume": mean,
+                "std_volume": std,
+                "cv_percent": std / mean * 100 if mean != 0 else 0.0,
+                "mean_abs_error": total_abs_error / number_doses if number_doses != 0 else 0.0,
+                "max_abs_error": max_abs_error,
+                "volume_unit": self.volume_unit}
+
+    @property
+    def pulse_duration(self) -> float:
+        """
+            The pulse duration of the next dose in seconds.
+        """
+        return self._pulse_duration
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, disc_pump_instance: LVDiscPump, target_volume: float, initial_duration: float, gpio="B",
+                 adaptation_gain=0.5, min_duration=0.001, max_duration=30, tail_time=0.1, sample_period=0.01):
+        """
+            Reads the FLOW_MEAS_UNIT of the pump, the volumes are in its volume unit (e.g. uL for uL/min).
+
+            Args:
+                disc_pump_instance (LVDiscPump): The connected pump.
+                target_volume (float): The volume of each dose.
+                initial_duration (float): The pulse duration of the first dose in seconds.
+                gpio (str, optional): The GPIO output of the valve, "A", "B", "C" or "D".
+                adaptation_gain (float, optional): The fraction of the pulse duration correction applied after each
+                    dose, between 0 and 1. Lower values average out the noise of the measured volume.
+                min_duration (float, optional): The shortest pulse duration in seconds.
+                max_duration (float, optional): The longest pulse duration in seconds.
+                tail_time (float, optional): The time after the valve closes that the flow is still integrated, to
+                    include the delay of the flow measurement.
+                sample_period (float, optional): The nominal time between streaming outputs in seconds, used to time
+                    the first outputs received.
+        """
+        self.disc_pump_instance = disc_pump_instance
+        self.target_volume = target_volume
+        self.gpio = gpio
+        self.adaptation_gain = adaptation_gain
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.tail_time = tail_time
+        self.sample_period = sample_period
+        self.volume_unit = _VOLUME_UNITS.get(disc_pump_instance.read_register(LVRegister.FLOW_MEAS_UNIT), "")
+        self._sequencer = LVValveSequencer(disc_pump_instance)
+        self._pulse_duration = initial_duration
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self._exception = None   # exception raised on the background thread, raised again by stop()
+
+        # dose being measured
+        self._open_time = None
+        self._close_time = None
+        self._dose_duration = 0.0
+        self._volume = 0.0
+        self._previous_flow = 0.0
+        self._previous_time = None
+        self._dose_measured = threading.Event()
+        self._last_dose = None
+
+        # doses measured (duration, volume, error) and running statistics of the volume
+        self._doses = []
+        self._number_doses = 0
+        self._mean_volume = 0.0
+        self._sum_squares = 0.0
+        self._total_abs_error = 0.0
+        self._max_abs_error = 0.0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _run_thread(self, duration):
+        try:
+            self.run(duration)
+        except Exception as e:
+            self._exception = e
+
+    def _complete_dose(self):
+        # called with the lock held
+        volume, duration = self._volume, self._dose_duration
+        error = self.target_volume - volume
+        self._doses.append((duration, volume, error))
+        self._last_dose = {"duration_s": duration, "volume": volume, "error": error}
+
+        # running mean and variance (Welford)
+        self._number_doses += 1
+        delta = volume - self._mean_volume
+        self._mean_volume += delta / self._number_doses
+        self._sum_squares += delta * (volume - self._mean_volume)
+        self._total_abs_error += abs(error)
+        self._max_abs_error = max(self._max_abs_error, abs(error))
+
+        # correct the pulse duration with the volume per second of opening measured on this dose
+        if volume > 0:
+            self._pulse_duration = min(self.max_duration, max(
+                self.min_duration, duration + self.adaptation_gain * error * duration / volume))
+        self._open_time = None
+        self._dose_measured.set()
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+# volume unit of each flow unit (per minute)
+_VOLUME_UNITS = {LVMeasUnits.FLOW_L_PER_MIN: "L",
+                 LVMeasUnits.FLOW_mL_PER_MIN: "mL",
+                 LVMeasUnits.FLOW_uL_PER_MIN: "uL",
+                 LVMeasUnits.FLOW_nL_PER_MIN: "nL"}
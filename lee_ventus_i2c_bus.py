@@ -0,0 +1,237 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import collections
+import threading
+import time
+
+
+# ***********************************************************************************
+# * LVI2CBus class
+# ***********************************************************************************
+
+
+class LVI2CBus:
+    """
+        Owns a MCP2221 usb to I2C interface and shares it safely between threads. Every transaction (a write, a read,
+        or a register select write followed by its read) holds the bus until it is complete, so transactions for
+        different pumps can't interleave. When several threads are waiting, the bus is handed over in round-robin
+        order of the I2C addresses or, with the PRIORITY policy, to the address with the highest priority first.
+        The waiting is done by the calling threads themselves, an idle bus is taken without any hand over.
+    """
+
+    ROUND_ROBIN = "round_robin"
+    PRIORITY = "priority"
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def write(self, address: int, data: bytes):
+        """
+            Writes bytes to an I2C device.
+
+            Args:
+                address (int): The I2C address of the device.
+                data (bytes): The bytes to write.
+            Returns:
+                None
+        """
+        self.transaction(address, lambda device: device.I2C_write(addr=address, data=data))
+
+    def read(self, address: int, size: int, timeout_ms=20) -> bytes:
+        """
+            Reads bytes from an I2C device.
+
+            Args:
+                address (int): The I2C address of the device.
+                size (int): The number of bytes to read.
+                timeout_ms (int, optional): The read timeout in milliseconds.
+            Returns:
+                bytes: The bytes read.
+        """
+        return self.transaction(address, lambda device: device.I2C_read(addr=address, size=size,
+                                                                        timeout_ms=timeout_ms))
+
+    def write_then_read(self, address: int, data: bytes, size: int, timeout_ms=20) -> bytes:
+        """
+            Writes bytes to an I2C device and reads its answer, without any other transaction in between.
+
+            Args:
+                address (int): The I2C address of the device.
+                data (bytes): The bytes to write, e.g. the register to be read.
+                size (int): The number of bytes to read.
+                timeout_ms (int, optional): The read timeout in milliseconds.
+            Returns:
+                bytes: The bytes read.
+        """
+        def write_then_read(device):
+            device.I2C_write(addr=address, data=data)
+            return device.I2C_read(addr=address, size=size, timeout_ms=timeout_ms)
+        return self.transaction(address, write_then_read)
+
+    def transaction(self, address: int, function):
+        """
+            Runs a function with exclusive use of the bus. The function must use the device it is given and not call
+            back into the bus.
+
+            Args:
+                address (int): The I2C address the transaction is for, used for scheduling and statistics.
+                function: The function to be called with the MCP2221 device.
+            Returns:
+                The value returned by the function.
+        """
+        wait_time = self._acquire(address)
+        start_time = time.perf_counter()
+        try:
+            return function(self._device)
+        finally:
+            self._release(address, wait_time, time.perf_counter() - start_time)
+
+    def set_priority(self, address: int, priority: int):
+        """
+            Sets the priority of an I2C address for the PRIORITY policy. Higher values are served first.
+
+            Args:
+                address (int): The I2C address.
+                priority (int): The priority, 0 by default.
+            Returns:
+                None
+        """
+        with self._condition:
+            self._priorities[address] = priority
+
+    def statistics(self) -> dict:
+        """
+            Returns the bus utilization since the statistics were reset.
+
+            Args:
+
+            Returns:
+                dict: The fraction of the time the bus was in use, and per I2C address the number of transactions,
+                    the time the bus was held and the time spent waiting for it.
+        """
+        with self._condition:
+            elapsed = time.perf_counter() - self._statistics_start_time
+            busy_time = sum(statistics[1] for statistics in self._statistics.values())
+            return {"elapsed_s": elapsed,
+                    "busy_s": busy_time,
+                    "utilization": busy_time / elapsed if elapsed > 0 else 0.0,
+                    "addresses": {address: {"transactions": transactions,
+                                            "busy_s": address_busy_time,
+                                            "mean_wait_s": total_wait / transactions if transactions != 0 else 0.0,
+                                            "max_wait_s": max_wait}
+                                  for address, (transactions, address_busy_time, total_wait, max_wait)
+                                  in sorted(self._statistics.items())}}
+
+    def reset_statistics(self):
+        """
+            Clears the bus statistics.
+
+            Args:
+
+            Returns:
+                None
+        """
+        with self._condition:
+            self._statistics.clear()
+            self._statistics_start_time = time.perf_counter()
+
+    @property
+    def device(self):
+        """
+            The MCP2221 device. Only use it directly when no other thread is using the bus.
+        """
+        return self._device
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, device, policy=ROUND_ROBIN):
+        """
+            Args:
+                device: The MCP2221 device, e.g. EasyMCP2221.Device().
+                policy (str, optional): LVI2CBus.ROUND_ROBIN or LVI2CBus.PRIORITY.
+        """
+        if policy not in (LVI2CBus.ROUND_ROBIN, LVI2CBus.PRIORITY):
+            raise ValueError(f'Unknown I2C bus policy {policy}')
+        self._device = device
+        self.policy = policy
+        self._condition = threading.Condition()
+        self._busy = False
+        self._waiting = collections.defaultdict(collections.deque)   # per address queue of waiting requests
+        self._number_waiting = 0
+        self._number_served = 0
+        self._last_served = {}   # per address, the value of _number_served when it last got the bus
+        self._priorities = {}
+
+        # per address: [transactions, busy time, total wait time, max wait time]
+        self._statistics = collections.defaultdict(lambda: [0, 0.0, 0.0, 0.0])
+        self._statistics_start_time = time.perf_counter()
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _acquire(self, address: int) -> float:
+        with self._condition:
+            if not self._busy and self._number_waiting == 0:
+                self._busy = True
+                self._mark_served(address)
+                return 0.0
+            start_time = time.perf_counter()
+            request = [False]   # set to True when the bus is handed over to this request
+            self._waiting[address].append(request)
+            self._number_waiting += 1
+            while not request[0]:
+                self._condition.wait()
+            return time.perf_counter() - start_time
+
+    def _release(self, address: int, wait_time: float, busy_time: float):
+        with self._condition:
+            statistics = self._statistics[address]
+            statistics[0] += 1
+            statistics[1] += busy_time
+            statistics[2] += wait_time
+            statistics[3] = max(statistics[3], wait_time)
+
+            if self._number_waiting == 0:
+                self._busy = False
+                return
+            next_address = self._next_address()
+            self._waiting[next_address].popleft()[0] = True
+            if len(self._waiting[next_address]) == 0:
+                del self._waiting[next_address]
+            self._number_waiting -= 1
+            self._mark_served(next_address)
+            self._condition.notify_all()
+
+    def _next_address(self) -> int:
+        addresses = self._waiting.keys()
+        if self.policy == LVI2CBus.PRIORITY:
+            highest_priority = max(self._priorities.get(address, 0) for address in addresses)
+            addresses = [address for address in addresses if self._priorities.get(address, 0) == highest_priority]
+        # the address that has gone the longest without the bus
+        return min(addresses, key=lambda address: self._last_served.get(address, -1))
+
+    def _mark_served(self, address: int):
+        self._number_served += 1
+        self._last_served[address] = self._number_served
@@ -0,0 +1,238 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import asyncio
+import bisect
+import threading
+import time
+
+from EasyMCP2221.exceptions import NotAckError
+from EasyMCP2221.exceptions import TimeoutError as I2CTimeoutError
+
+from lee_ventus_register import LVTimeoutError
+
+
+# ***********************************************************************************
+# * LVInstrumentation class
+# ***********************************************************************************
+
+
+class LVInstrumentation:
+    """
+        Per pump counters and timers for the LVDiscPump I/O calls. Statistics are kept per operation (e.g.
+        "read_register") and register ID: call counts, failures, timeouts, I2C NACKs, bytes sent and received and a
+        latency histogram. Calls for several registers (e.g. "read_registers") are counted for each of them. The
+        pump level totals also count the bytes and the lines discarded because they could not be decoded.
+        Enable it with LVDiscPump.instrumentation_enable().
+    """
+
+    # upper edges of the latency histogram buckets in seconds, the last bucket holds everything slower
+    LATENCY_BUCKETS = (0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5, 1, 2)
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def call(self, operation: str, reg_id, function, empty_is_timeout=False):
+        """
+            Calls a function and records its latency, failures and the bytes it transferred.
+            Failures raising LVTimeoutError, an I2C TimeoutError or asyncio.TimeoutError count as timeouts, failures
+            raising an I2C NotAckError count as NACKs.
+
+            Args:
+                operation (str): The name of the operation e.g. "read_register".
+                reg_id (int, list[int] or None): The register ID the operation is for, a list of them if it is for
+                    several registers, or None if it is not for a register. With a list every register is counted
+                    with the latency of the whole call and a share of its bytes.
+                function: The function to be called, without arguments.
+                empty_is_timeout (bool, optional): Optional setting to also count a None or empty result as a timeout,
+                    for reads that return nothing instead of failing.
+            Returns:
+                The value returned by the function.
+        """
+        all_statistics = self._get_all_statistics(operation, reg_id)
+        self._current.statistics = all_statistics
+        start_time = time.perf_counter()
+        exception = None
+        try:
+            result = function()
+        except Exception as e:
+            exception = e
+            raise
+        finally:
+            self._current.statistics = None
+            self._record(all_statistics, time.perf_counter() - start_time, exception)
+        if empty_is_timeout and (result is None or len(result) == 0):
+            with self._lock:
+                for statistics in all_statistics:
+                    statistics[_TIMEOUTS] += 1
+        return result
+
+    def record(self, operation: str, reg_id, latency: float, exception=None):
+        """
+            Records a call that was not made through call(), e.g. a read awaited on an asyncio event loop.
+
+            Args:
+                operation (str): The name of the operation e.g. "read_registers".
+                reg_id (int, list[int] or None): The register ID or IDs the operation is for, see call().
+                latency (float): The duration of the call in seconds.
+                exception (Exception, optional): The exception the call failed with, None if it succeeded.
+            Returns:
+                None
+        """
+        self._record(self._get_all_statistics(operation, reg_id), latency, exception)
+
+    def count_bytes(self, sent=0, received=0, discarded_lines=0):
+        """
+            Adds to the bytes transferred by the pump and by the operation currently being measured.
+
+            Args:
+                sent (int, optional): The number of bytes sent.
+                received (int, optional): The number of bytes received.
+                discarded_lines (int, optional): The number of received lines that could not be decoded.
+            Returns:
+                None
+        """
+        all_statistics = getattr(self._current, 'statistics', None)
+        with self._lock:
+            self._bytes_sent += sent
+            self._bytes_received += received
+            self._discarded_lines += discarded_lines
+            if all_statistics is not None:
+                # the bytes of a call for several registers are shared out between them
+                number_registers = len(all_statistics)
+                for index, statistics in enumerate(all_statistics):
+                    statistics[_BYTES_SENT] += (sent * (index + 1)) // number_registers \
+                        - (sent * index) // number_registers
+                    statistics[_BYTES_RECEIVED] += (received * (index + 1)) // number_registers \
+                        - (received * index) // number_registers
+
+    def snapshot(self) -> dict:
+        """
+            Returns a copy of all the statistics.
+
+            Args:
+
+            Returns:
+                dict: The pump level totals and a list of per operation and register statistics.
+        """
+        bucket_names = [f'<={bucket * 1000:g}ms' for bucket in self.LATENCY_BUCKETS] + \
+                       [f'>{self.LATENCY_BUCKETS[-1] * 1000:g}ms']
+        with self._lock:
+            calls = []
+            for (operation, reg_id), statistics in self._statistics.items():
+                calls.append({"operation": operation,
+                              "reg_id": reg_id,
+                              "calls": statistics[_CALLS],
+                              "failures": statistics[_FAILURES],
+                              "timeouts": statistics[_TIMEOUTS],
+                              "nacks": statistics[_NACKS],
+                              "bytes_sent": statistics[_BYTES_SENT],
+                              "bytes_received": statistics[_BYTES_RECEIVED],
+                              "mean_latency_s": statistics[_TOTAL_LATENCY] / statistics[_CALLS]
+                              if statistics[_CALLS] != 0 else 0.0,
+                              "max_latency_s": statistics[_MAX_LATENCY],
+                              "latency_histogram": dict(zip(bucket_names, statistics[_HISTOGRAM]))})
+            return {"bytes_sent": self._bytes_sent,
+                    "bytes_received": self._bytes_received,
+                    "discarded_lines": self._discarded_lines,
+                    "calls": calls}
+
+    def reset(self):
+        """
+            Clears all the statistics.
+
+            Args:
+
+            Returns:
+                None
+        """
+        with self._lock:
+            self._statistics.clear()
+            self._bytes_sent = 0
+            self._bytes_received = 0
+            self._discarded_lines = 0
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = threading.local()   # statistics of the operation being measured on each thread
+        self._statistics = {}
+        self._bytes_sent = 0
+        self._bytes_received = 0
+        self._discarded_lines = 0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _get_all_statistics(self, operation: str, reg_id) -> list:
+        if isinstance(reg_id, (list, tuple)):
+            if len(reg_id) == 0:
+                return [self._get_statistics(operation, None)]
+            return [self._get_statistics(operation, one_reg_id) for one_reg_id in reg_id]
+        return [self._get_statistics(operation, reg_id)]
+
+    def _record(self, all_statistics: list, latency: float, exception):
+        bucket = bisect.bisect_left(self.LATENCY_BUCKETS, latency)
+        with self._lock:
+            for statistics in all_statistics:
+                statistics[_CALLS] += 1
+                statistics[_TOTAL_LATENCY] += latency
+                statistics[_MAX_LATENCY] = max(statistics[_MAX_LATENCY], latency)
+                statistics[_HISTOGRAM][bucket] += 1
+                if exception is not None:
+                    statistics[_FAILURES] += 1
+                    if isinstance(exception, _TIMEOUT_ERRORS):
+                        statistics[_TIMEOUTS] += 1
+                    elif isinstance(exception, NotAckError):
+                        statistics[_NACKS] += 1
+
+    def _get_statistics(self, operation: str, reg_id) -> list:
+        key = (operation, None if reg_id is None else int(reg_id))
+        statistics = self._statistics.get(key)
+        if statistics is None:
+            with self._lock:
+                statistics = self._statistics.setdefault(key, [0, 0, 0, 0, 0, 0, 0.0, 0.0,
+                                                               [0] * (len(self.LATENCY_BUCKETS) + 1)])
+        return statistics
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+# indexes of the per operation statistics (kept in a list to make updating them cheap)
+_CALLS = 0
+_FAILURES = 1
+_TIMEOUTS = 2
+_NACKS = 3
+_BYTES_SENT = 4
+_BYTES_RECEIVED = 5
+_TOTAL_LATENCY = 6
+_MAX_LATENCY = 7
+_HISTOGRAM = 8
+
+# exceptions counted as timeouts: no reply over UART, an I2C transaction timing out and asyncio waits running out
+_TIMEOUT_ERRORS = (LVTimeoutError, I2CTimeoutError, asyncio.TimeoutError)
@@ -0,0 +1,187 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import concurrent.futures
+import functools
+import os
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+
+
+# -----------------------------------------------------------------------------
+# PID sweep functions
+# -----------------------------------------------------------------------------
+
+
+def LVPidSweep_simulate(model: dict, p_terms, i_terms, d_terms, setpoint: float, duration=3.0, control_period=0.001,
+                        power_limit=1000, integral_limit=1400, settling_band=0.05) -> dict:
+    """
+        Simulates a set point step in the PID control mode of the firmware for many sets of gains at once. The pump is
+        modelled as a first-order-plus-dead-time response to the drive power, starting at rest with no power. Every
+        control period the firmware PID is stepped for all the gains together: power = P * error + integral +
+        D * derivative of the error, where the integral adds I * error * period and is limited to +/- the integral
+        limit, and the power is limited to 0 - power limit.
+
+        Args:
+            model (dict): "gain", "time_constant", "dead_time" and "offset" of the pump, see LVAutotune_fit_fopdt.
+            p_terms (np.ndarray): The proportional term of each simulation.
+            i_terms (np.ndarray): The integral term of each simulation, same shape as p_terms.
+            d_terms (np.ndarray): The differential term of each simulation, same shape as p_terms.
+            setpoint (float): The set point of the step.
+            duration (float, optional): The simulated time in seconds.
+            control_period (float, optional): The period of the firmware control loop in seconds.
+            power_limit (float, optional): The POWER_LIMIT_MILLIWATTS register.
+            integral_limit (float, optional): The PID_INTEGRAL_LIMIT_COEFF register.
+            settling_band (float, optional): The band around the set point the response has to stay in to be
+                settled, as a fraction of the step size.
+        Returns:
+            dict: Arrays of the shape of p_terms: "overshoot_percent" of the step size, "settling_time_s" (NaN if the
+                response did not settle) and "energy_j" the drive energy used in joules.
+    """
+    p_terms = np.asarray(p_terms, dtype=np.float64)
+    shape = p_terms.shape
+    p_terms = p_terms.ravel()
+    i_terms = np.asarray(i_terms, dtype=np.float64).ravel()
+    d_terms = np.asarray(d_terms, dtype=np.float64).ravel()
+
+    decay = 1 - np.exp(-control_period / model["time_constant"])
+    number_steps = int(round(duration / control_period))
+    delay_steps = int(round(model["dead_time"] / control_period))
+    initial = float(model["offset"])
+    step = float(setpoint) - initial
+
+    response = np.full(len(p_terms), initial, dtype=np.float64)
+    integral = np.zeros(len(p_terms))
+    previous_error = np.full(len(p_terms), step, dtype=np.float64)
+    delayed_power = np.zeros((delay_steps + 1, len(p_terms)))   # ring buffer of the powers still in the dead time
+    peak = response.copy()
+    last_outside = np.zeros(len(p_terms))
+    energy = np.zeros(len(p_terms))
+
+    for index in range(number_steps):
+        error = setpoint - response
+        integral = np.clip(integral + i_terms * error * control_period, -integral_limit, integral_limit)
+        power = np.clip(p_terms * error + integral + d_terms * (error - previous_error) / control_period,
+                        0, power_limit)
+        previous_error = error
+        energy += power * control_period
+
+        delayed_power[index % (delay_steps + 1)] = power
+        response += decay * (initial + model["gain"] * delayed_power[(index + 1) % (delay_steps + 1)] - response)
+
+        if step > 0:
+            np.maximum(peak, response, out=peak)
+        else:
+            np.minimum(peak, response, out=peak)
+        last_outside[np.abs(response - setpoint) > settling_band * abs(step)] = (index + 1) * control_period
+
+    settling_time = np.where(last_outside >= number_steps * control_period, np.nan, last_outside)
+    return {"overshoot_percent": (np.maximum(0, (peak - setpoint) / step) * 100).reshape(shape),
+            "settling_time_s": settling_time.reshape(shape),
+            "energy_j": (energy / 1000).reshape(shape)}
+
+
+def LVPidSweep_grid(model: dict, p_terms, i_terms, d_terms=(0,), setpoint=100, number_processes=None,
+                    chunk_size=4096, **simulation_settings) -> dict:
+    """
+        Evaluates every combination of the given gains with LVPidSweep_simulate. The grid is split into chunks
+        that are simulated in parallel on a pool of processes. Scripts using it need the usual
+        "if __name__ == '__main__':" guard for process pools.
+
+        Args:
+            model (dict): The pump model, see LVPidSweep_simulate.
+            p_terms (list[float]): The proportional terms to try.
+            i_terms (list[float]): The integral terms to try.
+            d_terms (list[float], optional): The differential terms to try.
+            setpoint (float, optional): The set point of the step.
+            number_processes (int, optional): The number of processes. Defaults to the number of CPUs, 1 runs
+                everything in this process.
+            chunk_size (int, optional): The number of gain combinations simulated together by each task.
+            **simulation_settings: The other settings of LVPidSweep_simulate, e.g. power_limit or duration.
+        Returns:
+            dict: The gain axes "p_terms", "i_terms" and "d_terms", and the cost surfaces "overshoot_percent",
+                "settling_time_s" and "energy_j" of shape (len(p_terms), len(i_terms), len(d_terms)).
+    """
+    axes = [np.asarray(terms, dtype=np.float64) for terms in (p_terms, i_terms, d_terms)]
+    grids = [grid.ravel() for grid in np.meshgrid(*axes, indexing='ij')]
+    shape = tuple(len(axis) for axis in axes)
+    chunks = [slice(start, start + chunk_size) for start in range(0, len(grids[0]), chunk_size)]
+    simulate = functools.partial(_simulate_chunk, model, setpoint, simulation_settings)
+    tasks = [(grids[0][chunk], grids[1][chunk], grids[2][chunk]) for chunk in chunks]
+
+    if number_processes is None:
+        number_processes = os.cpu_count() or 1
+    if number_processes <= 1 or len(tasks) == 1:
+        results = [simulate(task) for task in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=min(number_processes, len(tasks))) as executor:
+            results = list(executor.map(simulate, tasks))
+
+    surfaces = {"p_terms": axes[0], "i_terms": axes[1], "d_terms": axes[2]}
+    for name in ("overshoot_percent", "settling_time_s", "energy_j"):
+        surfaces[name] = np.concatenate([result[name] for result in results]).reshape(shape)
+    return surfaces
+
+
+def LVPidSweep_best_gains(surfaces: dict, max_overshoot_percent=5.0) -> tuple[float, float, float]:
+    """
+        Picks the gains that settle fastest without overshooting more than a limit.
+
+        Args:
+            surfaces (dict): The cost surfaces returned by LVPidSweep_grid.
+            max_overshoot_percent (float, optional): The largest overshoot allowed.
+        Returns:
+            tuple[float, float, float]: The proportional, integral and differential terms, or None if no gains
+                settle within the overshoot limit.
+    """
+    settling_time = np.where(surfaces["overshoot_percent"] <= max_overshoot_percent,
+                             surfaces["settling_time_s"], np.nan)
+    if np.all(np.isnan(settling_time)):
+        return None
+    p_index, i_index, d_index = np.unravel_index(np.nanargmin(settling_time), settling_time.shape)
+    return (float(surfaces["p_terms"][p_index]), float(surfaces["i_terms"][i_index]),
+            float(surfaces["d_terms"][d_index]))
+
+
+def LVPidSweep_settings_from_pump(disc_pump_instance: LVDiscPump) -> dict:
+    """
+        Reads the registers of a pump that limit its PID, to simulate it with the same settings.
+
+        Args:
+            disc_pump_instance (LVDiscPump): The connected pump.
+        Returns:
+            dict: "power_limit" and "integral_limit", to be passed on to LVPidSweep_simulate or LVPidSweep_grid.
+    """
+    values = disc_pump_instance.read_registers([LVRegister.POWER_LIMIT_MILLIWATTS,
+                                                LVRegister.PID_INTEGRAL_LIMIT_COEFF])
+    return {"power_limit": values[LVRegister.POWER_LIMIT_MILLIWATTS],
+            "integral_limit": values[LVRegister.PID_INTEGRAL_LIMIT_COEFF]}
+
+
+# -----------------------------------------------------------------------------
+# Internal functions
+# -----------------------------------------------------------------------------
+
+
+def _simulate_chunk(model: dict, setpoint: float, simulation_settings: dict, gains: tuple) -> dict:
+    # module level so it can be sent to the worker processes
+    return LVPidSweep_simulate(model, gains[0], gains[1], gains[2], setpoint, **simulation_settings)
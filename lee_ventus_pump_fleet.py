@@ -0,0 +1,222 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import concurrent.futures
+import gc
+import threading
+import time
+
+from lee_ventus_disc_pump import *
+from lee_ventus_scheduler import LVScheduler_sleep_until
+
+
+# ***********************************************************************************
+# * LVPumpFleet class
+# ***********************************************************************************
+
+
+class LVPumpFleet:
+    """
+        Runs the same operation on many connected pumps in parallel. Each link (the serial port of a UART pump or
+        the MCP2221 interface of I2C pumps) has its own worker thread: pumps on different links are driven at the
+        same time and pumps sharing an I2C bus take turns on it.
+        broadcast() writes a register on all the pumps as close to the same moment as the links allow and reports
+        the skew achieved.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def run(self, function, *args, **kwargs) -> list:
+        """
+            Calls function(pump, *args, **kwargs) for every pump, in parallel across links. If any call fails the
+            first exception is raised once all the calls are complete.
+
+            Args:
+                function: The function to be called for each pump, e.g.
+                    LVDiscPump.set_manual_power_control_with_set_val.
+                *args, **kwargs: The other arguments of the function.
+            Returns:
+                list: The value returned for each pump, in the order of the pumps.
+        """
+        links, futures = self._submit(function, *args, **kwargs)
+        return self._results(links, futures)
+        for link, future in futures.items():
+            for pump, result in zip(links[link], future.result()):
+                results[id(pump)] = result
+        for result in results.values():
+            if isinstance(result, _LVFleetError):
+                raise result.exception
+        return [results[id(pump)] for pump in self.pumps]
+
+    def write_reg(self, reg_id: int, value, rounding_decimal_places=3, sleep_after=0.005):
+        """
+            Writes a value to a given register on every pump.
+
+            Args:
+                reg_id (int): The register ID to write to.
+                value (int or float): The value to write to the register.
+                rounding_decimal_places (int, optional): The number of decimal places to round to.
+                sleep_after (float, optional): The time to wait after writing the register.
+            Returns:
+                None
+        """
+        self.run(LVDiscPump.write_reg, reg_id, value, rounding_decimal_places, sleep_after)
+
+    def read_register(self, reg_id: int, timeout=1) -> list[float]:
+        """
+            Reads the value of a given register from every pump.
+
+            Args:
+                reg_id (int): The register ID to read from.
+                timeout (float, optional): The time to wait for a response from each pump.
+            Returns:
+                list[float]: The value of the register for each pump, in the order of the pumps.
+        """
+        return self.run(LVDiscPump.read_register, reg_id, timeout)
+
+    def broadcast(self, reg_id: int, value, rounding_decimal_places=3, lead_time=0.02) -> dict:
+        """
+            Writes a register on all the pumps at the same moment, e.g. to start or stop them together. The link
+            workers block on an event that the calling thread sets at a common start time (the calling thread is the
+            only one spinning for it), then write to their pumps without any sleep after the writes. The garbage
+            collector is paused for the duration of the broadcast.
+            The register is always sent, even if a pump's register cache already holds the value.
+
+            Args:
+                reg_id (int): The register ID to write to.
+                value (int or float): The value to write to the register.
+                rounding_decimal_places (int, optional): The number of decimal places to round to.
+                lead_time (float, optional): The time given to the workers to get ready before the common start time.
+            Returns:
+                dict: The skew in seconds between the first and the last completed write, and for each pump the time
+                    its write completed relative to the common start time, in the order of the pumps.
+        """
+        start_time = time.perf_counter() + lead_time
+        start_event = threading.Event()
+
+        def write_at_start_time(pump):
+            pump.register_cache_invalidate(reg_id)
+            start_event.wait()
+            pump.write_reg(reg_id, value, rounding_decimal_places, sleep_after=0)
+            return time.perf_counter() - start_time
+
+        # a garbage collection pass during the writes would hold up the workers for milliseconds
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            links, futures = self._submit(write_at_start_time)
+            try:
+                LVScheduler_sleep_until(start_time)
+            finally:
+                start_event.set()
+            write_times = self._results(links, futures)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        return {"skew_s": max(write_times) - min(write_times) if len(write_times) != 0 else 0.0,
+                "write_times_s": write_times}
+
+    def close(self):
+        """
+            Stops the worker threads. The pumps are not disconnected.
+
+            Args:
+
+            Returns:
+                None
+        """
+        for executor in self._executors.values():
+            executor.shutdown()
+        self._executors.clear()
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, pumps: list[LVDiscPump]):
+        """
+            Args:
+                pumps (list[LVDiscPump]): The pumps of the fleet, already connected.
+        """
+        self.pumps = list(pumps)
+        self._executors = {}
+
+    def __del__(self):
+        self.close()
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _submit(self, function, *args, **kwargs) -> tuple[dict, dict]:
+        # one task per link, each calling the function for the pumps of its link in turn
+        links = self._links()
+        futures = {}
+        for link, pumps in links.items():
+            futures[link] = self._executor(link).submit(
+                lambda link_pumps: [self._call(function, pump, *args, **kwargs) for pump in link_pumps], pumps)
+        return links, futures
+
+    def _results(self, links: dict, futures: dict) -> list:
+        results = {}
+        for link, future in futures.items():
+            for pump, result in zip(links[link], future.result()):
+                results[id(pump)] = result
+        for result in results.values():
+            if isinstance(result, _LVFleetError):
+                raise result.exception
+        return [results[id(pump)] for pump in self.pumps]
+
+    def _links(self) -> dict:
+        # pumps grouped by the link they are connected through, pumps sharing a serial port share its worker
+        links = {}
+        for pump in self.pumps:
+            if pump._is_uart:
+                link = ('uart', pump._com_port.port_name)
+            else:
+                link = ('i2c', pump._i2c_adapter)
+            links.setdefault(link, []).append(pump)
+        return links
+
+    def _executor(self, link) -> concurrent.futures.ThreadPoolExecutor:
+        if link not in self._executors:
+            self._executors[link] = concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                                          thread_name_prefix="LVPumpFleet")
+        return self._executors[link]
+
+    @staticmethod
+    def _call(function, pump, *args, **kwargs):
+        # a failure on one pump must not stop the others on the same link
+        try:
+            return function(pump, *args, **kwargs)
+        except Exception as e:
+            return _LVFleetError(e)
+
+
+# -----------------------------------------------------------------------------
+# Internal classes
+# -----------------------------------------------------------------------------
+
+
+class _LVFleetError:
+    def __init__(self, exception: Exception):
+        self.exception = exception
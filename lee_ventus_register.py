@@ -221,6 +221,17 @@ class LVRegister(IntEnum):
     GPIO_D_STATE = 56
 
 
+# -----------------------------------------------------------------------------
+# Exceptions
+# -----------------------------------------------------------------------------
+
+
+class LVTimeoutError(Exception):
+    """
+        Raised when the driver does not reply in time, e.g. to a register read over UART.
+    """
+
+
 # -----------------------------------------------------------------------------
 # Internal functions
 # -----------------------------------------------------------------------------
@@ -234,6 +245,17 @@ def LVRegister_is_float(reg_id: int):
     return not _is_register_int[reg_id]
 
 
+def LVRegister_is_volatile(reg_id: int):
+    return reg_id in _volatile_registers
+
+
+def LVRegister_normalise_value(reg_id: int, value, rounding_decimal_places=3):
+    # the value as the board stores it, so register values can be compared regardless of how they were obtained
+    if _is_register_int[reg_id]:
+        return int(value)
+    return round(float(value), rounding_decimal_places)
+
+
 def LVRegister_get_number_settings():
     return len(_default_values_spm)
 
@@ -250,6 +272,24 @@ def LVRegister_get_default_reg_value_gp(reg_id: int):
 # -----------------------------------------------------------------------------
 
 
+# registers that change on the board by themselves or act as commands, so their last written value cannot be cached
+_volatile_registers = {LVRegister.MEAS_DRIVE_VOLTS,
+                       LVRegister.MEAS_DRIVE_MILLIAMPS,
+                       LVRegister.MEAS_DRIVE_MILLIWATTS,
+                       LVRegister.MEAS_DRIVE_FREQ,
+                       LVRegister.MEAS_ANA_A,
+                       LVRegister.MEAS_ANA_B,
+                       LVRegister.MEAS_ANA_C,
+                       LVRegister.MEAS_FLOW,
+                       LVRegister.MEAS_DIGITAL_PRESSURE,
+                       LVRegister.STORE_CURRENT_SETTINGS,
+                       LVRegister.ERROR_CODE,
+                       LVRegister.GPIO_A_STATE,   # writing a pulse count starts a new pulse train
+                       LVRegister.GPIO_B_STATE,
+                       LVRegister.GPIO_C_STATE,
+                       LVRegister.GPIO_D_STATE,
+                       }
+
 _default_values_spm = [1,  # PUMP_ENABLE = 0
                        1000,  # POWER_LIMIT_MILLIWATTS = 1
                        0,  # STREAM_MODE = 2
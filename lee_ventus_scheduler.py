@@ -0,0 +1,226 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import threading
+import time
+
+import numpy as np
+
+
+# -----------------------------------------------------------------------------
+# Timing functions
+# -----------------------------------------------------------------------------
+
+
+def LVScheduler_sleep_until(deadline: float, spin_time=0.001):
+    """
+        Waits until a time.perf_counter() deadline. Sleeps for most of the wait and spins for the last part, as sleeps
+        can overshoot by a millisecond or more.
+
+        Args:
+            deadline (float): The time.perf_counter() value to wait for.
+            spin_time (float, optional): The time before the deadline to stop sleeping and start spinning.
+        Returns:
+            None
+    """
+    delay = deadline - time.perf_counter() - spin_time
+    if delay > 0:
+        time.sleep(delay)
+    while time.perf_counter() < deadline:
+        pass
+
+
+# ***********************************************************************************
+# * LVPeriodicScheduler class
+# ***********************************************************************************
+
+
+class LVPeriodicScheduler:
+    """
+        Calls a function at a fixed rate on an absolute time line: call n is due at start time + n * period, however
+        long the previous calls took, so the rate does not drift. When a call runs so late that following deadlines
+        have already passed, those calls are skipped (and counted as missed) instead of being run in a burst.
+        The lateness of every call is recorded for the jitter statistics.
+
+        Example:
+            scheduler = LVPeriodicScheduler(0.05, lambda tick, scheduled_time: pump.write_reg(LVRegister.SET_VAL,
+                                                                                              targets[tick], 0))
+            scheduler.run(number_ticks=len(targets))
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def run(self, duration=None, number_ticks=None):
+        """
+            Calls the function on schedule until the duration has passed, the number of ticks is reached, the function
+            returns False or stop() is called.
+
+            Args:
+                duration (float, optional): The time to run for in seconds.
+                number_ticks (int, optional): The number of ticks to run for, including the skipped ones.
+            Returns:
+                None
+        """
+        self._running = True
+        self._number_calls = 0
+        self._missed_deadlines = 0
+        self._end_time = None
+        start_time = time.perf_counter()
+        self._start_time = start_time
+        tick = 0
+        try:
+            while self._running:
+                if number_ticks is not None and tick >= number_ticks:
+                    break
+                scheduled_time = tick * self.period
+                if duration is not None and scheduled_time >= duration:
+                    break
+                LVScheduler_sleep_until(start_time + scheduled_time, self.spin_time)
+
+                call_time = time.perf_counter()
+                lateness = call_time - start_time - scheduled_time
+                if self.callback(tick, scheduled_time) is False:
+                    break
+                self._record(lateness, time.perf_counter() - call_time)
+
+                # the next deadline still in the future, skipping the ones already missed
+                next_tick = max(tick + 1, int((time.perf_counter() - start_time) / self.period) + 1)
+                self._missed_deadlines += next_tick - tick - 1
+                tick = next_tick
+        finally:
+            self._end_time = time.perf_counter()
+            self._running = False
+
+    def start(self, duration=None, number_ticks=None):
+        """
+            Runs the scheduler on a background thread, see run(). If the function raises an exception the
+            scheduler stops and the exception is raised again by stop().
+
+            Args:
+                duration (float, optional): The time to run for in seconds.
+                number_ticks (int, optional): The number of ticks to run for.
+            Returns:
+                None
+        """
+        self._running = True
+        self._exception = None
+        self._thread = threading.Thread(target=self._run_thread, args=(duration, number_ticks), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops the scheduler after the current call and waits for the background thread if there is one.
+            Raises the exception that stopped the background thread, if any.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._running = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    def statistics(self) -> dict:
+        """
+            Returns the timing statistics of the calls made.
+
+            Args:
+
+            Returns:
+                dict: The number of calls, of missed deadlines (skipped calls), the achieved call rate and the mean,
+                    99th percentile and maximum lateness (jitter) and duration of the calls in seconds.
+        """
+        number_calls = min(self._number_calls, len(self._lateness))
+        lateness = self._lateness[:number_calls]
+        durations = self._durations[:number_calls]
+        if self._start_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = (time.perf_counter() if self._end_time is None else self._end_time) - self._start_time
+        return {"calls": self._number_calls,
+                "missed_deadlines": self._missed_deadlines,
+                "rate_hz": self._number_calls / elapsed if elapsed > 0 else 0.0,
+                "mean_lateness_s": float(np.mean(lateness)) if number_calls != 0 else 0.0,
+                "p99_lateness_s": float(np.percentile(lateness, 99)) if number_calls != 0 else 0.0,
+                "max_lateness_s": float(np.max(lateness)) if number_calls != 0 else 0.0,
+                "mean_call_duration_s": float(np.mean(durations)) if number_calls != 0 else 0.0,
+                "max_call_duration_s": float(np.max(durations)) if number_calls != 0 else 0.0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def start_time(self) -> float:
+        """
+            The time.perf_counter() value tick 0 was due at, None before the scheduler is run.
+        """
+        return self._start_time
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, period: float, callback, spin_time=0.001, statistics_size=100000):
+        """
+            Args:
+                period (float): The time between two calls in seconds.
+                callback: The function called on every tick as callback(tick, scheduled_time), with the tick number
+                    and the time it was due in seconds since the start. Returning False stops the scheduler.
+                spin_time (float, optional): The time before each deadline spent spinning instead of sleeping.
+                statistics_size (int, optional): The number of most recent calls kept for the jitter statistics.
+        """
+        self.period = period
+        self.callback = callback
+        self.spin_time = spin_time
+        self._running = False
+        self._thread = None
+        self._exception = None   # exception raised on the background thread, raised again by stop()
+        self._start_time = None
+        self._end_time = None
+
+        # statistics, the lateness and duration of the calls are kept in preallocated ring buffers
+        self._number_calls = 0
+        self._missed_deadlines = 0
+        self._lateness = np.zeros(statistics_size)
+        self._durations = np.zeros(statistics_size)
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _run_thread(self, duration, number_ticks):
+        try:
+            self.run(duration, number_ticks)
+        except Exception as e:
+            self._exception = e
+
+    def _record(self, lateness: float, duration: float):
+        index = self._number_calls % len(self._lateness)
+        self._lateness[index] = lateness
+        self._durations[index] = duration
+        self._number_calls += 1
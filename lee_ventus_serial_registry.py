@@ -0,0 +1,303 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import threading
+import time
+
+
+# -----------------------------------------------------------------------------
+# Serial registry functions
+# -----------------------------------------------------------------------------
+
+
+def LVSerialRegistry_configure(lazy_connect=None, keep_warm=None, share_ports=None):
+    """
+        Changes the settings of the process wide serial port registry used by LVDiscPump. Settings left as None are
+        unchanged. They apply to the ports acquired (connected) afterwards.
+
+        Args:
+            lazy_connect (bool, optional): If True a port is only opened on its first read or write, so creating and
+                connecting pumps costs nothing until they are used, but a wrong port name only fails on first use.
+                If False (default) the port is opened by connect_pump.
+            keep_warm (bool, optional): If True ports stay open when their last pump disconnects, so the next pump
+                connected to the same port doesn't pay for opening it again. Close them with
+                LVSerialRegistry_close_idle(). Defaults to False.
+            share_ports (bool, optional): If True several pumps can be connected to the same port at the same time,
+                their register reads and writes are serialised by a lock of the port. Only one of them should stream.
+                If False (default) connecting a second pump to a port in use raises an exception.
+        Returns:
+            None
+    """
+    with _lock:
+        for name, value in (("lazy_connect", lazy_connect), ("keep_warm", keep_warm), ("share_ports", share_ports)):
+            if value is not None:
+                _settings[name] = value
+
+
+def LVSerialRegistry_acquire(port_name: str, open_function, timeout=None):
+    """
+        Returns a handle to a serial port, creating the registry entry of the port if needed. Closing the handle
+        releases it.
+
+        Args:
+            port_name (str): The name of the port, e.g. "COM6".
+            open_function: Function without arguments that opens the port and returns it, e.g. a serial.Serial.
+                Only called if the port isn't already open.
+            timeout (float, optional): The read timeout of this handle in seconds. Defaults to a single poll of the
+                port (see LVSerialPortHandle).
+        Returns:
+            LVSerialPortHandle: The handle, which can be used like the serial port.
+    """
+    with _lock:
+        port = _ports.get(port_name)
+        if port is None:
+            port = _ports[port_name] = _LVSerialPort(port_name, open_function, _settings["share_ports"])
+        elif port.users != 0 and not (port.shared and _settings["share_ports"]):
+            raise Exception(f'Serial port {port_name} is already in use.')
+        elif port.users == 0:
+            port.shared = _settings["share_ports"]
+        if port.serial_port is not None:
+            port.reuses += 1
+        port.users += 1
+        lazy_connect = _settings["lazy_connect"]
+    handle = LVSerialPortHandle(port, timeout)
+    if not lazy_connect:
+        try:
+            handle.open()
+        except Exception:
+            handle.close()
+            raise
+    return handle
+
+
+def LVSerialRegistry_close_idle() -> int:
+    """
+        Closes the ports kept open (warm) that no pump is connected to.
+
+        Args:
+
+        Returns:
+            int: The number of ports closed.
+    """
+    with _lock:
+        idle_ports = [port for port in _ports.values() if port.users == 0]
+        for port in idle_ports:
+            del _ports[port.name]
+    for port in idle_ports:
+        port.close()
+    return len(idle_ports)
+
+
+def LVSerialRegistry_statistics() -> dict:
+    """
+        Returns the state of the ports in the registry.
+
+        Args:
+
+        Returns:
+            dict: Keyed by port name: the number of "users" (connected pumps), "is_open", whether it is "shared", the
+                number of times it was opened ("opens") and acquired while already open ("reuses"), and the total
+                time spent opening it in seconds ("open_time_s").
+    """
+    with _lock:
+        return {name: {"users": port.users,
+                       "is_open": port.serial_port is not None,
+                       "shared": port.shared,
+                       "opens": port.opens,
+                       "reuses": port.reuses,
+                       "open_time_s": port.open_time}
+                for name, port in _ports.items()}
+
+
+# ***********************************************************************************
+# * LVSerialPortHandle class
+# ***********************************************************************************
+
+
+class LVSerialPortHandle:
+    """
+        One user's handle to a serial port of the registry, with the parts of the serial.Serial interface used by
+        LVDiscPump. The port is opened on first use if it isn't open already. Register transactions should hold the
+        port lock when the port is shared.
+        The port itself always uses a short read timeout (READ_POLL_TIME), so the handles never change it. Each
+        handle keeps its own read timeout and read() and readline() keep polling the port until it runs out.
+    """
+
+    # read timeout of the serial port in seconds, the longest a read blocks before a handle checks its own deadline
+    READ_POLL_TIME = 0.05
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def open(self):
+        """
+            Opens the port now instead of on first use.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._get_port()
+
+    def write(self, data: bytes) -> int:
+        return self._get_port().write(data)
+
+    def read(self, size=1) -> bytes:
+        serial_port = self._get_port()
+        start_time = time.monotonic()
+        data = serial_port.read(size)
+        if self._timeout is None or len(data) >= size:
+            return data
+        deadline = start_time + self._timeout
+        while len(data) < size and time.monotonic() < deadline:
+            data += serial_port.read(size - len(data))
+        return data
+
+    def readline(self) -> bytes:
+        serial_port = self._get_port()
+        start_time = time.monotonic()
+        line = serial_port.readline()
+        if self._timeout is None or line.endswith(b'\n'):
+            return line
+        deadline = start_time + self._timeout
+        while not line.endswith(b'\n') and time.monotonic() < deadline:
+            line += serial_port.readline()
+        return line
+
+    def read_all(self) -> bytes:
+        return self._get_port().read_all()
+
+    def close(self):
+        """
+            Releases the handle. The port is closed when it has no users left, unless ports are kept warm.
+
+            Args:
+
+            Returns:
+                None
+        """
+        port, self._port = self._port, None
+        if port is None:
+            return
+        with _lock:
+            port.users -= 1
+            close_port = port.users == 0 and not _settings["keep_warm"]
+            if close_port:
+                del _ports[port.name]
+        if close_port:
+            port.close()
+
+    @property
+    def in_waiting(self) -> int:
+        return self._get_port().in_waiting
+
+    @property
+    def timeout(self) -> float:
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float):
+        self._timeout = timeout
+
+    @property
+    def lock(self) -> threading.RLock:
+        """
+            The lock of the port, shared by all its handles.
+        """
+        if self._port is None:
+            raise Exception('The serial port handle is closed.')
+        return self._port.lock
+
+    @property
+    def is_open(self) -> bool:
+        return self._port is not None and self._port.serial_port is not None
+
+    @property
+    def port_name(self) -> str:
+        """
+            The name of the port, the same for all the handles of the port.
+        """
+        return self._port_name
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, port, timeout=None):
+        self._port = port
+        self._port_name = port.name
+        self._timeout = timeout
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _get_port(self):
+        if self._port is None:
+            raise Exception('The serial port handle is closed.')
+        serial_port = self._port.serial_port
+        if serial_port is None:
+            serial_port = self._port.open()
+        return serial_port
+
+
+# -----------------------------------------------------------------------------
+# Internal classes and variables
+# -----------------------------------------------------------------------------
+
+
+class _LVSerialPort:
+    # registry entry of a port, the serial port itself is only opened on first use
+    def __init__(self, name: str, open_function, shared: bool):
+        self.name = name
+        self.open_function = open_function
+        self.shared = shared
+        self.lock = threading.RLock()
+        self.serial_port = None
+        self.users = 0
+        self.opens = 0
+        self.reuses = 0
+        self.open_time = 0.0
+
+    def open(self):
+        with self.lock:
+            if self.serial_port is None:
+                start_time = time.perf_counter()
+                serial_port = self.open_function()
+                # the handles wait for their own timeouts by polling, the port timeout is never changed afterwards
+                serial_port.timeout = LVSerialPortHandle.READ_POLL_TIME
+                self.serial_port = serial_port
+                self.open_time += time.perf_counter() - start_time
+                self.opens += 1
+            return self.serial_port
+
+    def close(self):
+        with self.lock:
+            if self.serial_port is not None:
+                self.serial_port.close()
+                self.serial_port = None
+
+
+_settings = {"lazy_connect": False, "keep_warm": False, "share_ports": False}
+_ports = {}
+# protects the two variables above
+_lock = threading.Lock()
@@ -0,0 +1,623 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+
+Hardware free simulation of the disc pump drivers, for testing and benchmarking control code without a board.
+The simulated devices stand in for serial.Serial (UART) and EasyMCP2221.Device (I2C) and speak the same protocols.
+The pump physics and the firmware control loops are simple approximations, not a model of a specific product.
+
+Example:
+    LVSimulator_add_uart_pump("SIM1", LVSimulatedPumpModel(LVDeviceType.GP))
+    LVSimulator_add_i2c_pump(37)
+    LVSimulator_install()
+
+    myPump = LVDiscPump()
+    myPump.connect_pump(com_port="SIM1")
+"""
+
+import collections
+import math
+import random
+import struct
+import threading
+import time
+
+import serial
+import EasyMCP2221
+from EasyMCP2221.exceptions import NotAckError
+
+from lee_ventus_disc_pump import *
+
+
+# ***********************************************************************************
+# * LVSimulatedPumpModel class
+# ***********************************************************************************
+
+
+class LVSimulatedPumpModel:
+    """
+        Simulated driver board. Holds the register file (seeded with the default settings of the device type) and
+        models the pressure and flow of the pump as first-order responses to the drive power.
+        The manual, PID and bang bang control modes of the firmware are approximated.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def write_register(self, reg_id: int, value):
+        """
+            Writes a value to a register, as if it was received from the host.
+
+            Args:
+                reg_id (int): The register ID (number) to be written to.
+                value (int or float): The value to be written.
+            Returns:
+                None
+        """
+        if not 0 <= reg_id < len(self.registers):
+            return
+        with self._lock:
+            self.update()
+            was_enabled = self.registers[LVRegister.PUMP_ENABLE] != 0
+            self.registers[reg_id] = float(LVRegister_normalise_value(reg_id, value))
+            if reg_id == LVRegister.PUMP_ENABLE and not was_enabled and value != 0 \
+                    and self.registers[LVRegister.RESET_PID_ON_TURNON] != 0:
+                self._pid_integral = 0.0
+                self._pid_previous_error = None
+            if reg_id == LVRegister.STORE_CURRENT_SETTINGS:
+                # storing the settings is a command, the register reads back as 0
+                self.registers[reg_id] = 0.0
+
+    def read_register(self, reg_id: int) -> float:
+        """
+            Reads the value of a register, as if it was requested by the host.
+
+            Args:
+                reg_id (int): The register ID (number) to be read.
+            Returns:
+                float: The value of the register.
+        """
+        with self._lock:
+            self.update()
+            if reg_id in self._measurements:
+                return self._measurements[reg_id]()
+            if 0 <= reg_id < len(self.registers):
+                return self.registers[reg_id]
+            return 0.0
+
+    def stream_output(self) -> list[float]:
+        """
+            Returns the streaming mode output (as listed in LVStreamingModeOutputIndexes) at the current simulation
+            time. Call update first to advance the simulation.
+
+            Args:
+
+            Returns:
+                list[float]: The streaming mode output.
+        """
+        with self._lock:
+            if self.device_type == LVDeviceType.GP:
+                ana_a = self.analog_inputs[0]
+                ana_b = self._measure(self._ana_b())
+                flow = self._measure(self.flow)
+            else:
+                ana_a = 0.0
+                ana_b = self._measure(self.pressure)
+                flow = 0.0
+            return [self.registers[LVRegister.PUMP_ENABLE],
+                    self._drive_voltage(),
+                    self._drive_current(),
+                    self._drive_frequency(),
+                    ana_a,
+                    ana_b,
+                    self.analog_inputs[2],
+                    flow]
+
+    def update(self, now=None):
+        """
+            Advances the simulation up to the given time.
+
+            Args:
+                now (float, optional): Optional setting for the time.monotonic() time to advance to. Defaults to now.
+            Returns:
+                None
+        """
+        if now is None:
+            now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._time
+            if elapsed <= 0:
+                return
+            # after a long idle time the state has settled, only the last few seconds need to be simulated
+            elapsed = min(elapsed, self.MAX_CATCH_UP_TIME)
+            number_steps = max(1, math.ceil(elapsed / self.SIMULATION_STEP))
+            step = elapsed / number_steps
+            for _ in range(number_steps):
+                self._step(step)
+            self._time = now
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    # simulation time step and the longest time simulated when catching up
+    SIMULATION_STEP = 0.001
+    MAX_CATCH_UP_TIME = 5
+
+    def __init__(self, device_type=LVDeviceType.SPM, pressure_gain=0.2, pressure_time_constant=0.3,
+                 flow_gain=0.01, flow_time_constant=0.1, dead_time=0.0, noise=0.0, stream_period=0.01,
+                 firmware_version=6, firmware_minor_version=16, seed=None):
+        """
+            Args:
+                device_type (LVDeviceType, optional): Optional setting for the board type, GP or SPM. Selects the
+                    default register values and the streaming mode output layout.
+                pressure_gain (float, optional): Optional setting for the settled pressure per drive power [mBar/mW].
+                pressure_time_constant (float, optional): Optional setting for the pressure time constant [s].
+                flow_gain (float, optional): Optional setting for the settled flow per drive power [unit/mW].
+                flow_time_constant (float, optional): Optional setting for the flow time constant [s].
+                dead_time (float, optional): Optional setting for the delay between the drive power and the
+                    pressure and flow response [s].
+                noise (float, optional): Optional setting for the standard deviation of the measurement noise.
+                stream_period (float, optional): Optional setting for the time between streaming mode outputs [s].
+                firmware_version (int, optional): Optional setting for the FIRMWARE_VERSION register.
+                firmware_minor_version (int, optional): Optional setting for the FIRMWARE_MINOR_VERSION register.
+                seed (int, optional): Optional setting for the seed of the measurement noise.
+        """
+        self.device_type = device_type
+        self.pressure_gain = pressure_gain
+        self.pressure_time_constant = pressure_time_constant
+        self.flow_gain = flow_gain
+        self.flow_time_constant = flow_time_constant
+        self.noise = noise
+        self.stream_period = stream_period
+
+        # register file seeded with the default values of the device type
+        self.registers = [0.0] * LVRegister_get_number_settings()
+        for reg_id in range(LVRegister_get_number_settings()):
+            if device_type == LVDeviceType.GP:
+                default_value = LVRegister_get_default_reg_value_gp(reg_id)
+            else:
+                default_value = LVRegister_get_default_reg_value_spm(reg_id)
+            if default_value is not None:
+                self.registers[reg_id] = float(default_value)
+        self.registers[LVRegister.DEVICE_TYPE] = float(device_type)
+        self.registers[LVRegister.FIRMWARE_VERSION] = float(firmware_version)
+        self.registers[LVRegister.FIRMWARE_MINOR_VERSION] = float(firmware_minor_version)
+
+        # physical state: external analog inputs A, B, C (e.g. the dial on ANA_C) can be set by the user
+        self.analog_inputs = [0.0, 0.0, 0.0]
+        self.power = 0.0
+        self.pressure = 0.0
+        self.flow = 0.0
+
+        self._lock = threading.RLock()
+        self._time = time.monotonic()
+        self._random = random.Random(seed)
+        self._delayed_power = collections.deque([0.0] * max(1, round(dead_time / self.SIMULATION_STEP)))
+        self._pid_integral = 0.0
+        self._pid_previous_error = None
+        self._bang_bang_on = False
+        self._measurements = {LVRegister.MEAS_DRIVE_VOLTS: self._drive_voltage,
+                              LVRegister.MEAS_DRIVE_MILLIAMPS: self._drive_current,
+                              LVRegister.MEAS_DRIVE_MILLIWATTS: lambda: self.power,
+                              LVRegister.MEAS_DRIVE_FREQ: self._drive_frequency,
+                              LVRegister.MEAS_ANA_A: lambda: self.analog_inputs[0],
+                              LVRegister.MEAS_ANA_B: lambda: self._measure(self._ana_b()),
+                              LVRegister.MEAS_ANA_C: lambda: self.analog_inputs[2],
+                              LVRegister.MEAS_FLOW: lambda: self._measure(self.flow),
+                              LVRegister.MEAS_DIGITAL_PRESSURE: lambda: self._measure(self.pressure),
+                              LVRegister.ERROR_CODE: lambda: 0.0}
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _step(self, dt: float):
+        registers = self.registers
+        control_mode = registers[LVRegister.CONTROL_MODE]
+        if registers[LVRegister.PUMP_ENABLE] == 0:
+            power = 0.0
+        elif control_mode == LVControlMode.MANUAL:
+            power = self._source(registers[LVRegister.MANUAL_MODE_SETPOINT_SOURCE])
+        elif control_mode == LVControlMode.PID:
+            error = self._source(registers[LVRegister.PID_MODE_SETPOINT_SOURCE]) \
+                - self._source(registers[LVRegister.PID_MODE_MEAS_SOURCE])
+            integral_limit = registers[LVRegister.PID_INTEGRAL_LIMIT_COEFF]
+            self._pid_integral += registers[LVRegister.PID_INTEGRAL_COEFF] * error * dt
+            self._pid_integral = max(-integral_limit, min(integral_limit, self._pid_integral))
+            derivative = 0.0 if self._pid_previous_error is None else (error - self._pid_previous_error) / dt
+            self._pid_previous_error = error
+            power = registers[LVRegister.PID_PROPORTIONAL_COEFF] * error + self._pid_integral \
+                + registers[LVRegister.PID_DIFFERENTIAL_COEFF] * derivative
+        elif control_mode == LVControlMode.BANG_BANG:
+            measurement = self._source(registers[LVRegister.BANG_BANG_MEAS_SOURCE])
+            if measurement < registers[LVRegister.BANG_BANG_LOWER_THRESH]:
+                self._bang_bang_on = True
+            elif measurement > registers[LVRegister.BANG_BANG_UPPER_THRESH]:
+                self._bang_bang_on = False
+            power = registers[LVRegister.BANG_BANG_LOWER_POWER_MILLIWATTS] if self._bang_bang_on \
+                else registers[LVRegister.BANG_BANG_UPPER_POWER_MILLIWATTS]
+        else:
+            power = 0.0
+        self.power = max(0.0, min(registers[LVRegister.POWER_LIMIT_MILLIWATTS], power))
+
+        # first-order responses to the (delayed) drive power
+        self._delayed_power.append(self.power)
+        delayed_power = self._delayed_power.popleft()
+        self.pressure += (1 - math.exp(-dt / self.pressure_time_constant)) \
+            * (self.pressure_gain * delayed_power - self.pressure)
+        self.flow += (1 - math.exp(-dt / self.flow_time_constant)) * (self.flow_gain * delayed_power - self.flow)
+
+    def _source(self, control_source) -> float:
+        if control_source == LVControlSource.SETVAL:
+            return self.registers[LVRegister.SET_VAL]
+        if control_source == LVControlSource.ANA_A:
+            return self.analog_inputs[0]
+        if control_source == LVControlSource.ANA_B:
+            return self._ana_b()
+        if control_source == LVControlSource.ANA_C:
+            return self.analog_inputs[2]
+        if control_source == LVControlSource.FLOW:
+            return self.flow
+        if control_source == LVControlSource.DIGITAL_PRESSURE:
+            return self.pressure
+        return 0.0
+
+    def _ana_b(self) -> float:
+        # the GP driver has an analog pressure sensor on ANA B
+        return self.pressure if self.device_type == LVDeviceType.GP else self.analog_inputs[1]
+
+    def _measure(self, value: float) -> float:
+        if self.noise == 0:
+            return value
+        return value + self._random.gauss(0, self.noise)
+
+    def _drive_voltage(self) -> float:
+        return 60 * math.sqrt(self.power / 1000)
+
+    def _drive_current(self) -> float:
+        voltage = self._drive_voltage()
+        return self.power / voltage if voltage != 0 else 0.0
+
+    def _drive_frequency(self) -> float:
+        if self.registers[LVRegister.PUMP_ENABLE] == 0:
+            return 0.0
+        return self.registers[LVRegister.MANUAL_DRIVE_FREQUENCY]
+
+
+# ***********************************************************************************
+# * LVSimulatedSerial class
+# ***********************************************************************************
+
+
+class LVSimulatedSerial:
+    """
+        Simulated UART connection to a pump, compatible with the parts of serial.Serial used by LVDiscPump.
+        Replies and streaming lines are delivered after the link latency, at the speed of the baud rate.
+    """
+
+    # size of the receive buffer, like the OS serial buffer bytes are lost when it is full
+    RECEIVE_BUFFER_SIZE = 4096
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def write(self, data: bytes) -> int:
+        with self._lock:
+            self._poll()
+            lines = (self._transmit_partial_line + bytes(data)).split(b'\n')
+            self._transmit_partial_line = lines.pop()
+            for line in lines:
+                self._handle_command(line.strip())
+        return len(data)
+
+    def read(self, size=1) -> bytes:
+        return self._read_until(lambda received: size if len(received) >= size else None, size)
+
+    def readline(self) -> bytes:
+        def line_end(received):
+            index = received.find(b'\n')
+            return index + 1 if index != -1 else None
+        return self._read_until(line_end, None)
+
+    def read_all(self) -> bytes:
+        with self._lock:
+            self._poll()
+            data = bytes(self._received)
+            self._received.clear()
+            return data
+
+    @property
+    def in_waiting(self) -> int:
+        with self._lock:
+            self._poll()
+            return len(self._received)
+
+    def reset_input_buffer(self):
+        with self._lock:
+            self._poll()
+            self._received.clear()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, port=None, baudrate=115200, bytesize=8, timeout=None, stopbits=serial.STOPBITS_ONE, **kwargs):
+        if port not in _simulated_uart_pumps:
+            raise serial.SerialException(f'could not open port {port}: no simulated pump on this port')
+        self.port = port
+        self.baudrate = baudrate
+        self.bytesize = bytesize
+        self.timeout = timeout
+        self.stopbits = stopbits
+        self.is_open = True
+        self.model, self.latency = _simulated_uart_pumps[port]
+
+        self._lock = threading.RLock()
+        self._received = bytearray()
+        self._pending = collections.deque()    # (time available, bytes) in order of arrival
+        self._line_free_time = 0.0             # time at which the line has finished sending the previous bytes
+        self._transmit_partial_line = b''
+        self._next_stream_time = None
+
+        # statistics
+        self.overrun_bytes = 0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _read_until(self, find_end, size) -> bytes:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            with self._lock:
+                self._poll()
+                end = find_end(self._received)
+                if end is None and deadline is not None and time.monotonic() >= deadline:
+                    end = len(self._received) if size is None else min(size, len(self._received))
+                if end is not None:
+                    data = bytes(self._received[:end])
+                    del self._received[:end]
+                    return data
+                next_arrival = self._pending[0][0] if len(self._pending) != 0 else math.inf
+            if not self.is_open:
+                raise serial.SerialException('Attempting to use a port that is not open')
+            now = time.monotonic()
+            wait = min(next_arrival - now, 0.001)
+            if deadline is not None:
+                wait = min(wait, deadline - now)
+            if wait > 0:
+                time.sleep(wait)
+
+    def _send(self, data: bytes, send_time: float):
+        # bytes leave the driver one after the other at the baud rate (10 bits per byte)
+        start_time = max(send_time + self.latency, self._line_free_time)
+        self._line_free_time = start_time + len(data) * 10 / self.baudrate
+        self._pending.append((self._line_free_time, data))
+
+    def _poll(self):
+        now = time.monotonic()
+        if self.model.registers[LVRegister.STREAM_MODE] == LVStreamingModes.STREAMING_UART:
+            if self._next_stream_time is None or now - self._next_stream_time > 1:
+                # streaming has just started or the host stopped reading for a long time
+                self._next_stream_time = max(now - 1, self._next_stream_time or now)
+            while self._next_stream_time <= now:
+                self.model.update(self._next_stream_time)
+                stream_output = self.model.stream_output()
+                self._send(('#S' + ','.join(_format_stream_value(index, value)
+                                            for index, value in enumerate(stream_output)) + '\n').encode('ascii'),
+                           self._next_stream_time)
+                self._next_stream_time += self.model.stream_period
+        else:
+            self._next_stream_time = None
+
+        while len(self._pending) != 0 and self._pending[0][0] <= now:
+            data = self._pending.popleft()[1]
+            free_space = self.RECEIVE_BUFFER_SIZE - len(self._received)
+            if len(data) > free_space:
+                self.overrun_bytes += len(data) - free_space
+                data = data[:free_space]
+            self._received += data
+
+    def _handle_command(self, line: bytes):
+        try:
+            if line.startswith(b'#W'):
+                reg_id, value = line[2:].split(b',')
+                self.model.write_register(int(reg_id), float(value))
+            elif line.startswith(b'#R'):
+                reg_id = int(line[2:])
+                value = self.model.read_register(reg_id)
+                if 0 <= reg_id < LVRegister_get_number_settings() and LVRegister_is_int(reg_id):
+                    reply = f'#R{reg_id},{int(value)}\n'
+                else:
+                    reply = f'#R{reg_id},{round(value, 3)}\n'
+                self._send(reply.encode('ascii'), time.monotonic())
+        except ValueError:
+            # the driver ignores commands it cannot parse
+            pass
+
+
+# ***********************************************************************************
+# * LVSimulatedMCP2221 class
+# ***********************************************************************************
+
+
+class LVSimulatedMCP2221:
+    """
+        Simulated MCP2221 usb to I2C interface, compatible with the parts of EasyMCP2221.Device used by LVDiscPump.
+        Each transaction takes the link latency of the addressed pump. devnum selects which simulated interface.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def I2C_write(self, addr, data, kind='regular', timeout_ms=20):
+        model, latency = self._get_pump(addr)
+        time.sleep(latency)
+        data = bytes(data)
+        if len(data) == 1 and data[0] >= 128:
+            # select the register to be read by the following I2C read
+            self._selected_registers[addr] = data[0] - 128
+        elif len(data) >= 3:
+            reg_id = data[0]
+            if reg_id < LVRegister_get_number_settings() and LVRegister_is_int(reg_id):
+                value = struct.unpack("<h", data[1:3])[0]
+            else:
+                value = struct.unpack("<f", data[1:5])[0]
+            model.write_register(reg_id, value)
+
+    def I2C_read(self, addr, size=1, kind='regular', timeout_ms=20) -> bytes:
+        model, latency = self._get_pump(addr)
+        time.sleep(latency)
+        reg_id = self._selected_registers.pop(addr, None)
+        if reg_id is None:
+            # without a selected register the streaming mode output is returned
+            model.update()
+            stream_output = model.stream_output()
+            data = LV_I2C_STREAM_FRAME.pack(int(stream_output[0]), *stream_output[1:3], int(stream_output[3]),
+                                            *stream_output[4:])
+        elif reg_id < LVRegister_get_number_settings() and LVRegister_is_int(reg_id):
+            data = struct.pack("<h", max(-32768, min(32767, int(model.read_register(reg_id)))))
+        else:
+            data = struct.pack("<f", model.read_register(reg_id))
+        return (data + bytes(size))[:size]
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, VID=None, PID=None, devnum=None, trace_packets=None):
+        self._devnum = 0 if devnum is None else devnum
+        self._selected_registers = {}
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _get_pump(self, addr):
+        if (self._devnum, addr) not in _simulated_i2c_pumps:
+            raise NotAckError("I2C slave device did not acknowledge")
+        return _simulated_i2c_pumps[(self._devnum, addr)]
+
+
+# -----------------------------------------------------------------------------
+# Simulator set up functions
+# -----------------------------------------------------------------------------
+
+
+def LVSimulator_add_uart_pump(com_port: str, model=None, latency=0.001) -> LVSimulatedPumpModel:
+    """
+        Adds a simulated pump on a simulated COM port.
+
+        Args:
+            com_port (str): The name of the simulated COM port e.g. "SIM1".
+            model (LVSimulatedPumpModel, optional): Optional setting for the simulated pump. Defaults to a GP driver.
+            latency (float, optional): Optional setting for the link latency in seconds.
+        Returns:
+            LVSimulatedPumpModel: The simulated pump.
+    """
+    if model is None:
+        model = LVSimulatedPumpModel(LVDeviceType.GP)
+    _simulated_uart_pumps[com_port] = (model, latency)
+    return model
+
+
+def LVSimulator_add_i2c_pump(i2c_address: int, model=None, latency=0.001, i2c_adapter=0) -> LVSimulatedPumpModel:
+    """
+        Adds a simulated pump on a simulated I2C bus.
+
+        Args:
+            i2c_address (int): The I2C address of the simulated pump e.g. 37.
+            model (LVSimulatedPumpModel, optional): Optional setting for the simulated pump. Defaults to an SPM.
+            latency (float, optional): Optional setting for the time each I2C transaction takes in seconds.
+            i2c_adapter (int, optional): Optional setting for the index of the simulated MCP2221 interface. Its USB
+                serial number is "SIM-MCP2221-" followed by the index.
+        Returns:
+            LVSimulatedPumpModel: The simulated pump.
+    """
+    if model is None:
+        model = LVSimulatedPumpModel(LVDeviceType.SPM)
+    _simulated_i2c_pumps[(i2c_adapter, i2c_address)] = (model, latency)
+    return model
+
+
+def LVSimulator_remove_all_pumps():
+    _simulated_uart_pumps.clear()
+    _simulated_i2c_pumps.clear()
+
+
+def LVSimulator_install():
+    """
+        Makes LVDiscPump connect to the simulated pumps instead of real serial ports and MCP2221 interfaces.
+    """
+    LVDiscPump._serial_port_factory = LVSimulatedSerial
+    LVDiscPump._i2c_device_factory = LVSimulatedMCP2221
+    LVDiscPump._serial_port_names = staticmethod(_simulated_serial_port_names)
+    LVDiscPump._i2c_adapter_serial_numbers = staticmethod(_simulated_i2c_adapter_serial_numbers)
+
+
+def LVSimulator_uninstall():
+    """
+        Makes LVDiscPump connect to real serial ports and MCP2221 interfaces again.
+    """
+    LVDiscPump._serial_port_factory = serial.Serial
+    LVDiscPump._i2c_device_factory = EasyMCP2221.Device
+    LVDiscPump._serial_port_names = staticmethod(_hardware_serial_port_names)
+    LVDiscPump._i2c_adapter_serial_numbers = staticmethod(_hardware_i2c_adapter_serial_numbers)
+
+
+# -----------------------------------------------------------------------------
+# Internal functions
+# -----------------------------------------------------------------------------
+
+
+def _simulated_serial_port_names() -> list[str]:
+    return list(_simulated_uart_pumps)
+
+
+def _simulated_i2c_adapter_serial_numbers() -> list[str]:
+    number_adapters = max((i2c_adapter + 1 for i2c_adapter, _ in _simulated_i2c_pumps), default=0)
+    return [f'SIM-MCP2221-{i2c_adapter}' for i2c_adapter in range(number_adapters)]
+
+
+def _format_stream_value(index: int, value: float) -> str:
+    if index in (LVStreamingModeOutputIndexes.PUMP_ENABLED, LVStreamingModeOutputIndexes.FREQUENCY):
+        return str(int(value))
+    return f'{value:.3f}'
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+# simulated pumps keyed by COM port name / (MCP2221 index, I2C address), with their link latency
+_simulated_uart_pumps = {}
+_simulated_i2c_pumps = {}
+
+_hardware_serial_port_names = LVDiscPump._serial_port_names
+_hardware_i2c_adapter_serial_numbers = LVDiscPump._i2c_adapter_serial_numbers
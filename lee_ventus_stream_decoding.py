@@ -0,0 +1,159 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import struct
+
+import numpy as np
+
+from lee_ventus_register import *
+
+
+# I2C streaming mode frame: pump enabled, voltage, current, freq, ana_a / 0, ana_b / digital pressure, ana_c, flow / 0
+LV_I2C_STREAM_FRAME = struct.Struct("<hffhffff")
+LV_I2C_STREAM_FRAME_SIZE = 29   # the frame is followed by one more byte that is not used
+
+
+# -----------------------------------------------------------------------------
+# Streaming frame decoding
+# -----------------------------------------------------------------------------
+
+
+def LVStreaming_decode_i2c_frames(data) -> np.ndarray:
+    """
+        Decodes many I2C streaming mode frames at once. The frames are decoded straight from the given buffer.
+
+        Args:
+            data (bytes, bytearray or memoryview): Back to back I2C streaming frames of LV_I2C_STREAM_FRAME_SIZE
+                bytes each. A trailing incomplete frame is ignored.
+        Returns:
+            np.ndarray: Array of shape (number of frames, 8) with the fields listed in LVStreamingModeOutputIndexes.
+    """
+    number_frames = len(data) // LV_I2C_STREAM_FRAME_SIZE
+    frames = np.frombuffer(data, dtype=_i2c_stream_frame_dtype, count=number_frames)
+    output = np.empty((number_frames, len(_i2c_stream_frame_dtype.names)), dtype=np.float64)
+    for index, name in enumerate(_i2c_stream_frame_dtype.names):
+        output[:, index] = frames[name]
+    return output
+
+
+# ***********************************************************************************
+# * LVUartStreamParser class
+# ***********************************************************************************
+
+
+class LVUartStreamParser:
+    """
+        Bulk parser for the UART streaming mode output. Takes raw chunks of bytes as they are read from the serial
+        port, splits them into complete lines and converts all the "#S" lines of a chunk into an array in one go.
+        An incomplete line at the end of a chunk is kept and completed by the next chunk.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def feed(self, data: bytes) -> np.ndarray:
+        """
+            Parses a chunk of bytes received from the serial port.
+
+            Args:
+                data (bytes): The bytes received, e.g. everything waiting in the serial buffer.
+            Returns:
+                np.ndarray: Array of shape (number of "#S" lines completed by this chunk, 8) with the fields listed in
+                    LVStreamingModeOutputIndexes.
+        """
+        data = self._partial_line + data
+        end = data.rfind(b'\n')
+        if end == -1:
+            self._partial_line = data
+            return np.empty((0, _number_stream_fields), dtype=np.float64)
+        self._partial_line = data[end + 1:]
+        lines = data[:end].split(b'\n')
+
+        if not data.isascii():
+            # Ignore the lines with bytes that can't be decoded
+            number_lines = len(lines)
+            lines = [line for line in lines if line.isascii()]
+            self.discarded_lines += number_lines - len(lines)
+
+        # remove the "#S" at the beginning, keep only the lines with all the fields
+        payloads = [line[2:].rstrip() for line in lines if line.startswith(b'#S')]
+        number_payloads = len(payloads)
+        payloads = [payload for payload in payloads if payload.count(b',') == _number_stream_fields - 1]
+        self.discarded_lines += number_payloads - len(payloads)
+        if len(payloads) == 0:
+            return np.empty((0, _number_stream_fields), dtype=np.float64)
+
+        try:
+            values = np.array(b','.join(payloads).split(b','), dtype=np.float64)
+        except ValueError:
+            # a corrupted value, fall back to converting the lines one by one
+            return self._convert_lines(payloads)
+        return values.reshape(-1, _number_stream_fields)
+
+    def reset(self):
+        """
+            Discards the incomplete line kept from the previous chunk.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._partial_line = b''
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self):
+        self._partial_line = b''
+
+        # statistics
+        self.discarded_lines = 0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _convert_lines(self, payloads: list[bytes]) -> np.ndarray:
+        rows = []
+        for payload in payloads:
+            try:
+                rows.append([float(value) for value in payload.split(b',')])
+            except ValueError:
+                self.discarded_lines += 1
+        return np.array(rows, dtype=np.float64).reshape(-1, _number_stream_fields)
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+_number_stream_fields = len(LVStreamingModeOutputIndexes)
+
+
+# same layout as LV_I2C_STREAM_FRAME, padded to the full frame size
+_i2c_stream_frame_dtype = np.dtype({'names': ['pump_enabled', 'voltage', 'current', 'frequency',
+                                              'ana_a', 'ana_b', 'ana_c', 'flow'],
+                                    'formats': ['<i2', '<f4', '<f4', '<i2', '<f4', '<f4', '<f4', '<f4'],
+                                    'offsets': [0, 2, 6, 10, 12, 16, 20, 24],
+                                    'itemsize': LV_I2C_STREAM_FRAME_SIZE})
@@ -0,0 +1,272 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import threading
+import time
+
+import numpy as np
+from EasyMCP2221.exceptions import TimeoutError as I2CTimeoutError
+
+from lee_ventus_disc_pump import *
+
+
+# ***********************************************************************************
+# * LVStreamingCapture class
+# ***********************************************************************************
+
+
+class LVStreamingCapture:
+    """
+        Fixed size ring buffer for continuous streaming mode capture.
+        Every streaming output is stored as one sample in a preallocated NumPy array, with one column per
+        LVStreamingModeOutputIndexes field plus a host timestamp column (TIMESTAMP). The timestamps are always kept
+        as float64, whatever the data type of the fields. Appending a sample is O(1) and the latest N samples can
+        always be returned as a view (without copying the data).
+    """
+
+    # column index of the host timestamp (time.time() when the sample was received)
+    TIMESTAMP = len(LVStreamingModeOutputIndexes)
+    NUMBER_COLUMNS = TIMESTAMP + 1
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def append(self, stream_output: list[float], timestamp=None):
+        """
+            Adds one streaming mode output to the buffer. When the buffer is full the oldest sample is overwritten.
+
+            Args:
+                stream_output (list[float]): The streaming mode output, as returned by streaming_mode_get_output.
+                timestamp (float, optional): Optional setting for the host time of the sample. Defaults to now.
+            Returns:
+                None
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        # every sample is written twice, capacity apart, so the latest samples are always one contiguous slice
+        index = self._write_index
+        self._data[:self.TIMESTAMP, index] = stream_output
+        self._data[:self.TIMESTAMP, index + self._capacity] = stream_output
+        self._timestamps[index] = timestamp
+        self._timestamps[index + self._capacity] = timestamp
+        self._last_timestamp = timestamp
+        with self._lock:
+            self._write_index = (index + 1) % self._capacity
+            self._total_samples += 1
+
+    def extend(self, stream_outputs: np.ndarray, timestamps=None):
+        """
+            Adds several streaming mode outputs to the buffer in one go. When the buffer is full the oldest samples
+            are overwritten.
+
+            Args:
+                stream_outputs (np.ndarray): The streaming mode outputs, as returned by streaming_mode_get_outputs
+                    (one row per output).
+                timestamps (np.ndarray, optional): Optional setting for the host time of each output. Defaults to
+                    times spread evenly between the previous sample and now, as a batch of outputs is received
+                    at once.
+            Returns:
+                None
+        """
+        number_samples = len(stream_outputs)
+        if number_samples == 0:
+            return
+        if timestamps is None:
+            now = time.time()
+            previous = now if self._last_timestamp is None else self._last_timestamp
+            timestamps = previous + (now - previous) * np.arange(1, number_samples + 1) / number_samples
+        # only the newest capacity samples can be kept
+        stream_outputs = np.asarray(stream_outputs)[-self._capacity:]
+        timestamps = np.asarray(timestamps, dtype=np.float64)[-self._capacity:]
+        write_index = self._write_index
+        indexes = (write_index + np.arange(len(stream_outputs))) % self._capacity
+        self._data[:self.TIMESTAMP, indexes] = stream_outputs.T
+        self._data[:self.TIMESTAMP, indexes + self._capacity] = stream_outputs.T
+        self._timestamps[indexes] = timestamps
+        self._timestamps[indexes + self._capacity] = timestamps
+        self._last_timestamp = float(timestamps[-1])
+        with self._lock:
+            self._write_index = (write_index + len(stream_outputs)) % self._capacity
+            self._total_samples += number_samples
+
+    def latest(self, number_samples=None) -> np.ndarray:
+        """
+            Returns the latest samples, oldest first, as a view into the buffer (no data is copied).
+            Rows are the columns (LVStreamingModeOutputIndexes fields and TIMESTAMP), so e.g.
+            capture.latest()[LVStreamingModeOutputIndexes.PRESSURE] is the pressure history.
+            The view is overwritten as new samples arrive, copy it if it needs to be kept. If the buffer has a data
+            type other than float64 a float64 copy is returned instead, so the timestamps keep their precision;
+            use column() to get views.
+
+            Args:
+                number_samples (int, optional): Optional setting for the number of samples to return. Defaults to
+                    all the samples in the buffer.
+            Returns:
+                np.ndarray: Array of shape (NUMBER_COLUMNS, number_samples).
+        """
+        start, end = self._latest_range(number_samples)
+        if self._timestamps.base is self._data:
+            return self._data[:, start:end]
+        return np.vstack((self._data[:, start:end], self._timestamps[start:end])).astype(np.float64)
+
+    def column(self, index: int, number_samples=None) -> np.ndarray:
+        """
+            Returns the latest values of one column, oldest first, as a view into the buffer.
+
+            Args:
+                index (int): The column to return, a LVStreamingModeOutputIndexes field or TIMESTAMP.
+                number_samples (int, optional): Optional setting for the number of samples to return. Defaults to
+                    all the samples in the buffer.
+            Returns:
+                np.ndarray: The column values. The TIMESTAMP column is always float64.
+        """
+        start, end = self._latest_range(number_samples)
+        if index == self.TIMESTAMP:
+            return self._timestamps[start:end]
+        return self._data[index, start:end]
+
+    def clear(self):
+        """
+            Empties the buffer.
+
+            Args:
+
+            Returns:
+                None
+        """
+        with self._lock:
+            self._write_index = 0
+            self._total_samples = 0
+            self._last_timestamp = None
+
+    def start(self, pump: LVDiscPump, timeout=1):
+        """
+            Starts a background thread that continuously reads the streaming mode output of a pump into the buffer.
+            Streaming mode should be enabled on the pump (streaming_mode_enable). The pump should not be used for
+            other streaming reads while the capture is running. Timeouts are counted and the capture carries on,
+            any other error stops the thread and is raised again by stop().
+
+            Args:
+                pump (LVDiscPump): The connected pump to capture from.
+                timeout (float, optional): Optional setting for the timeout in seconds of each streaming read.
+            Returns:
+                None
+        """
+        if self._thread is not None:
+            return
+        self._running = True
+        self._exception = None
+        self._thread = threading.Thread(target=self._run, args=(pump, timeout), name="LVStreamingCapture",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops the background capture thread. Raises the exception that stopped the thread, if any.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def total_samples(self) -> int:
+        """
+            The number of samples appended since the buffer was created or cleared (including overwritten ones).
+        """
+        return self._total_samples
+
+    @property
+    def overwritten_samples(self) -> int:
+        """
+            The number of samples that were lost because the buffer was full.
+        """
+        return max(0, self._total_samples - self._capacity)
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, capacity=100000, dtype=np.float64):
+        """
+            Args:
+                capacity (int, optional): Optional setting for the number of samples the buffer holds.
+                dtype (optional): Optional setting for the NumPy data type of the streaming fields, e.g. np.float32
+                    to halve the memory used. The timestamps are kept as float64 in any case.
+        """
+        self._capacity = capacity
+        if np.dtype(dtype) == np.float64:
+            # the timestamps are the last row of the data, so latest() can return everything as one view
+            self._data = np.zeros((self.NUMBER_COLUMNS, 2 * capacity), dtype=np.float64)
+            self._timestamps = self._data[self.TIMESTAMP]
+        else:
+            self._data = np.zeros((self.TIMESTAMP, 2 * capacity), dtype=dtype)
+            self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._write_index = 0
+        self._total_samples = 0
+        self._last_timestamp = None
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+        self._exception = None   # exception raised on the background thread, raised again by stop()
+
+        # statistics
+        self.timeouts = 0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _latest_range(self, number_samples) -> tuple[int, int]:
+        with self._lock:
+            available = min(self._total_samples, self._capacity)
+            end = self._write_index + self._capacity
+        if number_samples is None or number_samples > available:
+            number_samples = available
+        return end - number_samples, end
+
+    def _run(self, pump: LVDiscPump, timeout):
+        try:
+            while self._running:
+                try:
+                    stream_outputs = pump.streaming_mode_get_outputs(timeout=timeout)
+                except (LVTimeoutError, I2CTimeoutError):
+                    stream_outputs = None
+                if stream_outputs is None or len(stream_outputs) == 0:
+                    self.timeouts += 1
+                    continue
+                self.extend(stream_outputs)
+        except Exception as e:
+            self._exception = e
+        finally:
+            self._running = False
@@ -0,0 +1,230 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+from lee_ventus_streaming_capture import *
+
+
+# -----------------------------------------------------------------------------
+# System identification functions
+# -----------------------------------------------------------------------------
+
+
+def LVSystemId_fit_fopdt(times, inputs, outputs, max_dead_time=1.0) -> dict:
+    """
+        Fits a first-order-plus-dead-time model (gain, time constant, dead time) to a recorded response, e.g. the
+        pressure response to the drive power. The data is resampled at its median sample time and the discrete
+        model y[k+1] = a * y[k] + b * u[k - d] + c is fitted by least squares for every dead time d at once; the dead
+        time with the smallest error is kept.
+
+        Args:
+            times (np.ndarray): The time of each sample in seconds.
+            inputs (np.ndarray): The input at each sample, e.g. the drive power in mW.
+            outputs (np.ndarray): The output at each sample, e.g. the pressure in mBar.
+            max_dead_time (float, optional): The longest dead time tried in seconds.
+        Returns:
+            dict: "gain" (output per input), "time_constant" and "dead_time" in seconds, "offset" (output with no
+                input), "rms_error" of the one step ahead prediction and "sample_time" in seconds.
+    """
+    return _fit_record(times, inputs, outputs, 1, max_dead_time)
+
+
+def LVSystemId_fit_second_order(times, inputs, outputs, max_dead_time=1.0) -> dict:
+    """
+        Fits a second-order-plus-dead-time model to a recorded response, e.g. the flow response to the drive power
+        through a manifold with some compliance. Works like LVSystemId_fit_fopdt with the discrete model
+        y[k+1] = a1 * y[k] + a2 * y[k - 1] + b * u[k - d] + c.
+
+        Args:
+            times (np.ndarray): The time of each sample in seconds.
+            inputs (np.ndarray): The input at each sample, e.g. the drive power in mW.
+            outputs (np.ndarray): The output at each sample, e.g. the flow.
+            max_dead_time (float, optional): The longest dead time tried in seconds.
+        Returns:
+            dict: "gain" (output per input), "natural_frequency" in rad/s, "damping_ratio" (above 1 for two real
+                time constants), "dead_time" in seconds, "offset" (output with no input), "rms_error" of the one step
+                ahead prediction and "sample_time" in seconds.
+    """
+    return _fit_record(times, inputs, outputs, 2, max_dead_time)
+
+
+def LVSystemId_fit_windows(times, inputs, outputs, window_time: float, step_time=None, order=1,
+                           max_dead_time=1.0) -> dict:
+    """
+        Fits a model to every window of a long recording, e.g. to follow how the response of a manifold changes over
+        time. All the windows and dead times are fitted as one batch: the least squares sums of each window are taken
+        from running sums of the data, so the cost hardly depends on the number of windows. Windows that can't be
+        fitted (e.g. the input doesn't change in them) give NaN.
+
+        Args:
+            times (np.ndarray): The time of each sample in seconds.
+            inputs (np.ndarray): The input at each sample, e.g. the drive power in mW.
+            outputs (np.ndarray): The output at each sample, e.g. the pressure in mBar.
+            window_time (float): The length of each window in seconds.
+            step_time (float, optional): The time between the starts of the windows. Defaults to half a window.
+            order (int, optional): 1 for first-order-plus-dead-time models, 2 for second order models.
+            max_dead_time (float, optional): The longest dead time tried in seconds.
+        Returns:
+            dict: Arrays with one value per window: "start_time" and "end_time" and the values returned by
+                LVSystemId_fit_fopdt or LVSystemId_fit_second_order.
+    """
+    sample_time, uniform_times, u, y = _resample(times, inputs, outputs)
+    number_rows = len(y) - order
+    window_rows = min(int(round(window_time / sample_time)), number_rows)
+    if step_time is None:
+        step_time = window_time / 2
+    step_rows = max(1, int(round(step_time / sample_time)))
+    if window_rows < 2 * (order + 2):
+        raise Exception('Not enough samples to fit a model.')
+    starts = np.arange(0, number_rows - window_rows + 1, step_rows)
+    max_delay = min(int(max_dead_time / sample_time), window_rows // 2)
+
+    models = _fit_arx(u, y, sample_time, order, max_delay, starts, starts + window_rows)
+    models["start_time"] = uniform_times[starts + order - 1]
+    models["end_time"] = uniform_times[starts + window_rows + order - 1]
+    return models
+
+
+def LVSystemId_capture_data(capture: LVStreamingCapture, output_index=LVStreamingModeOutputIndexes.PRESSURE,
+                            number_samples=None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+        Copies the latest samples of a streaming capture as the times, drive power and output to fit a model to,
+        so models can be refitted while the capture carries on.
+
+        Args:
+            capture (LVStreamingCapture): The capture of the streaming mode output.
+            output_index (int, optional): The output column, e.g. LVStreamingModeOutputIndexes.PRESSURE or FLOW.
+            number_samples (int, optional): Optional setting for the number of samples. Defaults to all the samples
+                in the capture.
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]: The host times in seconds, the drive power in mW and the
+                output.
+    """
+    data = capture.latest(number_samples)
+    return (data[LVStreamingCapture.TIMESTAMP].copy(),
+            data[LVStreamingModeOutputIndexes.VOLTAGE] * data[LVStreamingModeOutputIndexes.CURRENT],
+            data[output_index].copy())
+
+
+# -----------------------------------------------------------------------------
+# Internal functions
+# -----------------------------------------------------------------------------
+
+
+def _resample(times, inputs, outputs) -> tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    # resamples the recording at its median sample time
+    times = np.asarray(times, dtype=np.float64)
+    if len(times) < 2:
+        raise Exception('Not enough samples to fit a model.')
+    sample_time = float(np.median(np.diff(times)))
+    uniform_times = np.arange(times[0], times[-1], sample_time)
+    u = np.interp(uniform_times, times, np.asarray(inputs, dtype=np.float64))
+    y = np.interp(uniform_times, times, np.asarray(outputs, dtype=np.float64))
+    return sample_time, uniform_times, u, y
+
+
+def _fit_record(times, inputs, outputs, order: int, max_dead_time: float) -> dict:
+    # fits one model to the whole recording
+    sample_time, _, u, y = _resample(times, inputs, outputs)
+    number_rows = len(y) - order
+    if number_rows < order + 2:
+        raise Exception('Not enough samples to fit a model.')
+    max_delay = min(int(max_dead_time / sample_time), number_rows // 2)
+    if np.ptp(u) == 0:
+        raise Exception('The input does not change enough to fit a model.')
+    models = _fit_arx(u, y, sample_time, order, max_delay, np.array([0]), np.array([number_rows]))
+    if np.isnan(models["gain"][0]):
+        raise Exception('The response does not look like a first order response.' if order == 1 else
+                        'The response does not look like a second order response.')
+    return {name: float(values[0]) for name, values in models.items()}
+
+
+def _fit_arx(u: np.ndarray, y: np.ndarray, sample_time: float, order: int, max_delay: int, starts: np.ndarray,
+             ends: np.ndarray) -> dict:
+    # fits y[k+1] = a1 * y[k] + ... + b * u[k - d] + c over the rows starts[w]:ends[w] of every window w, for every
+    # dead time d, and keeps the dead time with the smallest error in each window. Centring the data keeps the running
+    # sums well conditioned
+    u_mean, y_mean = np.mean(u), np.mean(y)
+    u, y = u - u_mean, y - y_mean
+    number_rows = len(y) - order
+    delays = np.arange(max_delay + 1)
+    y_next = y[order:]
+    # regressors of the rows k = order - 1 ... len(y) - 2, shaped (1 or delays, rows), with u_delayed[d, k] = u[k - d]
+    # and the input before the recording taken as its first value
+    u_padded = np.concatenate((np.full(max_delay, u[0]), u[:-1]))
+    u_delayed = np.lib.stride_tricks.sliding_window_view(u_padded, number_rows)[max_delay + order - 1 - delays]
+    regressors = [y[order - 1 - lag:len(y) - 1 - lag][None] for lag in range(order)]
+    regressors += [u_delayed, np.ones((1, number_rows))]
+
+    def window_sums(values):
+        running_sums = np.concatenate((np.zeros(values.shape[:-1] + (1,)), np.cumsum(values, axis=-1)), axis=-1)
+        return (running_sums[..., ends] - running_sums[..., starts]).T   # (windows, 1 or delays)
+
+    # normal equations of all the windows and dead times, solved as one batch. The pseudo-inverse copes with the
+    # windows and dead times that leave no change of input in the data
+    number_regressors = len(regressors)
+    gram = np.empty((len(starts), len(delays), number_regressors, number_regressors))
+    projection = np.empty((len(starts), len(delays), number_regressors))
+    for i in range(number_regressors):
+        projection[:, :, i] = window_sums(regressors[i] * y_next)
+        for j in range(i + 1):
+            gram[:, :, i, j] = gram[:, :, j, i] = window_sums(regressors[i] * regressors[j])
+    parameters = np.einsum('wdij,wdj->wdi', np.linalg.pinv(gram), projection)
+    residuals = window_sums(y_next[None] ** 2) - 2 * np.einsum('wdi,wdi->wd', parameters, projection) \
+        + np.einsum('wdi,wdij,wdj->wd', parameters, gram, parameters)
+    errors = np.sqrt(np.maximum(residuals, 0) / (ends - starts)[:, None])
+
+    # variance of the delayed input in each window, the windows where it doesn't change can't be fitted
+    excitation = gram[:, :, order, order] - gram[:, :, order, -1] ** 2 / gram[:, :, -1, -1]
+
+    a = parameters[:, :, :order]
+    b = parameters[:, :, order]
+    c = parameters[:, :, order + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if order == 1:
+            valid = (a[:, :, 0] > 0) & (a[:, :, 0] < 1)   # a stable first order response
+        else:
+            # poles of z^2 - a1 * z - a2, stable and not negative real (no continuous time equivalent)
+            root = np.sqrt(a[:, :, 0] ** 2 + 4 * a[:, :, 1] + 0j)
+            poles = np.stack(((a[:, :, 0] + root) / 2, (a[:, :, 0] - root) / 2))
+            valid = np.all((np.abs(poles) < 1) & ~((poles.imag == 0) & (poles.real <= 0)), axis=0)
+        errors[~valid | (excitation <= 1e-9 * gram[:, :, order, order])] = np.inf
+
+        best = np.argmin(errors, axis=1)
+        windows = np.arange(len(starts))
+        fitted = np.isfinite(errors[windows, best])
+        a, b, c = a[windows, best], b[windows, best], c[windows, best]
+        static_gain = 1 - np.sum(a, axis=1)
+        models = {"gain": b / static_gain}
+        if order == 1:
+            models["time_constant"] = -sample_time / np.log(a[:, 0])
+        else:
+            poles = np.log(poles[:, windows, best]) / sample_time
+            models["natural_frequency"] = np.sqrt(np.real(poles[0] * poles[1]))
+            models["damping_ratio"] = -np.real(poles[0] + poles[1]) / (2 * models["natural_frequency"])
+        models["dead_time"] = delays[best] * sample_time
+        models["offset"] = y_mean + (c - b * u_mean) / static_gain
+        models["rms_error"] = errors[windows, best]
+    for name in models:
+        models[name] = np.where(fitted, models[name], np.nan)
+    models["sample_time"] = np.full(len(starts), sample_time)
+    return models
@@ -0,0 +1,237 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import collections
+import threading
+import time
+
+from lee_ventus_register import LVTimeoutError
+
+
+# ***********************************************************************************
+# * LVUartReader class
+# ***********************************************************************************
+
+
+class LVUartReader:
+    """
+        Background reader that owns the receive side of a UART connected pump.
+        Every line received from the driver is sorted by type:
+         - "#R<id>,<value>" register replies are stored in a reply slot per register ID
+         - "#S..." streaming lines are parsed and appended to the stream queue
+        This allows register reads and streaming to run at the same time without flushing the serial buffer.
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def start(self):
+        """
+            Starts the background reader thread.
+
+            Args:
+
+            Returns:
+                None
+        """
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="LVUartReader", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops the background reader thread and waits for it to finish.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def clear_reply(self, reg_id: int):
+        """
+            Clears the reply slot of a register. Should be called before sending a read request, so that an old
+            reply is not mistaken for the new one.
+
+            Args:
+                reg_id (int): The register ID (number) whose reply slot should be cleared.
+            Returns:
+                None
+        """
+        with self._condition:
+            self._replies.pop(reg_id, None)
+
+    def wait_for_reply(self, reg_id: int, timeout=1) -> float:
+        """
+            Waits for a reply to a register read and removes it from its reply slot.
+
+            Args:
+                reg_id (int): The register ID (number) that was read.
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for a response.
+            Returns:
+                float: The value of the given register.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while reg_id not in self._replies:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    raise LVTimeoutError("Didn't get expected response from driver")
+                self._condition.wait(remaining)
+            return self._replies.pop(reg_id)
+
+    def get_stream_output(self, timeout=1) -> list[float]:
+        """
+            Returns the oldest streaming mode output that has not been returned yet (as listed in
+            LVStreamingModeOutputIndexes). Waits for a new line if the stream queue is empty.
+
+            Args:
+                timeout (float, optional): Optional setting for the timeout in seconds that the function will wait
+                    for a response.
+            Returns:
+                list[float]: The streaming mode output, or None if no output arrived before the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while len(self._stream_queue) == 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    return None
+                self._condition.wait(remaining)
+            return self._stream_queue.popleft()
+
+    def clear_stream_queue(self):
+        """
+            Discards all the queued streaming mode outputs.
+
+            Args:
+
+            Returns:
+                None
+        """
+        with self._condition:
+            self._stream_queue.clear()
+
+    def stream_queue_length(self) -> int:
+        """
+            Returns the number of streaming mode outputs waiting in the stream queue.
+
+            Args:
+
+            Returns:
+                int: The number of queued outputs.
+        """
+        with self._condition:
+            return len(self._stream_queue)
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, com_port, stream_queue_size=10000):
+        """
+            Args:
+                com_port (serial.Serial): The open serial port of the pump. The reader should be the only user of
+                    the receive side of the port.
+                stream_queue_size (int, optional): Optional setting for the maximum number of streaming outputs kept.
+                    When the queue is full the oldest output is dropped and counted in dropped_stream_outputs.
+        """
+        self._com_port = com_port
+        self._condition = threading.Condition()
+        self._replies = {}
+        self._stream_queue = collections.deque(maxlen=stream_queue_size)
+        self._running = False
+        self._thread = None
+
+        # optional functions called from the reader thread with every register reply (reg_id, value) and every
+        # streaming output (list[float]). If the function returns True the reply or output is consumed and not stored
+        self.reply_listener = None
+        self.stream_listener = None
+
+        # statistics
+        self.bytes_received = 0
+        self.dropped_stream_outputs = 0
+        self.discarded_lines = 0
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _run(self):
+        pending = b''
+        while self._running:
+            try:
+                # read whatever is waiting (at least one byte so the port timeout paces the loop)
+                data = self._com_port.read(max(1, self._com_port.in_waiting))
+            except Exception:
+                # the port was closed underneath us
+                break
+            if not data:
+                continue
+            self.bytes_received += len(data)
+            pending += data
+            if b'\n' not in pending:
+                continue
+            *lines, pending = pending.split(b'\n')
+            for line_chars in lines:
+                self._handle_line(line_chars)
+
+        self._running = False
+        with self._condition:
+            self._condition.notify_all()
+
+    def _handle_line(self, line_chars: bytes):
+        if not line_chars.isascii():
+            # Ignore this line, as we've read a
+            # byte that can't be decoded
+            self.discarded_lines += 1
+            return
+        line = line_chars.decode('ascii').strip()
+        try:
+            if line.startswith('#R'):
+                reg_id, value = line[2:].split(',')
+                reg_id, value = int(reg_id), float(value)
+                if self.reply_listener is not None and self.reply_listener(reg_id, value):
+                    return
+                with self._condition:
+                    self._replies[reg_id] = value
+                    self._condition.notify_all()
+            elif line.startswith('#S'):
+                all_values = [float(value) for value in line[2:].split(',')]   # remove the "#S" at the beginning
+                if len(all_values) != 8:
+                    raise ValueError
+                if self.stream_listener is not None and self.stream_listener(all_values):
+                    return
+                with self._condition:
+                    if len(self._stream_queue) == self._stream_queue.maxlen:
+                        self.dropped_stream_outputs += 1
+                    self._stream_queue.append(all_values)
+                    self._condition.notify_all()
+        except ValueError:
+            # partial or corrupted line
+            self.discarded_lines += 1
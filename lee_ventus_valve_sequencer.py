@@ -0,0 +1,373 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+from lee_ventus_scheduler import *
+
+
+# ***********************************************************************************
+# * LVValveSequencer class
+# ***********************************************************************************
+
+
+class LVValveSequencer:
+    """
+        Plays a timeline of valve pulses and static states on the GPIO outputs (A to D). When the timeline is compiled
+        every pulse train that the board can generate by itself (GPIO A to C set as outputs, pulses and period within
+        the limits of the pin mode: 10us units up to 300ms in fast mode, 1ms units up to 30s in slow mode) is written
+        as a board pulse train (*_PULSE_DURATION, *_PULSE_PERIOD and the number of pulses to *_STATE), so the pulse
+        widths are timed by the board. The pulse registers are written ahead of the start, only when they change,
+        so only the state write is on the time line. Everything else is played as STATIC_ON / STATIC_OFF writes
+        from the host at their deadlines. The time each write completed is recorded to measure the timing error.
+
+        Example:
+            sequencer = LVValveSequencer(pump)
+            sequencer.add_pulses("B", start_time=0, duration=0.05, number_pulses=10, period=0.25)
+            sequencer.run()
+            print(sequencer.statistics())
+    """
+
+    GPIOS = ("A", "B", "C", "D")
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def add_pulses(self, gpio: str, start_time: float, duration: float, number_pulses=1, period=None,
+                   use_board_pulses=True):
+        """
+            Adds a train of pulses on a GPIO output to the timeline.
+
+            Args:
+                gpio (str): The GPIO output, "A", "B", "C" or "D".
+                start_time (float): The time of the first pulse in seconds from the start of the timeline.
+                duration (float): The on time of each pulse in seconds.
+                number_pulses (int, optional): The number of pulses.
+                period (float, optional): The time between the starts of the pulses in seconds (on + off time).
+                    Needed for more than one pulse.
+                use_board_pulses (bool, optional): Optional setting to always play the pulses from the host.
+            Returns:
+                None
+        """
+        if number_pulses > 1 and (period is None or period <= duration):
+            raise Exception('The period must be longer than the pulse duration.')
+        if number_pulses == 1:
+            period = duration
+        end_time = start_time + (number_pulses - 1) * period + duration
+        self._add_event(gpio, start_time, end_time, {"kind": "pulses", "duration": duration, "period": period,
+                                                     "number_pulses": int(number_pulses),
+                                                     "use_board_pulses": use_board_pulses})
+
+    def add_state(self, gpio: str, event_time: float, on: bool):
+        """
+            Adds a static state change of a GPIO output to the timeline.
+
+            Args:
+                gpio (str): The GPIO output, "A", "B", "C" or "D".
+                event_time (float): The time of the change in seconds from the start of the timeline.
+                on (bool): True to turn the output on (STATIC_ON), False to turn it off (STATIC_OFF).
+            Returns:
+                None
+        """
+        self._add_event(gpio, event_time, event_time, {"kind": "state", "on": on})
+
+    def clear(self):
+        """
+            Removes all the events from the timeline.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._events.clear()
+        self._actions = None
+
+    def compile(self) -> list[dict]:
+        """
+            Compiles the timeline into the register writes that play it. Called by run() if needed.
+
+            Args:
+
+            Returns:
+                list[dict]: The actions in time order, with the "time_s" they are due at, the "gpio", the "kind"
+                    ("configure" for pulse registers written ahead of a board pulse train, "board_pulses" for the
+                    state write that starts it or "host_write" for a static state) and the "writes" as a dictionary of
+                    values keyed by register ID.
+        """
+        actions = []
+        self._pulse_durations = []
+        pulse_settings = {}   # pulse registers last written on each GPIO
+        for gpio in self.GPIOS:
+            previous_end = None
+            for event in sorted((event for event in self._events if event["gpio"] == gpio),
+                                key=lambda event: event["start_time"]):
+                registers = _GPIO_REGISTERS[gpio]
+                settings = self._board_pulse_settings(event) if event["kind"] == "pulses" else None
+                if settings is not None:
+                    if pulse_settings.get(gpio) != settings:
+                        # written ahead of the start, once the previous event of the GPIO is over
+                        configure_time = event["start_time"] - self.configure_lead_time
+                        if previous_end is not None:
+                            configure_time = min(max(configure_time, previous_end), event["start_time"])
+                        actions.append(self._action(configure_time, gpio, "configure",
+                                                    {registers[_DURATION]: settings[0],
+                                                     registers[_PERIOD]: settings[1]}))
+                        pulse_settings[gpio] = settings
+                    actions.append(self._action(event["start_time"], gpio, "board_pulses",
+                                                {registers[_STATE]: event["number_pulses"]}))
+                elif event["kind"] == "pulses":
+                    for index in range(event["number_pulses"]):
+                        on_time = event["start_time"] + index * event["period"]
+                        pulse = len(self._pulse_durations)
+                        self._pulse_durations.append(event["duration"])
+                        actions.append(self._action(on_time, gpio, "host_write",
+                                                    {registers[_STATE]: LVGpioStaticStates.STATIC_ON}, pulse))
+                        actions.append(self._action(on_time + event["duration"], gpio, "host_write",
+                                                    {registers[_STATE]: LVGpioStaticStates.STATIC_OFF}, pulse))
+                else:
+                    state = LVGpioStaticStates.STATIC_ON if event["on"] else LVGpioStaticStates.STATIC_OFF
+                    actions.append(self._action(event["start_time"], gpio, "host_write", {registers[_STATE]: state}))
+                previous_end = event["end_time"]
+
+        # configure writes go first when actions are due at the same time
+        actions.sort(key=lambda action: (action["time_s"], action["kind"] != "configure"))
+        self._actions = actions
+        return [{name: action[name] for name in ("time_s", "gpio", "kind", "writes")} for action in actions]
+
+    def run(self):
+        """
+            Plays the timeline and returns when it is complete or stop() is called.
+
+            Args:
+
+            Returns:
+                None
+        """
+        if self._actions is None:
+            self.compile()
+        self._stop_event.clear()
+        self._delivered_times = []
+        # the time line starts late enough for the configure writes due before the first event
+        first_time = min([action["time_s"] for action in self._actions], default=0.0)
+        self._start_time = time.perf_counter() + max(0.0, -first_time)
+        for action in self._actions:
+            if self._stop_event.is_set():
+                break
+            LVScheduler_sleep_until(self._start_time + action["time_s"], self.spin_time)
+            for reg_id, value in action["writes"].items():
+                self.disc_pump_instance.write_reg(reg_id, value, sleep_after=0)
+            self._delivered_times.append(time.perf_counter() - self._start_time)
+
+    def start(self):
+        """
+            Plays the timeline on a background thread. If a write fails the sequencer stops and the exception is
+            raised again by stop().
+
+            Args:
+
+            Returns:
+                None
+        """
+        if self.is_running:
+            raise Exception('The sequencer is already running.')
+        if self._actions is None:
+            self.compile()
+        self._exception = None
+        self._thread = threading.Thread(target=self._run_thread, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+            Stops playing the timeline after the current write. Raises the exception that stopped the background
+            thread, if any.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        exception, self._exception = self._exception, None
+        if exception is not None:
+            raise exception
+
+    def results(self) -> dict:
+        """
+            Returns the actions played so far.
+
+            Args:
+
+            Returns:
+                dict: The "gpio" and "kind" of each action played and NumPy arrays of the "commanded_time_s" it was
+                    due at, the "delivered_time_s" its writes completed and the timing "error_s" between them.
+        """
+        played = self._actions[:len(self._delivered_times)] if self._actions is not None else []
+        commanded_times = np.array([action["time_s"] for action in played], dtype=np.float64)
+        delivered_times = np.array(self._delivered_times, dtype=np.float64)
+        return {"gpio": [action["gpio"] for action in played],
+                "kind": [action["kind"] for action in played],
+                "commanded_time_s": commanded_times,
+                "delivered_time_s": delivered_times,
+                "error_s": delivered_times - commanded_times}
+
+    def statistics(self) -> dict:
+        """
+            Returns how accurately the timeline was played. Configure writes are not on the time line and are not
+            included in the timing errors.
+
+            Args:
+
+            Returns:
+                dict: The number of "board_pulse_trains" and "host_writes" played, the mean and maximum timing error
+                    of the state writes in seconds and, for the pulses played from the host, the maximum error of the
+                    pulse widths in seconds.
+        """
+        results = self.results()
+        played = self._actions[:len(self._delivered_times)] if self._actions is not None else []
+        timed = np.array([kind != "configure" for kind in results["kind"]], dtype=bool)
+        errors = results["error_s"][timed] if len(timed) != 0 else np.empty(0)
+
+        pulse_times = {}
+        for action, delivered_time in zip(played, results["delivered_time_s"]):
+            if action["pulse"] is not None:
+                pulse_times.setdefault(action["pulse"], []).append(delivered_time)
+        width_errors = [abs(times[1] - times[0] - self._pulse_durations[pulse])
+                        for pulse, times in pulse_times.items() if len(times) == 2]
+
+        return {"board_pulse_trains": results["kind"].count("board_pulses"),
+                "host_writes": results["kind"].count("host_write"),
+                "mean_error_s": float(np.mean(errors)) if len(errors) != 0 else 0.0,
+                "max_error_s": float(np.max(np.abs(errors))) if len(errors) != 0 else 0.0,
+                "max_pulse_width_error_s": float(max(width_errors)) if len(width_errors) != 0 else 0.0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def start_time(self) -> float:
+        """
+            The time.perf_counter() value the time line started at, None before the sequencer is run.
+        """
+        return self._start_time
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, disc_pump_instance: LVDiscPump, configure_lead_time=0.05, spin_time=0.001):
+        """
+            Reads the pin modes of GPIO A to C to know which pulse trains the board can generate.
+
+            Args:
+                disc_pump_instance (LVDiscPump): The connected pump.
+                configure_lead_time (float, optional): The time before a board pulse train its pulse registers are
+                    written, when the GPIO is free.
+                spin_time (float, optional): The time before each deadline to stop sleeping and start spinning.
+        """
+        self.disc_pump_instance = disc_pump_instance
+        self.configure_lead_time = configure_lead_time
+        self.spin_time = spin_time
+        pin_mode_registers = [registers[_PIN_MODE] for registers in _GPIO_REGISTERS.values()
+                              if registers[_PIN_MODE] is not None]
+        pin_modes = disc_pump_instance.read_registers(pin_mode_registers)
+        self._pin_modes = {gpio: pin_modes[registers[_PIN_MODE]] for gpio, registers in _GPIO_REGISTERS.items()
+                           if registers[_PIN_MODE] is not None}
+        self._events = []
+        self._actions = None
+        self._pulse_durations = []   # requested width of each pulse played from the host
+        self._delivered_times = []
+        self._start_time = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._exception = None   # exception raised on the background thread, raised again by stop()
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _run_thread(self):
+        try:
+            self.run()
+        except Exception as e:
+            self._exception = e
+
+    def _add_event(self, gpio: str, start_time: float, end_time: float, event: dict):
+        if gpio not in _GPIO_REGISTERS:
+            raise Exception('Unknown GPIO, use "A", "B", "C" or "D".')
+        if gpio in self._pin_modes and self._pin_modes[gpio] not in _OUTPUT_PIN_MODES:
+            raise Exception(f'GPIO {gpio} is not configured as an output.')
+        for other in self._events:
+            if other["gpio"] == gpio and start_time < other["end_time"] and other["start_time"] < end_time:
+                raise Exception(f'The event overlaps another event on GPIO {gpio}.')
+        event.update({"gpio": gpio, "start_time": start_time, "end_time": end_time})
+        self._events.append(event)
+        self._actions = None
+
+    def _board_pulse_settings(self, event: dict):
+        # pulse duration and period in the units of the pin mode, or None if the board can't generate the pulses
+        pin_mode = self._pin_modes.get(event["gpio"])
+        if not event["use_board_pulses"] or pin_mode not in _OUTPUT_PIN_MODES:
+            return None
+        unit, max_time = _OUTPUT_PIN_MODES[pin_mode]
+        duration = int(round(event["duration"] / unit))
+        period = int(round(event["period"] / unit))
+        if event["number_pulses"] == 1:
+            period = duration + 1
+        if duration < 1 or period > round(max_time / unit) or period <= duration:
+            return None
+        return duration, period
+
+    def _action(self, action_time: float, gpio: str, kind: str, writes: dict, pulse=None) -> dict:
+        return {"time_s": action_time, "gpio": gpio, "kind": kind, "writes": writes, "pulse": pulse}
+
+
+# -----------------------------------------------------------------------------
+# Internal variables
+# -----------------------------------------------------------------------------
+
+
+# registers of each GPIO, GPIO D is a static output only
+_GPIO_REGISTERS = {"A": (LVRegister.GPIO_A_PIN_MODE, LVRegister.GPIO_A_STATE, LVRegister.GPIO_A_PULSE_DURATION,
+                         LVRegister.GPIO_A_PULSE_PERIOD),
+                   "B": (LVRegister.GPIO_B_PIN_MODE, LVRegister.GPIO_B_STATE, LVRegister.GPIO_B_PULSE_DURATION,
+                         LVRegister.GPIO_B_PULSE_PERIOD),
+                   "C": (LVRegister.GPIO_C_PIN_MODE, LVRegister.GPIO_C_STATE, LVRegister.GPIO_C_PULSE_DURATION,
+                         LVRegister.GPIO_C_PULSE_PERIOD),
+                   "D": (None, LVRegister.GPIO_D_STATE, None, None)}
+_PIN_MODE = 0
+_STATE = 1
+_DURATION = 2
+_PERIOD = 3
+
+# pulse time unit and longest pulse period in seconds of the output pin modes
+_OUTPUT_PIN_MODES = {LVGpioPinMode.OUTPUT_FAST_MODE_DEF_HIGH: (0.00001, 0.3),
+                     LVGpioPinMode.OUTPUT_FAST_MODE_DEF_LOW: (0.00001, 0.3),
+                     LVGpioPinMode.OUTPUT_SLOW_MODE_DEF_HIGH: (0.001, 30),
+                     LVGpioPinMode.OUTPUT_SLOW_MODE_DEF_LOW: (0.001, 30)}
@@ -0,0 +1,170 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+import time
+
+import numpy as np
+
+from lee_ventus_disc_pump import *
+from lee_ventus_scheduler import *
+
+
+# ***********************************************************************************
+# * LVWaveformPlayer class
+# ***********************************************************************************
+
+
+class LVWaveformPlayer:
+    """
+        Plays a sequence of set points to a register (SET_VAL by default) at a fixed sample rate. Set point n is due
+        at n / sample rate seconds after the start. If a write takes so long that later set points are already due,
+        only the latest one is written and the ones in between are skipped, so the waveform never falls behind.
+        The time each set point was due (commanded) and the time its write completed (delivered) are recorded.
+        The set points can be a NumPy array or, for very long profiles, an iterable of arrays that is read one chunk
+        at a time as the waveform plays.
+
+        Example:
+            player = LVWaveformPlayer(pump, (np.sin(np.arange(200) * np.pi / 10) + 1) * 500, sample_rate=20)
+            player.play()
+    """
+
+    # -----------------------------------------------------------------------------
+    # Public functions
+    # -----------------------------------------------------------------------------
+
+    def play(self):
+        """
+            Plays the waveform and returns when it is complete or stop() is called.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._scheduler.run()
+
+    def start(self):
+        """
+            Plays the waveform on a background thread.
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._scheduler.start()
+
+    def stop(self):
+        """
+            Stops playing the waveform after the current write. Raises the exception that stopped playing on the
+            background thread, if any (e.g. a failed write).
+
+            Args:
+
+            Returns:
+                None
+        """
+        self._scheduler.stop()
+
+    def results(self) -> dict:
+        """
+            Returns the set points written so far.
+
+            Args:
+
+            Returns:
+                dict: NumPy arrays with the "index" of each set point written, its "value", the "commanded_time_s" it
+                    was due at and the "delivered_time_s" its write completed, both in seconds since the start.
+        """
+        return {"index": np.array(self._indexes, dtype=np.int64),
+                "value": np.array(self._values, dtype=np.float64),
+                "commanded_time_s": np.array(self._indexes, dtype=np.float64) / self.sample_rate,
+                "delivered_time_s": np.array(self._delivered_times, dtype=np.float64)}
+
+    def statistics(self) -> dict:
+        """
+            Returns how well the waveform was delivered.
+
+            Args:
+
+            Returns:
+                dict: The number of set points written and skipped, and the mean and maximum delay between when a
+                    set point was due and when its write completed, in seconds.
+        """
+        results = self.results()
+        delays = results["delivered_time_s"] - results["commanded_time_s"]
+        return {"written": len(delays),
+                "skipped": self._scheduler.statistics()["missed_deadlines"],
+                "mean_delay_s": float(np.mean(delays)) if len(delays) != 0 else 0.0,
+                "max_delay_s": float(np.max(delays)) if len(delays) != 0 else 0.0}
+
+    @property
+    def is_playing(self) -> bool:
+        return self._scheduler.is_running
+
+    # -----------------------------------------------------------------------------
+    # Initialisation / de-initialisation functions
+    # -----------------------------------------------------------------------------
+
+    def __init__(self, disc_pump_instance: LVDiscPump, setpoints, sample_rate: float, reg_id=LVRegister.SET_VAL,
+                 rounding_decimal_places=3):
+        """
+            Args:
+                disc_pump_instance (LVDiscPump): The connected pump.
+                setpoints (np.ndarray or iterable of np.ndarray): The set points, or chunks of set points.
+                sample_rate (float): The number of set points per second.
+                reg_id (int, optional): The register the set points are written to.
+                rounding_decimal_places (int, optional): The number of decimal places to round to.
+        """
+        self.disc_pump_instance = disc_pump_instance
+        self.sample_rate = sample_rate
+        self.reg_id = reg_id
+        self.rounding_decimal_places = rounding_decimal_places
+        if isinstance(setpoints, np.ndarray):
+            setpoints = [setpoints]
+        self._chunks = iter(setpoints)
+        self._chunk = np.empty(0)
+        self._chunk_start_index = 0   # index of the first set point of the current chunk
+        self._scheduler = LVPeriodicScheduler(1 / sample_rate, self._write_setpoint)
+
+        # set points written
+        self._indexes = []
+        self._values = []
+        self._delivered_times = []
+
+    # -----------------------------------------------------------------------------
+    # Private functions
+    # -----------------------------------------------------------------------------
+
+    def _write_setpoint(self, index: int, scheduled_time: float) -> bool:
+        # move on to the chunk holding the set point due, skipping whole chunks if needed
+        while index >= self._chunk_start_index + len(self._chunk):
+            self._chunk_start_index += len(self._chunk)
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return False
+            self._chunk = np.asarray(chunk, dtype=np.float64).ravel()
+
+        value = float(self._chunk[index - self._chunk_start_index])
+        self.disc_pump_instance.write_reg(self.reg_id, value, self.rounding_decimal_places, sleep_after=0)
+        self._delivered_times.append(time.perf_counter() - self._scheduler.start_time)
+        self._indexes.append(index)
+        self._values.append(value)
+        return True
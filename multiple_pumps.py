@@ -21,6 +21,7 @@ Technical Note TN003: Communications Guide
 
 import time
 from lee_ventus_disc_pump import *
+from lee_ventus_pump_fleet import *
 
 if __name__ == '__main__':
     """"
@@ -61,18 +62,18 @@ if __name__ == '__main__':
         spmI2C_2.write_reg(LVRegister.SET_VAL, 1000)
         gp.write_reg(LVRegister.SET_VAL, 1000)
 
-        # turn the pumps on
-        spmI2C_1.write_reg(LVRegister.PUMP_ENABLE, 1)
-        spmI2C_2.write_reg(LVRegister.PUMP_ENABLE, 1)
-        gp.write_reg(LVRegister.PUMP_ENABLE, 1)
+        # turn the pumps on at the same time. The fleet writes to the UART pump and the I2C bus in parallel
+        fleet = LVPumpFleet([spmI2C_1, spmI2C_2, gp])
+        broadcast_result = fleet.broadcast(LVRegister.PUMP_ENABLE, 1)
+        print(f"Pumps turned on within {broadcast_result['skew_s'] * 1000:.2f}ms of each other")
 
         # wait for a second
         time.sleep(1)
 
-        # turn the pumps off
-        spmI2C_1.write_reg(LVRegister.PUMP_ENABLE, 0)
-        spmI2C_2.write_reg(LVRegister.PUMP_ENABLE, 0)
-        gp.write_reg(LVRegister.PUMP_ENABLE, 0)
+        # turn the pumps off at the same time
+        broadcast_result = fleet.broadcast(LVRegister.PUMP_ENABLE, 0)
+        print(f"Pumps turned off within {broadcast_result['skew_s'] * 1000:.2f}ms of each other")
+        fleet.close()
 
         # close serial port / I2C connections
         spmI2C_1.disconnect_pump()
@@ -0,0 +1,58 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+For up-to-date information on the UART or I2C commands and functionality please refer to:
+Technical Note TN003: Communications Guide
+"""
+
+from lee_ventus_disc_pump import *
+from lee_ventus_autotune import *
+
+if __name__ == '__main__':
+    """"
+    Tunes the pressure PID of the pump. The pump is stepped from 0 to 500mW in manual power control, a model of the
+    pressure response is fitted and PI gains are computed and written to the board. A pressure step is then run with
+    the new gains and its overshoot and settling time are printed.
+    The pump can be connected either via I2C or UART. For I2C SPM the Mains PSU needs to be connected to the Dev board.
+    Note that I2C streaming is only supported on SPMs with Firmware version 6.16 and later.
+    """
+
+    # create a Disc Pump instance
+    myPump = LVDiscPump()
+
+    # A GP driver always uses UART. The SPM can be connected through either I2C or UART
+    # the background reader makes sure no streaming outputs are lost while the response is captured
+    # replace COM port number with the COM port you are using
+    myPump.connect_pump(com_port="COM6", background_reader=True)
+    # myPump.connect_pump(i2c_address=37)  # replace the I2C address with the address you are using (37 is the default)
+
+    # run the step experiment and apply the gains
+    result = LVAutotune_run(myPump,
+                            measurement_source=LVControlSource.DIGITAL_PRESSURE,  # SPM and Dev kit use digital pressure
+                            # measurement_source=LVControlSource.ANA_B,  # Evaluation kit uses analog pressure
+                            low_power=0, high_power=500)
+
+    model = result["model"]
+    print(f'Model: gain {model["gain"]:.4f} mBar/mW, time constant {model["time_constant"]:.3f}s, '
+          f'dead time {model["dead_time"]:.3f}s')
+    print(f'Gains applied: P {result["p_term"]:.3f}, I {result["i_term"]:.3f}, D {result["d_term"]:.3f}')
+    print(f'Overshoot {result["overshoot_percent"]:.1f}%, settling time {result["settling_time_s"]}s')
+
+    # save the new gains on the board so they are kept after a power cycle
+    # myPump.store_current_settings_to_board()
+
+    # close serial port / I2C connection
+    myPump.disconnect_pump()
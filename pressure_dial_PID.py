@@ -19,8 +19,8 @@ For up-to-date information on the UART or I2C commands and functionality please
 Technical Note TN003: Communications Guide
 """
 
-import time
 from lee_ventus_disc_pump import *
+from lee_ventus_scheduler import *
 
 if __name__ == '__main__':
     """"
@@ -71,16 +71,16 @@ if __name__ == '__main__':
     # turn the pump on
     myPump.write_reg(LVRegister.PUMP_ENABLE, 1)
 
-    # loop for 30s
-    start_time = float(time.time())
-    current_time = start_time
-    while current_time - start_time < 30:
-        time.sleep(0.5)
-        # read the drive power and pressure of the pump and print them every 0.5s
-        drive_power = myPump.read_register(LVRegister.MEAS_DRIVE_MILLIWATTS)
-        pressure = myPump.read_register(LVRegister.MEAS_DIGITAL_PRESSURE)
-        current_time = float(time.time())
-        print(f'Time [s] {current_time - start_time:.1f}, Drive power [mW] {drive_power:.1f}, Pressure [mBar] {pressure:.1f}')
+    # read the drive power and pressure of the pump and print them every 0.5s
+    def print_measurements(tick, scheduled_time):
+        # both registers are requested together so they cost a single round trip
+        measurements = myPump.read_registers([LVRegister.MEAS_DRIVE_MILLIWATTS, LVRegister.MEAS_DIGITAL_PRESSURE])
+        drive_power = measurements[LVRegister.MEAS_DRIVE_MILLIWATTS]
+        pressure = measurements[LVRegister.MEAS_DIGITAL_PRESSURE]
+        print(f'Time [s] {scheduled_time:.1f}, Drive power [mW] {drive_power:.1f}, Pressure [mBar] {pressure:.1f}')
+
+    # loop for 30s. The scheduler keeps to the 0.5s period however long the reads take
+    LVPeriodicScheduler(0.5, print_measurements).run(duration=30)
 
     # turn the pump off
     myPump.write_reg(LVRegister.PUMP_ENABLE, 0)
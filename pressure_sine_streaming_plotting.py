@@ -19,9 +19,9 @@ For up-to-date information on the UART or I2C commands and functionality please
 Technical Note TN003: Communications Guide
 """
 
-import time
 from lee_ventus_disc_pump import *
-import math
+from lee_ventus_waveform_player import *
+import numpy as np
 from matplotlib import pyplot as plt
 
 if __name__ == '__main__':
@@ -58,21 +58,22 @@ if __name__ == '__main__':
     # enable streaming mode back on
     myPump.streaming_mode_enable()
 
-    # Create a sine-wave, from 0->100
-    sine_wave = ((math.sin(i * math.pi / 10) + 1) * 50 + 25
-                 for i in range(95))
+    # Create a sine-wave, from 25->125
+    sine_wave = (np.sin(np.arange(95) * np.pi / 10) + 1) * 50 + 25
+
+    # Send sine-wave to the driver in the background at 20 set points per second
+    player = LVWaveformPlayer(myPump, sine_wave, sample_rate=20)
+    player.start()
 
     pressures = []
     powers = []
-    # Send sine-wave to the driver
-    for target_pressure in sine_wave:
+    while player.is_playing:
         # Record streaming data from the driver, so it can be plotted afterwards
         stream_output = myPump.streaming_mode_get_output()
         pressures.append(stream_output[LVStreamingModeOutputIndexes.PRESSURE])
         powers.append(stream_output[LVStreamingModeOutputIndexes.VOLTAGE] * stream_output[LVStreamingModeOutputIndexes.CURRENT])
-
-        myPump.write_reg(LVRegister.SET_VAL, target_pressure)  # Update target pressure
-        time.sleep(0.05)  # Pause between updates
+    player.stop()   # raises the error if playing the waveform failed
+    print(player.statistics())
 
     # turn the pump off
     myPump.write_reg(LVRegister.PUMP_ENABLE, 0)
@@ -0,0 +1,116 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks the LVI2CBus scheduling against simulated pumps, run with "python -m pytest".
+"""
+
+import threading
+import time
+
+import pytest
+
+from lee_ventus_simulator import *
+
+
+@pytest.fixture
+def device():
+    LVSimulator_remove_all_pumps()
+    for i2c_address in (40, 41, 42):
+        LVSimulator_add_i2c_pump(i2c_address, latency=0.0005)
+    LVSimulator_install()
+    yield LVSimulatedMCP2221()
+    LVSimulator_uninstall()
+    LVSimulator_remove_all_pumps()
+
+
+def serving_order(bus: LVI2CBus, addresses: list[int]) -> list[int]:
+    # holds the bus for address 40 while transactions for the given addresses queue up one after the other, then
+    # returns the order in which the queued transactions got the bus
+    order = []
+    release = threading.Event()
+    holder = threading.Thread(target=bus.transaction, args=(40, lambda device: release.wait(timeout=5)))
+    holder.start()
+    while not bus._busy:
+        time.sleep(0.001)
+
+    threads = []
+    for address in addresses:
+        def transaction(device, address=address):
+            device.I2C_read(address, 4)
+            order.append(address)
+        thread = threading.Thread(target=bus.transaction, args=(address, transaction))
+        thread.start()
+        threads.append(thread)
+        while bus._number_waiting < len(threads):
+            time.sleep(0.001)
+
+    release.set()
+    holder.join()
+    for thread in threads:
+        thread.join()
+    return order
+
+
+def test_round_robin_serves_the_address_that_waited_longest_for_the_bus(device):
+    bus = LVI2CBus(device)
+    assert serving_order(bus, [41, 41, 42, 40]) == [41, 42, 40, 41]
+
+
+def test_priority_serves_the_highest_priority_address_first(device):
+    bus = LVI2CBus(device, policy=LVI2CBus.PRIORITY)
+    bus.set_priority(42, 5)
+    assert serving_order(bus, [41, 41, 42, 40]) == [42, 41, 40, 41]
+
+
+def test_unknown_policy_is_rejected(device):
+    with pytest.raises(ValueError):
+        LVI2CBus(device, policy="fifo")
+
+
+def test_statistics_count_the_transactions_of_each_address(device):
+    bus = LVI2CBus(device)
+    bus.write(41, bytes([LVRegister.PUMP_ENABLE + 128]))
+    assert len(bus.read(41, 2)) == 2
+    assert len(bus.write_then_read(42, bytes([LVRegister.PUMP_ENABLE + 128]), 2)) == 2
+    statistics = bus.statistics()
+    assert statistics["addresses"][41]["transactions"] == 2
+    assert statistics["addresses"][42]["transactions"] == 1
+    assert 0 < statistics["utilization"] <= 1
+    bus.reset_statistics()
+    assert bus.statistics()["addresses"] == {}
+
+
+def test_pumps_on_the_same_adapter_share_the_bus(device):
+    pumps = [LVDiscPump() for _ in range(3)]
+    for pump, i2c_address in zip(pumps, (40, 41, 42)):
+        pump.connect_pump(i2c_address=i2c_address)
+    try:
+        assert pumps[0].i2c_bus is pumps[1].i2c_bus is pumps[2].i2c_bus
+        pumps[0].i2c_bus.reset_statistics()
+
+        def read_many(pump):
+            for _ in range(20):
+                pump.read_register(LVRegister.PUMP_ENABLE)
+        threads = [threading.Thread(target=read_many, args=(pump,)) for pump in pumps]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        addresses = pumps[0].i2c_bus.statistics()["addresses"]
+        assert [addresses[i2c_address]["transactions"] for i2c_address in (40, 41, 42)] == [20, 20, 20]
+    finally:
+        for pump in pumps:
+            pump.disconnect_pump()
@@ -0,0 +1,62 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks the synchronised writes of LVPumpFleet, run with "python -m pytest".
+"""
+
+import numpy as np
+import pytest
+
+from lee_ventus_pump_fleet import *
+from lee_ventus_simulator import *
+
+
+@pytest.fixture
+def fleet():
+    LVSimulator_remove_all_pumps()
+    for index in range(4):
+        LVSimulator_add_uart_pump(f"SIM_FLEET{index}", latency=0.0005)
+    LVSimulator_install()
+    pumps = []
+    for index in range(4):
+        pumps.append(LVDiscPump())
+        pumps[-1].connect_pump(com_port=f"SIM_FLEET{index}")
+    pump_fleet = LVPumpFleet(pumps)
+    yield pump_fleet
+    pump_fleet.close()
+    for pump in pumps:
+        pump.disconnect_pump()
+    LVSimulator_uninstall()
+    LVSimulator_remove_all_pumps()
+
+
+def test_broadcast_skew_is_within_two_milliseconds(fleet):
+    skews = [fleet.broadcast(LVRegister.PUMP_ENABLE, run % 2)["skew_s"] for run in range(20)]
+    assert np.median(skews) < 0.001
+    # the odd run can still be held up by the operating system scheduling another process
+    assert np.percentile(skews, 90) < 0.002
+
+
+def test_broadcast_writes_even_when_the_value_is_cached(fleet):
+    for pump in fleet.pumps:
+        pump.register_cache_enable()
+    fleet.write_reg(LVRegister.SET_VAL, 100, sleep_after=0)
+    for pump in fleet.pumps:
+        pump.instrumentation_enable()
+    fleet.broadcast(LVRegister.SET_VAL, 100)
+    for pump in fleet.pumps:
+        assert [call["calls"] for call in pump.instrumentation_snapshot()["calls"]
+                if call["operation"] == "write_reg"] == [1]
@@ -0,0 +1,54 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks that applying a register profile converges, run with "python -m pytest".
+"""
+
+import pytest
+
+from lee_ventus_simulator import *
+
+
+PROFILE = {LVRegister.PID_PROPORTIONAL_COEFF: 2.5,
+           LVRegister.PID_INTEGRAL_COEFF: 12.345,
+           LVRegister.POWER_LIMIT_MILLIWATTS: 900,
+           LVRegister.CONTROL_MODE: LVControlMode.PID}
+
+
+@pytest.fixture(params=["uart", "i2c"])
+def disc_pump_instance(request):
+    LVSimulator_remove_all_pumps()
+    LVSimulator_add_uart_pump("SIM_PROFILE")
+    LVSimulator_add_i2c_pump(37)
+    LVSimulator_install()
+    pump = LVDiscPump()
+    if request.param == "uart":
+        pump.connect_pump(com_port="SIM_PROFILE")
+    else:
+        pump.connect_pump(i2c_address=37)
+    yield pump
+    pump.disconnect_pump()
+    LVSimulator_uninstall()
+    LVSimulator_remove_all_pumps()
+
+
+def test_apply_register_profile_twice_writes_nothing_the_second_time(disc_pump_instance):
+    first_changes = disc_pump_instance.apply_register_profile(PROFILE)
+    assert set(first_changes) == set(PROFILE)
+    assert disc_pump_instance.apply_register_profile(PROFILE) == {}
+    values = disc_pump_instance.read_registers(list(PROFILE))
+    assert values[LVRegister.PID_PROPORTIONAL_COEFF] == pytest.approx(2.5)
+    assert values[LVRegister.PID_INTEGRAL_COEFF] == pytest.approx(12.345, abs=1e-3)
@@ -0,0 +1,135 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks the reference counting and sharing of the serial port registry, run with "python -m pytest".
+"""
+
+import time
+
+import pytest
+import serial
+
+from lee_ventus_serial_registry import *
+from lee_ventus_simulator import *
+
+
+@pytest.fixture
+def simulated_ports():
+    LVSimulator_remove_all_pumps()
+    LVSimulator_add_uart_pump("SIM_REGISTRY_A")
+    LVSimulator_add_uart_pump("SIM_REGISTRY_B")
+    LVSimulator_install()
+    yield
+    LVSerialRegistry_configure(lazy_connect=False, keep_warm=False, share_ports=False)
+    LVSerialRegistry_close_idle()
+    LVSimulator_uninstall()
+    LVSimulator_remove_all_pumps()
+
+
+def open_function(port_name: str):
+    return lambda: LVSimulatedSerial(port_name, baudrate=115200, timeout=2)
+
+
+def test_the_port_is_closed_when_the_last_handle_is_closed(simulated_ports):
+    LVSerialRegistry_configure(share_ports=True)
+    first = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    second = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    statistics = LVSerialRegistry_statistics()["SIM_REGISTRY_A"]
+    assert (statistics["users"], statistics["opens"], statistics["reuses"]) == (2, 1, 1)
+    serial_port = first._get_port()
+
+    first.close()
+    first.close()   # closing twice releases the port once
+    assert LVSerialRegistry_statistics()["SIM_REGISTRY_A"]["users"] == 1
+    assert serial_port.is_open
+    with pytest.raises(Exception):
+        first.write(b"#R0\r\n")
+
+    second.close()
+    assert "SIM_REGISTRY_A" not in LVSerialRegistry_statistics()
+    assert not serial_port.is_open
+
+
+def test_keep_warm_reuses_the_port_until_close_idle(simulated_ports):
+    LVSerialRegistry_configure(keep_warm=True)
+    LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A")).close()
+    LVSerialRegistry_acquire("SIM_REGISTRY_B", open_function("SIM_REGISTRY_B")).close()
+    handle = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    statistics = LVSerialRegistry_statistics()
+    assert statistics["SIM_REGISTRY_A"]["opens"] == 1
+    assert statistics["SIM_REGISTRY_A"]["reuses"] == 1
+    assert statistics["SIM_REGISTRY_B"]["is_open"]
+
+    # only the port without users is closed
+    assert LVSerialRegistry_close_idle() == 1
+    assert list(LVSerialRegistry_statistics()) == ["SIM_REGISTRY_A"]
+    handle.close()
+    assert LVSerialRegistry_statistics()["SIM_REGISTRY_A"]["is_open"]
+
+
+def test_a_port_in_use_is_only_shared_when_enabled(simulated_ports):
+    handle = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    with pytest.raises(Exception, match="already in use"):
+        LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    # a port opened without sharing stays exclusive even once sharing is enabled
+    LVSerialRegistry_configure(share_ports=True)
+    with pytest.raises(Exception, match="already in use"):
+        LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    assert LVSerialRegistry_statistics()["SIM_REGISTRY_A"]["users"] == 1
+    handle.close()
+
+    first = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    second = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"))
+    assert first.lock is second.lock
+    first.close()
+    second.close()
+
+
+def test_each_handle_waits_for_its_own_timeout(simulated_ports):
+    LVSerialRegistry_configure(share_ports=True)
+    slow = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"), timeout=0.3)
+    fast = LVSerialRegistry_acquire("SIM_REGISTRY_A", open_function("SIM_REGISTRY_A"), timeout=0.05)
+    try:
+        # nothing is sent by the simulated pump without a command, so both reads time out
+        for handle, timeout in ((slow, 0.3), (fast, 0.05), (slow, 0.3)):
+            start_time = time.monotonic()
+            assert handle.readline() == b""
+            elapsed = time.monotonic() - start_time
+            assert timeout <= elapsed < timeout + 0.1
+        assert slow._get_port().timeout == LVSerialPortHandle.READ_POLL_TIME
+
+        # a complete response is returned without waiting for the timeout
+        slow.write(f"#R{LVRegister.PUMP_ENABLE}\r\n".encode())
+        start_time = time.monotonic()
+        assert slow.readline().endswith(b"\n")
+        assert time.monotonic() - start_time < 0.1
+    finally:
+        slow.close()
+        fast.close()
+
+
+def test_failing_to_open_releases_the_port(simulated_ports):
+    with pytest.raises(serial.SerialException):
+        LVSerialRegistry_acquire("SIM_REGISTRY_NONE", open_function("SIM_REGISTRY_NONE"))
+    assert "SIM_REGISTRY_NONE" not in LVSerialRegistry_statistics()
+
+    # connecting lazily only opens the port on first use
+    LVSerialRegistry_configure(lazy_connect=True)
+    handle = LVSerialRegistry_acquire("SIM_REGISTRY_B", open_function("SIM_REGISTRY_B"))
+    assert not handle.is_open
+    handle.write(f"#R{LVRegister.PUMP_ENABLE}\r\n".encode())
+    assert handle.is_open
+    handle.close()
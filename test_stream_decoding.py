@@ -0,0 +1,111 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks the UART and I2C streaming mode decoding, run with "python -m pytest".
+"""
+
+import struct
+
+import numpy as np
+import pytest
+
+from lee_ventus_simulator import *
+from lee_ventus_stream_decoding import *
+
+
+LINE = b"#S1,12.5,0.25,21000,1.5,100.25,2.5,3.75\r\n"
+VALUES = [1, 12.5, 0.25, 21000, 1.5, 100.25, 2.5, 3.75]
+
+
+def test_a_line_split_across_chunks_is_completed_by_the_next_chunk():
+    parser = LVUartStreamParser()
+    for split in range(1, len(LINE)):
+        first = parser.feed(LINE[:split])
+        second = parser.feed(LINE[split:])
+        rows = np.concatenate((first, second))
+        assert rows.tolist() == [VALUES]
+    assert parser.discarded_lines == 0
+
+
+def test_many_lines_in_one_chunk_with_a_partial_line_at_the_end():
+    parser = LVUartStreamParser()
+    rows = parser.feed(LINE * 3 + b"#S0,1.0")
+    assert rows.shape == (3, 8)
+    rows = parser.feed(b",2,3,4,5,6,7\r\n")
+    assert rows.tolist() == [[0, 1, 2, 3, 4, 5, 6, 7]]
+
+
+def test_non_ascii_and_corrupt_lines_are_discarded():
+    parser = LVUartStreamParser()
+    rows = parser.feed(LINE + b"#S1,\xff\xfe,0,0,0,0,0,0\r\n" + LINE)
+    assert rows.tolist() == [VALUES, VALUES]
+    assert parser.discarded_lines == 1
+    # missing field
+    rows = parser.feed(b"#S1,2,3\r\n" + LINE)
+    assert rows.tolist() == [VALUES]
+    assert parser.discarded_lines == 2
+    # all the fields but one of them isn't a number
+    rows = parser.feed(LINE + b"#S1,2,3,x,5,6,7,8\r\n")
+    assert rows.tolist() == [VALUES]
+    assert parser.discarded_lines == 3
+
+
+def test_lines_other_than_streaming_outputs_are_ignored():
+    parser = LVUartStreamParser()
+    rows = parser.feed(b"#R0,23,1\r\n" + LINE + b"#W0,1,1\r\n")
+    assert rows.tolist() == [VALUES]
+    assert parser.discarded_lines == 0
+
+
+def test_reset_discards_the_partial_line():
+    parser = LVUartStreamParser()
+    parser.feed(LINE[:10])
+    parser.reset()
+    rows = parser.feed(LINE[10:] + LINE)
+    assert rows.tolist() == [VALUES]
+
+
+def test_decode_i2c_frames_ignores_a_trailing_incomplete_frame():
+    frame = LV_I2C_STREAM_FRAME.pack(1, 12.5, 0.25, 21000, 1.5, 100.25, 2.5, 3.75) + b"\x00"
+    assert len(frame) == LV_I2C_STREAM_FRAME_SIZE
+    rows = LVStreaming_decode_i2c_frames(frame * 2 + frame[:10])
+    assert rows.tolist() == [VALUES, VALUES]
+
+
+@pytest.fixture
+def uart_pump():
+    LVSimulator_remove_all_pumps()
+    LVSimulator_add_uart_pump("SIM_DECODING")
+    LVSimulator_install()
+    pump = LVDiscPump()
+    pump.connect_pump(com_port="SIM_DECODING")
+    yield pump
+    pump.disconnect_pump()
+    LVSimulator_uninstall()
+    LVSimulator_remove_all_pumps()
+
+
+def test_streaming_mode_get_outputs_from_a_simulated_uart_pump(uart_pump):
+    uart_pump.streaming_mode_enable()
+    try:
+        rows = uart_pump.streaming_mode_get_outputs(timeout=1)
+        assert rows.ndim == 2 and rows.shape[1] == 8 and len(rows) > 0
+        # the register interface still works once the stream has been flushed
+        uart_pump.streaming_mode_disable()
+        uart_pump.write_reg(LVRegister.PUMP_ENABLE, 0)
+        assert uart_pump.read_register(LVRegister.PUMP_ENABLE) == 0
+    finally:
+        uart_pump.streaming_mode_disable()
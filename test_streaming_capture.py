@@ -0,0 +1,115 @@
+"""
+DISCLAIMER
+This Python demo is provided "as is" and without any warranty of any kind, and its use is at your
+own risk. LEE Ventus does not warrant the performance or results that you may obtain by using
+this Python demo. LEE Ventus makes no warranties regarding this Python demo, express
+or implied, including as to non-infringement, merchantability, or fitness for any particular purpose.
+To the maximum extent permitted by law LEE Ventus disclaims liability for any loss or damage
+resulting from use of this Python demo, whether arising under contract, tort (including
+negligence), strict liability, or otherwise, and whether direct, consequential, indirect, or otherwise,
+even if LEE Ventus has been advised of the possibility of such damages, or for any claim from any
+third party.
+
+Lee Ventus python demo
+Date: 18/10/2026
+Python version: 3.10
+
+Checks the LVStreamingCapture ring buffer, run with "python -m pytest".
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from lee_ventus_simulator import *
+from lee_ventus_streaming_capture import *
+
+
+def outputs(first: int, number_outputs: int) -> np.ndarray:
+    # streaming outputs numbered first, first + 1, ... in every field
+    return np.repeat(np.arange(first, first + number_outputs, dtype=np.float64)[:, None],
+                     len(LVStreamingModeOutputIndexes), axis=1)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_extend_wraps_around_the_end_of_the_buffer(dtype):
+    capture = LVStreamingCapture(capacity=5, dtype=dtype)
+    capture.extend(outputs(0, 3), timestamps=[10.0, 11.0, 12.0])
+    capture.extend(outputs(3, 4), timestamps=[13.0, 14.0, 15.0, 16.0])
+    assert capture.total_samples == 7
+    assert capture.overwritten_samples == 2
+    assert list(capture.column(LVStreamingModeOutputIndexes.PRESSURE)) == [2, 3, 4, 5, 6]
+    assert list(capture.column(LVStreamingCapture.TIMESTAMP)) == [12.0, 13.0, 14.0, 15.0, 16.0]
+    assert list(capture.latest(2)[LVStreamingModeOutputIndexes.VOLTAGE]) == [5, 6]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_extend_with_more_outputs_than_the_capacity_keeps_the_newest(dtype):
+    capture = LVStreamingCapture(capacity=4, dtype=dtype)
+    capture.append(outputs(100, 1)[0], timestamp=1.0)
+    capture.extend(outputs(0, 10), timestamps=np.arange(10) + 2.0)
+    assert capture.total_samples == 11
+    assert list(capture.column(LVStreamingModeOutputIndexes.FLOW)) == [6, 7, 8, 9]
+    assert list(capture.column(LVStreamingCapture.TIMESTAMP)) == [8.0, 9.0, 10.0, 11.0]
+    # the ring carries on from the right place after an overfill
+    capture.append(outputs(10, 1)[0], timestamp=12.0)
+    assert list(capture.column(LVStreamingModeOutputIndexes.FLOW)) == [7, 8, 9, 10]
+
+
+def test_timestamps_keep_float64_precision_with_a_float32_buffer():
+    capture = LVStreamingCapture(capacity=10, dtype=np.float32)
+    now = time.time()
+    capture.extend(outputs(0, 3), timestamps=[now, now + 0.001, now + 0.002])
+    timestamps = capture.column(LVStreamingCapture.TIMESTAMP)
+    assert timestamps.dtype == np.float64
+    assert np.allclose(np.diff(timestamps), 0.001, atol=1e-6)
+    assert capture.latest().dtype == np.float64
+    assert capture.column(LVStreamingModeOutputIndexes.PRESSURE).dtype == np.float32
+
+
+def test_extend_spreads_the_timestamps_since_the_previous_sample():
+    capture = LVStreamingCapture(capacity=10)
+    capture.append(outputs(0, 1)[0], timestamp=time.time() - 0.1)
+    capture.extend(outputs(1, 4))
+    timestamps = capture.column(LVStreamingCapture.TIMESTAMP)
+    assert np.all(np.diff(timestamps) > 0)
+    assert np.allclose(np.diff(timestamps), np.diff(timestamps)[0], rtol=1e-3)
+
+
+@pytest.mark.parametrize("connection", ["uart", "i2c"])
+def test_capture_from_a_simulated_pump(connection):
+    LVSimulator_remove_all_pumps()
+    LVSimulator_add_uart_pump("SIM_CAPTURE")
+    LVSimulator_add_i2c_pump(37)
+    LVSimulator_install()
+    pump = LVDiscPump()
+    if connection == "uart":
+        pump.connect_pump(com_port="SIM_CAPTURE")
+    else:
+        pump.connect_pump(i2c_address=37)
+    try:
+        pump.streaming_mode_enable()
+        capture = LVStreamingCapture(capacity=1000, dtype=np.float32)
+        capture.start(pump)
+        time.sleep(0.3)
+        capture.stop()
+        assert capture.total_samples > 0
+        assert np.all(np.diff(capture.column(LVStreamingCapture.TIMESTAMP)) >= 0)
+    finally:
+        pump.streaming_mode_disable()
+        pump.disconnect_pump()
+        LVSimulator_uninstall()
+        LVSimulator_remove_all_pumps()
+
+
+def test_stop_raises_the_error_of_the_capture_thread():
+    class FailingPump:
+        def streaming_mode_get_outputs(self, timeout=1):
+            raise ValueError("failed")
+
+    capture = LVStreamingCapture()
+    capture.start(FailingPump())
+    time.sleep(0.05)
+    with pytest.raises(ValueError):
+        capture.stop()
@@ -20,6 +20,7 @@ Technical Note TN003: Communications Guide
 """
 import time
 from lee_ventus_disc_pump import *
+from lee_ventus_scheduler import *
 
 
 def configure_valves(disc_pump_instance: LVDiscPump):
@@ -126,12 +127,8 @@ if __name__ == '__main__':
     myPump.write_reg(LVRegister.GPIO_C_STATE, 10)                   # Valve 2
 
     # print out the pressure every half second for 25 seconds
-    start_time = float(time.time())
-    current_time = start_time
-    while current_time - start_time < 25:
-        time.sleep(0.5)
-        current_time = float(time.time())
-        print(f'Generating {myPump.read_register(LVRegister.MEAS_DIGITAL_PRESSURE):.1f} mBar')
+    LVPeriodicScheduler(0.5, lambda tick, scheduled_time: print(
+        f'Generating {myPump.read_register(LVRegister.MEAS_DIGITAL_PRESSURE):.1f} mBar')).run(duration=25)
 
     # turn the pump off
     myPump.write_reg(LVRegister.PUMP_ENABLE, 0)
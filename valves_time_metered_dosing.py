@@ -21,6 +21,7 @@ Technical Note TN003: Communications Guide
 
 import time
 from lee_ventus_disc_pump import *
+from lee_ventus_valve_sequencer import *
 
 
 def configure_valves(disc_pump_instance: LVDiscPump):
@@ -83,28 +84,26 @@ if __name__ == '__main__':
     myPump.write_reg(LVRegister.PUMP_ENABLE, 1)
     time.sleep(1)
 
-    print("Generating pulses manually")
-    # set valve on for 50ms then wait for 200ms and repeat
-    myPump.write_reg(LVRegister.GPIO_B_STATE, LVGpioStaticStates.STATIC_ON)     # Valve 1
-    time.sleep(0.05)
-    myPump.write_reg(LVRegister.GPIO_B_STATE, LVGpioStaticStates.STATIC_OFF)    # Valve 1
-    time.sleep(0.2)
-    myPump.write_reg(LVRegister.GPIO_B_STATE, LVGpioStaticStates.STATIC_ON)     # Valve 1
-    time.sleep(0.05)
-    myPump.write_reg(LVRegister.GPIO_B_STATE, LVGpioStaticStates.STATIC_OFF)    # Valve 1
-    time.sleep(0.2)
+    print("Generating pulses from the host")
+    # set valve on for 50ms then wait for 200ms and repeat, with each state written by the host at its deadline
+    sequencer = LVValveSequencer(myPump)
+    sequencer.add_pulses("B", start_time=0, duration=0.05, number_pulses=2, period=0.25,
+                         use_board_pulses=False)    # Valve 1
+    sequencer.run()
+    print(f"Host timing: {sequencer.statistics()}")
 
     # wait before starting the next section of the program
     time.sleep(2)
     print("Generating pulses automatically")
 
     # Automate the droplet generation by generating automatic pulses from the board
-    # The following commands configure the gpio to generate pulses that are 50ms on and 200ms off
-    # in fast mode 1 unit is 10us or 0.01ms
-    myPump.write_reg(LVRegister.GPIO_B_PULSE_DURATION, 50 * 100)    # on time Valve 1
-    myPump.write_reg(LVRegister.GPIO_B_PULSE_PERIOD, 250 * 100)     # on + off time Valve 1
-    # Start a train of 10 pulses on the valve
-    myPump.write_reg(LVRegister.GPIO_B_STATE, 10)                   # Valve 1
+    # The sequencer configures the gpio to generate pulses that are 50ms on and 200ms off
+    # (GPIO_B_PULSE_DURATION and GPIO_B_PULSE_PERIOD, in fast mode 1 unit is 10us or 0.01ms)
+    # and starts a train of 10 pulses on the valve by writing 10 to GPIO_B_STATE
+    sequencer.clear()
+    sequencer.add_pulses("B", start_time=0, duration=0.05, number_pulses=10, period=0.25)    # Valve 1
+    sequencer.run()
+    print(f"Board timing: {sequencer.statistics()}")
 
     # wait for the pulses to complete and turn the pump off
     time.sleep(2.5)